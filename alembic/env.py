@@ -1,2 +1,53 @@
-from src.infrastructure.persistence.models import Base
-target_metadata = Base.metadata 
\ No newline at end of file
+from logging.config import fileConfig
+from alembic import context
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.config import settings
+from src.infrastructure.common.persistence.database import Base
+import src.infrastructure.studentCard.persistence.database  # noqa: F401 (모델 등록)
+import asyncio
+
+config = context.config
+
+if config.config_file_name is not None:
+    fileConfig(config.config_file_name)
+
+target_metadata = Base.metadata
+
+
+def _configure(**kwargs) -> None:
+    context.configure(
+        target_metadata=target_metadata,
+        # SQLite 는 ALTER 지원이 제한적이라 테이블 재생성 방식으로 변경
+        render_as_batch=settings.DATABASE_URL.startswith("sqlite"),
+        compare_type=True,
+        **kwargs,
+    )
+
+
+def run_migrations_offline() -> None:
+    """DB 연결 없이 SQL 스크립트만 출력 (alembic upgrade head --sql)"""
+    _configure(url=settings.DATABASE_URL, literal_binds=True)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def _run_sync_migrations(connection) -> None:
+    _configure(connection=connection)
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+async def run_migrations_online() -> None:
+    engine = create_async_engine(settings.DATABASE_URL)
+    try:
+        async with engine.connect() as connection:
+            await connection.run_sync(_run_sync_migrations)
+            await connection.commit()
+    finally:
+        await engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    asyncio.run(run_migrations_online())
@@ -0,0 +1,55 @@
+"""create student card tables
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 08:56:39.144070
+
+이전에 시작 시 create_all 로 테이블을 만든 DB 는 ``alembic stamp 0001`` 로
+현재 상태를 기록한 뒤 이후 마이그레이션을 적용합니다.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "student_cards",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("student_number", sa.String(), nullable=True),
+        sa.Column("department", sa.String(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_student_cards_id", "student_cards", ["id"])
+    op.create_index(
+        "ix_student_cards_student_number", "student_cards", ["student_number"], unique=True
+    )
+
+    op.create_table(
+        "analysis_cache",
+        sa.Column("image_digest", sa.String(length=64), nullable=False),
+        sa.Column("student_number", sa.String(), nullable=True),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("department", sa.String(), nullable=True),
+        sa.Column("year", sa.Integer(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("image_digest"),
+    )
+    op.create_index("ix_analysis_cache_created_at", "analysis_cache", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analysis_cache_created_at", table_name="analysis_cache")
+    op.drop_table("analysis_cache")
+    op.drop_index("ix_student_cards_student_number", table_name="student_cards")
+    op.drop_index("ix_student_cards_id", table_name="student_cards")
+    op.drop_table("student_cards")
@@ -0,0 +1,29 @@
+"""create analysis locks
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 09:20:11.508311
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_locks",
+        sa.Column("image_digest", sa.String(length=64), nullable=False),
+        sa.Column("owner", sa.String(length=64), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("image_digest"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("analysis_locks")
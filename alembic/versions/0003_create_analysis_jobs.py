@@ -0,0 +1,43 @@
+"""create analysis jobs
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 10:02:47.193550
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analysis_jobs",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("image", sa.LargeBinary(), nullable=True),
+        sa.Column("mime_type", sa.String(length=64), nullable=True),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("error_status", sa.Integer(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("worker_id", sa.String(length=64), nullable=True),
+        sa.Column("lease_expires_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_analysis_jobs_status_created_at", "analysis_jobs", ["status", "created_at"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_analysis_jobs_status_created_at", table_name="analysis_jobs")
+    op.drop_table("analysis_jobs")
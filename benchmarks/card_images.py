@@ -0,0 +1,154 @@
+"""실제 Code128 바코드가 들어간 합성 학생증 이미지 생성기
+
+해상도(긴 변 픽셀), 노이즈 세기, 기울기, JPEG 품질을 바꿔가며 같은 조건의 이미지를
+재현 가능하게(seed 고정) 만들어 바코드/전처리 단계의 성능을 비교할 수 있게 합니다.
+"""
+
+from dataclasses import dataclass
+from typing import List
+import cv2
+import numpy as np
+
+# Code128 심볼 0~106 의 bar/space 폭 (각 6개 모듈 폭, 정지 심볼은 7개)
+_PATTERNS = (
+    "212222 222122 222221 121223 121322 131222 122213 122312 132212 221213 "
+    "221312 231212 112232 122132 122231 113222 123122 123221 223211 221132 "
+    "221231 213212 223112 312131 311222 321122 321221 312212 322112 322211 "
+    "212123 212321 232121 111323 131123 131321 112313 132113 132311 211313 "
+    "231113 231311 112133 112331 132131 113123 113321 133121 313121 211331 "
+    "231131 213113 213311 213131 311123 311321 331121 312113 312311 332111 "
+    "314111 221411 431111 111224 111422 121124 121421 141122 141221 112214 "
+    "112412 122114 122411 142112 142211 241211 221114 413111 241112 134111 "
+    "111242 121142 121241 114212 124112 124211 411212 421112 421211 212141 "
+    "214121 412121 111143 111341 131141 114113 114311 411113 411311 113141 "
+    "114131 311141 411131 211412 211214 211232 2331112"
+).split()
+
+_START_B = 104
+_START_C = 105
+_STOP = 106
+
+DEPARTMENTS = ("Computer Science", "Mechanical Eng.", "Business", "Nursing")
+
+
+def code128_modules(data: str) -> List[int]:
+    """데이터를 Code128 모듈 폭 목록(bar, space 교대로)으로 인코딩
+
+    짝수 길이의 숫자열은 code set C, 그 외 ASCII 는 code set B 를 사용합니다.
+    """
+    if data.isdigit() and len(data) % 2 == 0:
+        codes = [_START_C] + [int(data[i : i + 2]) for i in range(0, len(data), 2)]
+    else:
+        codes = [_START_B] + [ord(char) - 32 for char in data]
+        if any(code < 0 or code > 94 for code in codes[1:]):
+            raise ValueError(f"Code128 B 로 인코딩할 수 없는 문자가 있습니다: {data}")
+
+    checksum = (codes[0] + sum(i * code for i, code in enumerate(codes[1:], 1))) % 103
+    codes += [checksum, _STOP]
+    return [int(width) for code in codes for width in _PATTERNS[code]]
+
+
+def render_barcode(data: str, module_px: int = 3, height_px: int = 120) -> np.ndarray:
+    """양쪽 quiet zone(10 모듈)을 포함한 grayscale 바코드 이미지"""
+    modules = code128_modules(data)
+    quiet = 10 * module_px
+    width = sum(modules) * module_px + 2 * quiet
+    image = np.full((height_px, width), 255, np.uint8)
+
+    x = quiet
+    for index, width_modules in enumerate(modules):
+        span = width_modules * module_px
+        if index % 2 == 0:  # bar
+            image[:, x : x + span] = 0
+        x += span
+    return image
+
+
+@dataclass
+class CardSpec:
+    """합성 학생증 한 장의 생성 조건"""
+
+    student_number: str
+    resolution: int = 2000  # 결과 이미지의 긴 변 (px)
+    noise: float = 0.0  # 가우시안 노이즈 표준편차 (0~255 기준)
+    rotation: float = 0.0  # 도 단위 기울기
+    quality: int = 90  # JPEG 품질
+    seed: int = 0
+
+
+def render_card(spec: CardSpec) -> bytes:
+    """학생증 사진처럼 배경 위에 놓인 카드를 JPEG 바이트로 생성"""
+    rng = np.random.default_rng(spec.seed)
+
+    # ISO ID-1 비율(85.6 x 54mm)의 카드
+    card = np.full((540, 856, 3), 250, np.uint8)
+    cv2.rectangle(card, (0, 0), (855, 90), (120, 60, 20), -1)
+    cv2.putText(card, "STUDENT ID CARD", (30, 60), cv2.FONT_HERSHEY_SIMPLEX, 1.4, (255, 255, 255), 3)
+    cv2.rectangle(card, (30, 120), (230, 360), (180, 180, 180), -1)  # 사진 자리
+
+    department = DEPARTMENTS[int(rng.integers(len(DEPARTMENTS)))]
+    lines = (
+        f"Name: Student {spec.student_number[-4:]}",
+        f"Dept: {department}",
+        f"Year: {int(rng.integers(1, 5))}",
+        f"No: {spec.student_number}",
+    )
+    for offset, line in enumerate(lines):
+        cv2.putText(card, line, (260, 160 + offset * 55), cv2.FONT_HERSHEY_SIMPLEX, 1.0, (20, 20, 20), 2)
+
+    barcode = render_barcode(spec.student_number, module_px=3, height_px=100)
+    scale = min(1.0, 790 / barcode.shape[1])
+    barcode = cv2.resize(barcode, None, fx=scale, fy=1.0, interpolation=cv2.INTER_NEAREST)
+    top, left = 410, (856 - barcode.shape[1]) // 2
+    card[top : top + barcode.shape[0], left : left + barcode.shape[1]] = barcode[..., None]
+
+    # 책상 위에 놓인 카드를 찍은 것처럼 배경에 배치 (카드가 화면의 약 70%)
+    canvas_w = spec.resolution
+    canvas_h = int(spec.resolution * 0.75)
+    canvas = np.empty((canvas_h, canvas_w, 3), np.uint8)
+    canvas[:] = rng.integers(90, 160, 3, dtype=np.uint8)
+
+    card_w = int(canvas_w * 0.7)
+    card = cv2.resize(card, (card_w, int(card_w * 540 / 856)), interpolation=cv2.INTER_AREA)
+    y = (canvas_h - card.shape[0]) // 2
+    x = (canvas_w - card.shape[1]) // 2
+    canvas[y : y + card.shape[0], x : x + card.shape[1]] = card
+
+    if spec.rotation:
+        matrix = cv2.getRotationMatrix2D((canvas_w / 2, canvas_h / 2), spec.rotation, 1.0)
+        canvas = cv2.warpAffine(canvas, matrix, (canvas_w, canvas_h), borderMode=cv2.BORDER_REPLICATE)
+
+    if spec.noise > 0:
+        noise = rng.normal(0, spec.noise, canvas.shape)
+        canvas = np.clip(canvas.astype(np.float32) + noise, 0, 255).astype(np.uint8)
+
+    ok, encoded = cv2.imencode(".jpg", canvas, [cv2.IMWRITE_JPEG_QUALITY, spec.quality])
+    if not ok:
+        raise ValueError("이미지 인코딩에 실패했습니다")
+    return encoded.tobytes()
+
+
+def student_number(index: int, seed: int = 0) -> str:
+    """재현 가능한 8자리 학번 (2020~2025 입학년도 + 일련번호)"""
+    return f"{2020 + (index + seed) % 6}{(index * 7919 + seed) % 10000:04d}"
+
+
+def generate_cards(
+    count: int,
+    resolution: int = 2000,
+    noise: float = 0.0,
+    rotation: float = 0.0,
+    quality: int = 90,
+    seed: int = 0,
+) -> List[CardSpec]:
+    return [
+        CardSpec(
+            student_number=student_number(index, seed),
+            resolution=resolution,
+            noise=noise,
+            rotation=rotation,
+            quality=quality,
+            seed=seed * 100003 + index,
+        )
+        for index in range(count)
+    ]
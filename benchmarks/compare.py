@@ -0,0 +1,59 @@
+"""두 벤치마크 결과(JSON)의 p50/p95/p99 비교
+
+    python -m benchmarks.compare benchmarks/results/load_test-A.json benchmarks/results/load_test-B.json
+"""
+
+from typing import Dict, Iterator, Tuple
+import argparse
+import json
+import sys
+
+METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def _flatten(node, prefix: str = "") -> Iterator[Tuple[str, Dict]]:
+    """요약 통계(``p50_ms`` 를 가진 dict)를 ``경로 -> 통계`` 로 펼침"""
+    if not isinstance(node, dict):
+        return
+    if "p50_ms" in node:
+        yield prefix, node
+        return
+    for key, value in node.items():
+        yield from _flatten(value, f"{prefix}.{key}" if prefix else key)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 결과 비교")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as source:
+        baseline = json.load(source)
+    with open(args.candidate, encoding="utf-8") as source:
+        candidate = json.load(source)
+
+    print(f"baseline:  {baseline.get('git_commit')} {baseline.get('created_at')}")
+    print(f"candidate: {candidate.get('git_commit')} {candidate.get('created_at')}")
+    for key in ("throughput_rps",):
+        if key in baseline["results"] and key in candidate["results"]:
+            print(f"{key}: {baseline['results'][key]} -> {candidate['results'][key]}")
+
+    before = dict(_flatten(baseline["results"]))
+    after = dict(_flatten(candidate["results"]))
+    print(f"{'metric':<60}" + "".join(f"{name:>22}" for name in METRICS))
+    for path in sorted(before.keys() & after.keys()):
+        cells = []
+        for name in METRICS:
+            old, new = before[path].get(name), after[path].get(name)
+            if not old or new is None:
+                cells.append(f"{'-':>22}")
+                continue
+            change = (new - old) / old * 100
+            cells.append(f"{old:>9.1f}->{new:>7.1f} {change:+5.0f}%")
+        print(f"{path:<60}" + "".join(cells))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
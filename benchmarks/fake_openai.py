@@ -0,0 +1,185 @@
+"""OpenAI chat/embeddings API 를 흉내 내는 로컬 서버
+
+지연 시간(평균/편차)과 실패율을 조절할 수 있어 네트워크나 API 비용 없이 분석
+파이프라인의 부하 특성을 재현합니다. 서비스는 ``OPENAI_BASE_URL`` 을
+``http://<host>:<port>/v1`` 로 설정하면 이 서버를 사용합니다.
+
+    python -m benchmarks.fake_openai --port 8900 --latency 1.5 --failure-rate 0.02
+"""
+
+from dataclasses import asdict, dataclass
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+import argparse
+import asyncio
+import hashlib
+import json
+import random
+import time
+import uuid
+
+NAMES = ("김민준", "이서연", "박지호", "최하은", "정도윤", "강서준")
+DEPARTMENTS = ("컴퓨터공학과", "기계공학과", "경영학과", "간호학과", "전자공학과")
+
+
+@dataclass
+class FakeOpenAIConfig:
+    latency: float = 1.5  # chat 응답 평균 지연 (초)
+    jitter: float = 0.3  # 지연 표준편차 (초)
+    failure_rate: float = 0.0  # 0~1, 실패 응답 비율
+    failure_status: int = 500  # 실패 시 상태 코드 (429 면 rate limit 흉내)
+    embedding_latency: float = 0.1
+    embedding_dim: int = 1536
+    seed: int = 0
+
+
+def create_app(config: FakeOpenAIConfig) -> FastAPI:
+    app = FastAPI(title="Fake OpenAI")
+    rng = random.Random(config.seed)
+    stats = {"chat_requests": 0, "chat_failures": 0, "embedding_requests": 0}
+
+    async def delay(mean: float) -> None:
+        seconds = max(0.0, rng.gauss(mean, config.jitter if mean else 0.0))
+        if seconds:
+            await asyncio.sleep(seconds)
+
+    def failure():
+        return JSONResponse(
+            status_code=config.failure_status,
+            content={
+                "error": {
+                    "message": "Injected failure from fake OpenAI server",
+                    "type": "server_error",
+                }
+            },
+        )
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        stats["chat_requests"] += 1
+        await delay(config.latency)
+        if rng.random() < config.failure_rate:
+            stats["chat_failures"] += 1
+            return failure()
+
+        content = json.dumps(
+            {
+                "name": rng.choice(NAMES),
+                "department": rng.choice(DEPARTMENTS),
+                "year": rng.randint(1, 4),
+                "student_number": "",
+            },
+            ensure_ascii=False,
+        )
+        prompt_tokens = _estimate_prompt_tokens(body.get("messages", []))
+        completion_tokens = max(1, len(content) // 3)
+        return {
+            "id": f"chatcmpl-{uuid.uuid4().hex}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "gpt-4o"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    @app.post("/v1/embeddings")
+    async def embeddings(request: Request):
+        body = await request.json()
+        stats["embedding_requests"] += 1
+        await delay(config.embedding_latency)
+        inputs = body.get("input", [])
+        if not isinstance(inputs, list) or (inputs and isinstance(inputs[0], int)):
+            inputs = [inputs]
+        return {
+            "object": "list",
+            "data": [
+                {
+                    "object": "embedding",
+                    "index": index,
+                    "embedding": _embedding(item, config.embedding_dim),
+                }
+                for index, item in enumerate(inputs)
+            ],
+            "model": body.get("model", "text-embedding-ada-002"),
+            "usage": {"prompt_tokens": len(inputs), "total_tokens": len(inputs)},
+        }
+
+    @app.get("/v1/models")
+    async def models():
+        return {"object": "list", "data": [{"id": "gpt-4o", "object": "model"}]}
+
+    @app.get("/stats")
+    async def get_stats():
+        return {**stats, "config": asdict(config)}
+
+    return app
+
+
+def _estimate_prompt_tokens(messages) -> int:
+    """텍스트는 3글자당 1토큰, 이미지는 고해상도 타일 기준 고정 765토큰으로 근사"""
+    tokens = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            tokens += len(content) // 3
+            continue
+        for part in content or []:
+            if part.get("type") == "image_url":
+                tokens += 765
+            else:
+                tokens += len(part.get("text", "")) // 3
+    return max(1, tokens)
+
+
+def _embedding(item, dim: int):
+    """입력마다 항상 같은 단위 벡터 (내용 해시 기반)"""
+    seed = int.from_bytes(hashlib.sha256(repr(item).encode("utf-8")).digest()[:8], "big")
+    rng = random.Random(seed)
+    vector = [rng.uniform(-1, 1) for _ in range(dim)]
+    norm = sum(value * value for value in vector) ** 0.5 or 1.0
+    return [value / norm for value in vector]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    defaults = FakeOpenAIConfig()
+    parser.add_argument("--latency", type=float, default=defaults.latency)
+    parser.add_argument("--jitter", type=float, default=defaults.jitter)
+    parser.add_argument("--failure-rate", type=float, default=defaults.failure_rate)
+    parser.add_argument("--failure-status", type=int, default=defaults.failure_status)
+    parser.add_argument("--embedding-latency", type=float, default=defaults.embedding_latency)
+    parser.add_argument("--embedding-dim", type=int, default=defaults.embedding_dim)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    return parser.parse_args(argv)
+
+
+def config_from_args(args) -> FakeOpenAIConfig:
+    return FakeOpenAIConfig(
+        latency=args.latency,
+        jitter=args.jitter,
+        failure_rate=args.failure_rate,
+        failure_status=args.failure_status,
+        embedding_latency=args.embedding_latency,
+        embedding_dim=args.embedding_dim,
+        seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    args = parse_args()
+    uvicorn.run(create_app(config_from_args(args)), host=args.host, port=args.port)
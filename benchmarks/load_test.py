@@ -0,0 +1,305 @@
+"""``src.main:app`` 에 합성 학생증 이미지를 일정 동시성으로 보내는 부하 테스트
+
+기본 모드는 외부 의존성 없이 한 프로세스 안에서 실행됩니다.
+
+- OpenAI 대신 ``benchmarks.fake_openai`` 서버를 백그라운드 스레드로 띄움
+- DB 는 임시 디렉터리의 SQLite(aiosqlite) 파일 (``--database-url`` 로 로컬 Postgres 지정 가능)
+- 앱은 httpx ASGITransport 로 직접 호출
+
+``--url`` 을 주면 이미 떠 있는 서버(예: uvicorn 워커 여러 개)에 HTTP 로 요청합니다.
+처리량, 전체 지연 p50/p95/p99 와 ``Server-Timing`` 헤더 기반 단계별 지연을 출력하고
+JSON 으로 저장합니다. 부하를 걸기 전에 ``/ready`` 를 기다려 time-to-ready 도 함께 기록합니다.
+
+    python -m benchmarks.load_test --requests 200 --concurrency 8 --resolution 3000
+"""
+
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.card_images import generate_cards, render_card
+from benchmarks.fake_openai import FakeOpenAIConfig, create_app as create_fake_openai
+from benchmarks.results import save_results, summarize
+
+ANALYZE_PATH = "/api/v1/student-card/analyze"
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="학생증 분석 API 부하 테스트")
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=5, help="통계에서 제외할 초기 요청 수")
+    parser.add_argument("--resolution", type=int, default=2000, help="이미지 긴 변(px)")
+    parser.add_argument("--noise", type=float, default=6.0)
+    parser.add_argument("--rotation", type=float, default=0.0)
+    parser.add_argument("--quality", type=int, default=90)
+    parser.add_argument(
+        "--repeat-ratio",
+        type=float,
+        default=0.0,
+        help="이미 보낸 이미지를 다시 보내는 비율 (캐시 적중 시나리오)",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="외부 서버 주소 (예: http://127.0.0.1:8001)")
+    parser.add_argument("--database-url", help="기본값은 임시 SQLite 파일")
+    parser.add_argument("--llm-latency", type=float, default=1.5)
+    parser.add_argument("--llm-jitter", type=float, default=0.3)
+    parser.add_argument("--llm-failure-rate", type=float, default=0.0)
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="앱 설정 덮어쓰기 (예: --env max_parallel_requests=8)",
+    )
+    parser.add_argument("--output", default="benchmarks/results")
+    return parser.parse_args(argv)
+
+
+class _ServerThread:
+    """uvicorn 서버를 별도 스레드/이벤트 루프에서 실행"""
+
+    def __init__(self, app, port: int):
+        import uvicorn
+
+        self.server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning")
+        )
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+
+    def start(self) -> None:
+        self.thread.start()
+        while not self.server.started:
+            time.sleep(0.01)
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.thread.join()
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _prepare_images(args, workdir: str) -> List[str]:
+    """요청 순서대로 보낼 이미지 파일 경로 (반복 비율만큼 앞선 이미지를 재사용)"""
+    total = args.requests + args.warmup
+    unique = max(1, total - int(args.requests * args.repeat_ratio))
+    specs = generate_cards(
+        unique,
+        resolution=args.resolution,
+        noise=args.noise,
+        rotation=args.rotation,
+        quality=args.quality,
+        seed=args.seed,
+    )
+    paths = []
+    for index, spec in enumerate(specs):
+        path = os.path.join(workdir, f"card-{index}.jpg")
+        with open(path, "wb") as target:
+            target.write(render_card(spec))
+        paths.append(path)
+
+    order = list(paths)
+    for index in range(total - unique):
+        order.append(paths[(index * 31) % unique])
+    return order[:total]
+
+
+def _parse_server_timing(header: Optional[str]) -> Dict[str, float]:
+    timings = {}
+    for entry in (header or "").split(","):
+        name, _, params = entry.strip().partition(";")
+        if name and params.startswith("dur="):
+            timings[name] = float(params[4:]) / 1000
+    return timings
+
+
+async def _wait_ready(client, timeout: float = 120.0) -> dict:
+    """``/ready`` 가 200 을 줄 때까지 기다리고 대기 시간과 서버의 warm-up 정보를 반환"""
+    started = time.perf_counter()
+    while True:
+        response = await client.get("/ready")
+        if response.status_code == 200:
+            break
+        if time.perf_counter() - started > timeout:
+            raise RuntimeError(f"서버가 {timeout}초 안에 준비되지 않았습니다: {response.text}")
+        await asyncio.sleep(0.05)
+    return {"waited_s": round(time.perf_counter() - started, 3), **response.json()}
+
+
+async def _drive(client, image_paths: List[str], concurrency: int, warmup: int) -> dict:
+    queue: asyncio.Queue = asyncio.Queue()
+    for index, path in enumerate(image_paths):
+        queue.put_nowait((index, path))
+
+    latencies: List[float] = []
+    success_latencies: List[float] = []
+    stages: Dict[str, List[float]] = defaultdict(list)
+    statuses: Counter = Counter()
+    sources: Counter = Counter()
+    peak_memory: List[int] = []
+    measured = {"started": None, "finished": None}
+
+    async def worker():
+        while not queue.empty():
+            index, path = queue.get_nowait()
+            with open(path, "rb") as source:
+                data = source.read()
+
+            if index == warmup and measured["started"] is None:
+                measured["started"] = time.perf_counter()
+            started = time.perf_counter()
+            response = await client.post(
+                ANALYZE_PATH, files={"image": (os.path.basename(path), data, "image/jpeg")}
+            )
+            elapsed = time.perf_counter() - started
+            if index < warmup:
+                continue
+
+            measured["finished"] = time.perf_counter()
+            latencies.append(elapsed)
+            statuses[str(response.status_code)] += 1
+            for stage, seconds in _parse_server_timing(
+                response.headers.get("server-timing")
+            ).items():
+                stages[stage].append(seconds)
+            if response.headers.get("x-request-peak-memory"):
+                peak_memory.append(int(response.headers["x-request-peak-memory"]))
+            if response.status_code == 200:
+                success_latencies.append(elapsed)
+                sources[response.json()["data"].get("source", "")] += 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    duration = (measured["finished"] or 0) - (measured["started"] or 0)
+    return {
+        "requests": len(latencies),
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(len(success_latencies) / duration, 3) if duration > 0 else 0,
+        "status_counts": dict(statuses),
+        "sources": dict(sources),
+        "latency": summarize(latencies),
+        "latency_success": summarize(success_latencies),
+        "stages": {stage: summarize(values) for stage, values in sorted(stages.items())},
+        "peak_memory_bytes": {
+            "max": max(peak_memory, default=0),
+            "p95": sorted(peak_memory)[int(len(peak_memory) * 0.95)] if peak_memory else 0,
+        },
+    }
+
+
+async def _run_in_process(args, image_paths: List[str], workdir: str) -> dict:
+    import httpx
+
+    fake_config = FakeOpenAIConfig(
+        latency=args.llm_latency,
+        jitter=args.llm_jitter,
+        failure_rate=args.llm_failure_rate,
+        seed=args.seed,
+    )
+    fake_port = _free_port()
+    fake_server = _ServerThread(create_fake_openai(fake_config), fake_port)
+    fake_server.start()
+
+    os.environ.update(
+        {
+            "DATABASE_URL": args.database_url
+            or f"sqlite+aiosqlite:///{os.path.join(workdir, 'bench.db')}",
+            "OPENAI_API_KEY": "sk-benchmark",
+            "OPENAI_BASE_URL": f"http://127.0.0.1:{fake_port}/v1",
+            "PERSIST_DIRECTORY": os.path.join(workdir, "vector_db"),
+            "DEBUG": "false",
+            "RELOAD": "false",
+        }
+    )
+    for override in args.env:
+        key, _, value = override.partition("=")
+        os.environ[key] = value
+
+    # 환경 변수를 반영한 뒤에 앱을 import
+    from src.main import app
+    from src.infrastructure.common.persistence.database import Base, engine
+    import src.infrastructure.studentCard.persistence.database  # noqa: F401 (모델 등록)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        async with app.router.lifespan_context(app):
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark", timeout=None
+            ) as client:
+                startup = await _wait_ready(client)
+                results = await _drive(client, image_paths, args.concurrency, args.warmup)
+                results["startup"] = startup
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{fake_port}") as client:
+            results["fake_openai"] = (await client.get("/stats")).json()
+        return results
+    finally:
+        fake_server.stop()
+
+
+async def _run_remote(args, image_paths: List[str]) -> dict:
+    import httpx
+
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.url, timeout=None, limits=limits) as client:
+        startup = await _wait_ready(client)
+        results = await _drive(client, image_paths, args.concurrency, args.warmup)
+        results["startup"] = startup
+        return results
+
+
+def _print_summary(results: dict) -> None:
+    print(
+        f"requests={results['requests']} duration={results['duration_s']}s "
+        f"throughput={results['throughput_rps']} req/s status={results['status_counts']} "
+        f"sources={results['sources']}"
+    )
+    startup = results.get("startup") or {}
+    if startup.get("ready_seconds") is not None:
+        print(
+            f"time_to_ready={startup['ready_seconds']:.3f}s "
+            f"(import={startup['import_seconds']:.3f}s, steps={startup['steps']})"
+        )
+    print(f"{'stage':<16}{'count':>7}{'p50 ms':>11}{'p95 ms':>11}{'p99 ms':>11}")
+    rows = [("request", results["latency"])] + list(results["stages"].items())
+    for name, stats in rows:
+        if not stats.get("count"):
+            continue
+        print(
+            f"{name:<16}{stats['count']:>7}{stats['p50_ms']:>11.1f}"
+            f"{stats['p95_ms']:>11.1f}{stats['p99_ms']:>11.1f}"
+        )
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="student-card-bench-") as workdir:
+        print(f"합성 이미지 생성 중 ({args.requests + args.warmup}장, {args.resolution}px)")
+        image_paths = _prepare_images(args, workdir)
+        if args.url:
+            results = asyncio.run(_run_remote(args, image_paths))
+        else:
+            results = asyncio.run(_run_in_process(args, image_paths, workdir))
+
+    _print_summary(results)
+    config = {key: value for key, value in vars(args).items() if key != "output"}
+    path = save_results(args.output, "load_test", config, results)
+    print(f"결과 저장: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
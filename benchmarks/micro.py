@@ -0,0 +1,217 @@
+"""분석 파이프라인 개별 구성 요소 마이크로 벤치마크
+
+- ``BarcodeReader.scan``: 해상도/노이즈 조합별 지연, 인식률, 단계별 인식 횟수
+- ``CustomVectorStoreMemory.load_memory_variables``: few-shot 사례 조회
+- ``SQLAlchemyStudentRepository.save``: 신규 insert 와 기존 학번 update (SQLite 또는 ``--database-url``)
+
+    python -m benchmarks.micro --iterations 50
+"""
+
+from collections import Counter
+from typing import Awaitable, Callable, List
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.card_images import generate_cards, render_card
+from benchmarks.results import save_results, summarize
+
+BARCODE_CASES = ((1024, 0.0), (2048, 0.0), (2048, 12.0), (4000, 0.0), (4000, 12.0))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="학생증 분석 마이크로 벤치마크")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument(
+        "--only",
+        choices=("barcode", "memory", "repository"),
+        action="append",
+        help="지정한 벤치마크만 실행 (여러 번 지정 가능)",
+    )
+    parser.add_argument("--database-url", help="기본값은 임시 SQLite 파일")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="benchmarks/results")
+    return parser.parse_args(argv)
+
+
+async def _measure(
+    call: Callable[[int], Awaitable[object]], iterations: int, warmup: int
+) -> List[float]:
+    for index in range(warmup):
+        await call(index)
+    samples = []
+    for index in range(iterations):
+        started = time.perf_counter()
+        await call(warmup + index)
+        samples.append(time.perf_counter() - started)
+    return samples
+
+
+async def bench_barcode(args) -> dict:
+    from src.infrastructure.studentCard.external.barcode_reader import BarcodeReader
+
+    reader = BarcodeReader()
+    results = {}
+    for resolution, noise in BARCODE_CASES:
+        specs = generate_cards(args.iterations, resolution, noise, seed=args.seed)
+        images = [render_card(spec) for spec in specs]
+        decoded = []
+        strategies = []
+
+        async def call(index: int):
+            spec, image = specs[index % len(specs)], images[index % len(images)]
+            result = await reader.scan(image)
+            decoded.append(result.data == spec.student_number)
+            strategies.append(result.strategy or "failed")
+
+        samples = await _measure(call, args.iterations, args.warmup)
+        results[f"{resolution}px_noise{noise:g}"] = {
+            **summarize(samples),
+            "decode_rate": round(sum(decoded[args.warmup :]) / max(1, args.iterations), 3),
+            # 어느 단계에서 인식됐는지 (full_resolution 은 마지막 단계)
+            "strategies": dict(Counter(strategies[args.warmup :])),
+            "image_bytes": sum(map(len, images)) // len(images),
+        }
+    return results
+
+
+async def bench_memory(args, workdir: str) -> dict:
+    from langchain_community.embeddings import FakeEmbeddings
+    from langchain_community.vectorstores import Chroma
+    from src.domain.studentCard.dto.schemas import StudentCardInfo
+    from src.infrastructure.studentCard.external.few_shot_examples import (
+        FewShotExampleStore,
+    )
+    from src.infrastructure.studentCard.external.gpt_vision_reader import (
+        CustomVectorStoreMemory,
+    )
+    from src.config import settings
+
+    vectorstore = Chroma(
+        collection_name="benchmark",
+        embedding_function=FakeEmbeddings(size=64),
+        persist_directory=os.path.join(workdir, "vector_db"),
+    )
+    examples = FewShotExampleStore(max_examples=settings.few_shot_max_examples)
+    memory = CustomVectorStoreMemory(vectorstore=vectorstore, examples=examples)
+    departments = ("컴퓨터공학과", "기계공학과", "경영학과", "간호학과")
+
+    results = {}
+
+    # 사례가 바뀌지 않는 일반적인 경우 (렌더링 결과 재사용)
+    for index, department in enumerate(departments):
+        memory.save_context(
+            {},
+            {
+                "analysis_result": StudentCardInfo(
+                    name="홍길동", department=department, year=index % 4 + 1
+                )
+            },
+        )
+
+    async def steady(index: int):
+        await memory.load_memory_variables({})
+
+    results["steady"] = summarize(await _measure(steady, args.iterations * 10, args.warmup))
+
+    # 매 요청 사이에 새 분석 결과가 저장되는 경우 (매번 다시 렌더링)
+    async def updating(index: int):
+        memory.save_context(
+            {},
+            {
+                "analysis_result": StudentCardInfo(
+                    name="홍길동", department=departments[index % len(departments)], year=1
+                )
+            },
+        )
+        await memory.load_memory_variables({})
+
+    results["after_update"] = summarize(
+        await _measure(updating, args.iterations * 10, args.warmup)
+    )
+    return results
+
+
+async def bench_repository(args) -> dict:
+    from src.infrastructure.common.persistence.database import (
+        AsyncSessionLocal,
+        Base,
+        engine,
+    )
+    from src.domain.studentCard.entity.student import Student
+    from src.domain.studentCard.repository.repositories import (
+        SQLAlchemyStudentRepository,
+    )
+    import src.infrastructure.studentCard.persistence.database  # noqa: F401 (모델 등록)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    results = {}
+    try:
+        for name, number in (
+            ("insert", lambda index: f"9{args.seed:02d}{index:05d}"),
+            ("update", lambda index: f"9{args.seed:02d}{index % 10:05d}"),
+        ):
+
+            async def call(index: int):
+                async with AsyncSessionLocal() as session:
+                    await SQLAlchemyStudentRepository(session).save(
+                        Student.create(number(index), "컴퓨터공학과", index % 4 + 1)
+                    )
+
+            results[name] = summarize(await _measure(call, args.iterations, args.warmup))
+    finally:
+        await engine.dispose()
+    return results
+
+
+async def _run(args, workdir: str) -> dict:
+    selected = set(args.only or ("barcode", "memory", "repository"))
+    results = {}
+    if "barcode" in selected:
+        results["barcode_reader.scan"] = await bench_barcode(args)
+    if "memory" in selected:
+        results["vector_store_memory.load_memory_variables"] = await bench_memory(args, workdir)
+    if "repository" in selected:
+        results["student_repository.save"] = await bench_repository(args)
+    return results
+
+
+def _print_summary(results: dict) -> None:
+    print(f"{'benchmark':<58}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for group, cases in results.items():
+        for case, stats in cases.items():
+            extra = f"  decode_rate={stats['decode_rate']}" if "decode_rate" in stats else ""
+            if "strategies" in stats:
+                extra += f"  strategies={stats['strategies']}"
+            print(
+                f"{group + ' ' + case:<58}{stats['p50_ms']:>10.3f}"
+                f"{stats['p95_ms']:>10.3f}{stats['p99_ms']:>10.3f}{extra}"
+            )
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory(prefix="student-card-micro-") as workdir:
+        # 환경 변수를 반영한 뒤에 앱 모듈을 import
+        os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+        os.environ["DATABASE_URL"] = args.database_url or (
+            f"sqlite+aiosqlite:///{os.path.join(workdir, 'micro.db')}"
+        )
+        os.environ["DEBUG"] = "false"
+        results = asyncio.run(_run(args, workdir))
+
+    _print_summary(results)
+    config = {key: value for key, value in vars(args).items() if key != "output"}
+    path = save_results(args.output, "micro", config, results)
+    print(f"결과 저장: {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
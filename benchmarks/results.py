@@ -0,0 +1,70 @@
+"""벤치마크 결과 집계와 JSON 저장"""
+
+from datetime import datetime
+from typing import Dict, Iterable
+import json
+import math
+import os
+import platform
+import subprocess
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """선형 보간 백분위수 (``sorted_values`` 는 정렬된 목록)"""
+    if not sorted_values:
+        return math.nan
+    position = (len(sorted_values) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    if lower == upper:
+        return sorted_values[lower]
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarize(seconds: Iterable[float]) -> Dict[str, float]:
+    """초 단위 측정값을 ms 단위 요약 통계로 변환"""
+    values = sorted(value * 1000 for value in seconds)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values), 3),
+        "min_ms": round(values[0], 3),
+        "p50_ms": round(percentile(values, 0.50), 3),
+        "p95_ms": round(percentile(values, 0.95), 3),
+        "p99_ms": round(percentile(values, 0.99), 3),
+        "max_ms": round(values[-1], 3),
+    }
+
+
+def save_results(output_dir: str, name: str, config: dict, results: dict) -> str:
+    """실행 환경 정보와 함께 ``<output_dir>/<name>-<시각>.json`` 으로 저장"""
+    started_at = datetime.now()
+    document = {
+        "benchmark": name,
+        "created_at": started_at.isoformat(timespec="seconds"),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": config,
+        "results": results,
+    }
+    os.makedirs(output_dir, exist_ok=True)
+    path = os.path.join(output_dir, f"{name}-{started_at:%Y%m%d-%H%M%S}.json")
+    with open(path, "w", encoding="utf-8") as target:
+        json.dump(document, target, ensure_ascii=False, indent=2)
+    return path
+
+
+def _git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return ""
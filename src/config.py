@@ -20,19 +20,94 @@ class Settings(BaseSettings):
 
     # OpenAI 설정
     OPENAI_API_KEY: str
+    OPENAI_BASE_URL: Optional[str] = None  # 벤치마크용 로컬 대체 서버 등 (기본은 api.openai.com)
     openai_model: str = "gpt-4o"
     openai_temperature: float = 0
     openai_max_tokens: int = 1000
 
+    # OpenAI HTTP 연결 풀 설정 (프로세스 전체에서 재사용)
+    openai_max_connections: int = 20
+    openai_max_keepalive_connections: int = 10
+    openai_keepalive_expiry: float = 30.0
+
     # Vector DB 설정
     vector_db_path: str = "./vector_db"
     vector_db_collection: str = "student_card_analysis"
     PERSIST_DIRECTORY: str = "./vector_db"
+    few_shot_max_examples: int = 3  # 프롬프트에 넣을 이전 분석 사례 수 (학과별 1개)
+    few_shot_seed_limit: int = 500  # 시작 시 사례 복원에 읽을 최근 문서 수
+    vector_write_queue_size: int = 1000  # write-behind 큐 크기
+    vector_write_batch_size: int = 32
+    vector_write_flush_interval: float = 5.0  # 초
+    vector_write_overflow_policy: str = "drop_oldest"  # drop_oldest | drop_newest
+
+    # 정보 추출 단계 설정 (tiered: 로컬 OCR 후 필요할 때만 GPT-4o, llm: 항상 GPT-4o)
+    ocr_strategy: str = "tiered"
+    local_ocr_executor: str = "process"  # thread | process (작업자마다 모델 1개 로드)
+    local_ocr_workers: int = 1
+    local_ocr_languages: str = "ko,en"
+    local_ocr_model_dir: str = ""  # easyocr 모델 저장 위치 (빈 값이면 ~/.EasyOCR)
+    local_ocr_min_confidence: float = 0.6  # 모든 필드가 이 신뢰도 이상이어야 로컬 결과 사용
+
+    # LLM 호출 재시도/헤지 설정 (재시도는 요청의 남은 처리 기한 안에서만)
+    llm_max_attempts: int = 3  # 일시적인 실패(시간 초과, 429, 5xx, 파싱 실패) 시 최대 시도 횟수
+    llm_retry_base_delay: float = 0.5  # 지수 백오프 첫 대기 시간 상한 (초, full jitter)
+    llm_retry_max_delay: float = 4.0
+    llm_retry_budget_ratio: float = 0.1  # 호출마다 쌓이는 재시도 토큰 (재시도/헤지는 호출 수의 약 10% 까지)
+    llm_retry_budget_max_tokens: float = 10.0  # 쌓아둘 수 있는 최대 토큰 (순간적인 재시도 허용량)
+    llm_hedge_enabled: bool = False  # 응답이 느리면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+    llm_hedge_percentile: float = 0.95  # 최근 호출 소요 시간의 이 분위를 넘기면 헤지
+    llm_hedge_min_delay: float = 1.0  # 헤지 전 최소 대기 시간 (초)
+    llm_latency_window: int = 200  # 분위수 추정에 쓰는 최근 호출 수
+
+    # 이미지 처리 설정 (디코딩, 바코드 인식, 전처리에 공용으로 쓰는 CPU 풀)
+    image_executor: str = "thread"  # thread | process (process 는 작업자가 업로드 바이트를 직접 디코딩)
+    image_workers: int = 2
+    barcode_max_edge: int = 1024  # 첫 단계 바코드 디코딩에 사용할 축소 이미지의 긴 변
+    image_max_edge: int = 1280  # GPT Vision 으로 보내는 이미지의 긴 변
+    image_encode_format: str = "jpeg"  # jpeg | webp
+    image_encode_quality: int = 85
+    image_card_orientation: str = ""  # landscape | portrait (빈 값이면 EXIF 회전만 적용)
+
+    # 분석 파이프라인 설정
+    analyze_pipeline_mode: str = "parallel"  # parallel | barcode_first
+    student_freshness_seconds: int = 604800  # 최근 갱신된 학생은 OCR 생략 (0이면 비활성)
+
+    # 업로드 크기 제한 (초과 시 413, Content-Length 로 본문을 읽기 전에 거절)
+    max_upload_bytes: int = 15 * 1024 * 1024  # 이미지 한 장
+    max_batch_upload_bytes: int = 500 * 1024 * 1024  # 일괄 분석 요청 전체
+    upload_read_chunk_size: int = 1024 * 1024
+
+    # 일괄 분석 설정
+    batch_max_images: int = 500
+    batch_commit_size: int = 20  # 이 개수만큼 모아 한 트랜잭션으로 저장
+
+    # 비동기 작업 모드 (POST /student-card/jobs 로 접수, `python -m src.worker` 가 처리)
+    async_jobs_enabled: bool = False
+    job_worker_concurrency: int = 4  # 워커 프로세스 하나가 동시에 처리하는 작업 수
+    job_poll_interval: float = 0.5  # 워커가 새 작업을 확인하는 간격 (초)
+    job_lease_seconds: int = 120  # 처리 중인 워커가 죽었다고 보고 다시 가져갈 시간 (초)
+    job_max_attempts: int = 3  # 일시적인 오류 시 최대 처리 시도 횟수
+    job_long_poll_max: float = 30.0  # 상태 조회 wait 파라미터 상한 (초)
+    job_status_poll_interval: float = 0.5  # long-poll 중 상태 확인 간격 (초)
 
     # 성능 설정
-    max_parallel_requests: int = 3
-    request_timeout: int = 30
+    max_parallel_requests: int = 3  # 동시에 실행하는 LLM 호출 수
+    max_queued_requests: int = 20  # LLM 슬롯을 기다릴 수 있는 요청 수 (초과 시 503)
+    request_timeout: int = 30  # 요청 하나의 전체 처리 기한 (바코드, OCR, DB 포함)
     cache_ttl: int = 3600
+    metrics_enabled: bool = True  # 단계별 지연/토큰 계측, /metrics 와 Server-Timing 헤더
+    analysis_cache_max_entries: int = 1024  # 메모리 LRU 캐시 최대 항목 수
+
+    # 동일 이미지 동시 요청 합치기 (digest 기준으로 바코드+OCR 을 한 번만 실행)
+    single_flight_enabled: bool = True
+    single_flight_shared_lock: bool = False  # analysis_locks 테이블로 워커 간에도 합침
+    single_flight_lock_ttl: float = 60.0  # 잠금 보유자가 죽었다고 볼 시간 (초)
+    single_flight_poll_interval: float = 0.2  # 다른 워커의 작업 완료 확인 간격 (초)
+
+    # 시작/warm-up 설정 (준비 전 요청은 503, /ready 로 확인)
+    warmup_db_connections: int = 5  # 미리 열어둘 DB 연결 수
+    warmup_retry_interval: float = 5.0  # warm-up 실패 시 재시도 간격 (초)
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,228 @@
+from cachetools import TTLCache
+from concurrent.futures import Executor
+from src.config import settings
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+    SQLAlchemyStudentRepository,
+)
+from src.domain.studentCard.service.analysis_cache_service import (
+    AnalysisCacheService,
+    create_memory_cache,
+)
+from src.domain.studentCard.service.analysis_service import StudentCardAnalysisService
+from src.domain.studentCard.service.barcode_service import BarcodeService
+from src.domain.studentCard.service.ocr_service import OCRService
+from src.infrastructure.common.admission import AdmissionController
+from src.infrastructure.common.executor import create_cpu_executor
+from src.infrastructure.common.persistence.database import AsyncSessionLocal
+from src.infrastructure.common.retry import LatencyTracker, RetryBudget
+from src.infrastructure.common.single_flight import SingleFlight
+from src.infrastructure.studentCard.external.image_preprocessor import (
+    ImagePreprocessor,
+    warm_up_worker,
+)
+from src.infrastructure.studentCard.external.interfaces import (
+    BarcodeReaderInterface,
+    GPTVisionReaderInterface,
+)
+from src.infrastructure.studentCard.persistence.digest_lock import (
+    DatabaseDigestLock,
+)
+from typing import Callable, Optional
+import asyncio
+import importlib.util
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class Container:
+    """프로세스 전체에서 공유하는 컴포넌트 모음
+
+    애플리케이션 warm-up 단계에서 한 번 생성되어 ``app.state.container`` 에 보관되며,
+    라우터의 의존성 함수들은 요청마다 새로 만들지 않고 여기서 꺼내 씁니다.
+    테스트에서는 ``app.dependency_overrides`` 로 개별 의존성을 교체할 수 있습니다.
+
+    OpenCV, pyzbar, langchain, Chroma 같은 무거운 구현체는 ``create()`` 안에서
+    import 하므로 ``src.main`` import 자체는 가볍게 유지됩니다.
+    """
+
+    def __init__(
+        self,
+        ocr_reader: GPTVisionReaderInterface,
+        barcode_reader: BarcodeReaderInterface,
+        image_preprocessor: ImagePreprocessor,
+        analysis_memory_cache: TTLCache,
+        cpu_executor: Executor,
+        admission: AdmissionController,
+        single_flight: Optional[SingleFlight] = None,
+        digest_lock: Optional[DatabaseDigestLock] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self.ocr_reader = ocr_reader
+        self.barcode_reader = barcode_reader
+        self.image_preprocessor = image_preprocessor
+        self.analysis_memory_cache = analysis_memory_cache
+        self.cpu_executor = cpu_executor
+        self.admission = admission
+        self.single_flight = single_flight
+        self.digest_lock = digest_lock
+        self.retry_budget = retry_budget
+        self.session_factory = session_factory
+
+    @classmethod
+    def create(cls) -> "Container":
+        """구현체를 import 하고 생성 (블로킹 작업이므로 스레드에서 호출)"""
+        from src.infrastructure.studentCard.external.barcode_reader import (
+            BarcodeReader,
+        )
+        from src.infrastructure.studentCard.external.gpt_vision_reader import (
+            GPTVisionReader,
+        )
+
+        logger.info("공유 컴포넌트 생성 시작")
+        cpu_executor = create_cpu_executor(
+            settings.image_executor, settings.image_workers
+        )
+        retry_budget = RetryBudget(
+            ratio=settings.llm_retry_budget_ratio,
+            max_tokens=settings.llm_retry_budget_max_tokens,
+        )
+        container = cls(
+            ocr_reader=cls._create_ocr_reader(
+                cls._create_llm_reader(GPTVisionReader(), retry_budget)
+            ),
+            barcode_reader=BarcodeReader(
+                executor=cpu_executor, max_edge=settings.barcode_max_edge
+            ),
+            image_preprocessor=ImagePreprocessor(
+                executor=cpu_executor,
+                max_edge=settings.image_max_edge,
+                encode_format=settings.image_encode_format,
+                quality=settings.image_encode_quality,
+                orientation=settings.image_card_orientation,
+            ),
+            analysis_memory_cache=create_memory_cache(
+                settings.analysis_cache_max_entries, settings.cache_ttl
+            ),
+            cpu_executor=cpu_executor,
+            admission=AdmissionController(
+                max_concurrent=settings.max_parallel_requests,
+                max_queued=settings.max_queued_requests,
+            ),
+            single_flight=SingleFlight() if settings.single_flight_enabled else None,
+            digest_lock=(
+                DatabaseDigestLock(
+                    AsyncSessionLocal,
+                    ttl=settings.single_flight_lock_ttl,
+                    poll_interval=settings.single_flight_poll_interval,
+                )
+                if settings.single_flight_enabled and settings.single_flight_shared_lock
+                else None
+            ),
+            retry_budget=retry_budget,
+            session_factory=AsyncSessionLocal,
+        )
+        logger.info("공유 컴포넌트 생성 완료")
+        return container
+
+    @staticmethod
+    def _create_llm_reader(
+        gpt_reader: GPTVisionReaderInterface, retry_budget: RetryBudget
+    ) -> GPTVisionReaderInterface:
+        """GPT-4o 리더에 처리 기한/예산을 고려한 재시도와 헤지 호출을 더함"""
+        from src.infrastructure.studentCard.external.resilient_card_reader import (
+            ResilientCardReader,
+        )
+
+        return ResilientCardReader(
+            gpt_reader,
+            budget=retry_budget,
+            latency=LatencyTracker(window=settings.llm_latency_window),
+            max_attempts=settings.llm_max_attempts,
+            base_delay=settings.llm_retry_base_delay,
+            max_delay=settings.llm_retry_max_delay,
+            hedge_enabled=settings.llm_hedge_enabled,
+            hedge_percentile=settings.llm_hedge_percentile,
+            hedge_min_delay=settings.llm_hedge_min_delay,
+        )
+
+    @staticmethod
+    def _create_ocr_reader(
+        gpt_reader: GPTVisionReaderInterface,
+    ) -> GPTVisionReaderInterface:
+        """``ocr_strategy`` 에 따라 GPT-4o 리더를 그대로 쓰거나 로컬 OCR 단계를 앞에 둠"""
+        if settings.ocr_strategy != "tiered":
+            return gpt_reader
+
+        from src.infrastructure.studentCard.external.local_ocr_reader import (
+            LocalOCRReader,
+            init_worker,
+        )
+        from src.infrastructure.studentCard.external.tiered_card_reader import (
+            TieredCardReader,
+        )
+
+        local_reader = None
+        if importlib.util.find_spec("easyocr") is None:
+            logger.warning("easyocr 가 설치되어 있지 않아 GPT-4o 만 사용합니다")
+        else:
+            languages = tuple(
+                language.strip()
+                for language in settings.local_ocr_languages.split(",")
+                if language.strip()
+            )
+            local_reader = LocalOCRReader(
+                executor=create_cpu_executor(
+                    settings.local_ocr_executor,
+                    settings.local_ocr_workers,
+                    initializer=init_worker,
+                    initargs=(languages, settings.local_ocr_model_dir),
+                    name="local-ocr",
+                ),
+                workers=settings.local_ocr_workers,
+                min_confidence=settings.local_ocr_min_confidence,
+            )
+        return TieredCardReader(local_reader, gpt_reader)
+
+    def analysis_service(self, session: AsyncSession) -> StudentCardAnalysisService:
+        """라우터 밖(작업 워커 등)에서 쓰는 분석 서비스 (의존성 함수와 같은 구성)"""
+        return StudentCardAnalysisService(
+            BarcodeService(self.barcode_reader),
+            OCRService(self.ocr_reader),
+            SQLAlchemyStudentRepository(session),
+            AnalysisCacheService(
+                self.analysis_memory_cache,
+                SQLAlchemyAnalysisCacheRepository(session),
+                settings.cache_ttl,
+            ),
+            self.image_preprocessor,
+            self.admission,
+            mode=settings.analyze_pipeline_mode,
+            freshness_seconds=settings.student_freshness_seconds,
+            single_flight=self.single_flight,
+            digest_lock=self.digest_lock,
+            session_factory=self.session_factory,
+        )
+
+    async def warm_up(self, workers: int) -> None:
+        """CPU 풀 작업자를 미리 띄우고 OCR 모델 로드와 외부 HTTP 연결을 끝내 둠"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self.cpu_executor, warm_up_worker)
+                for _ in range(max(1, workers))
+            )
+        )
+        await self.ocr_reader.warm_up()
+
+    async def aclose(self) -> None:
+        """보유한 클라이언트와 연결 풀 정리"""
+        try:
+            await self.ocr_reader.aclose()
+        except Exception as e:
+            logger.error(f"OCR 리더 종료 중 오류 발생: {str(e)}")
+        self.cpu_executor.shutdown(wait=True, cancel_futures=True)
@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, validator
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 
 class StudentCardInfo(BaseModel):
@@ -7,6 +9,17 @@ class StudentCardInfo(BaseModel):
     year: int = Field(description="학년 (1-4 사이의 숫자)")
     student_number: str = Field(description="학번", default="")
 
+    # 정보를 읽어낸 엔진 (``ocr``: 로컬 OCR, ``llm``: GPT-4o), 스키마와 직렬화에는 포함되지 않음
+    _tier: str = PrivateAttr(default="llm")
+
+    @property
+    def tier(self) -> str:
+        return self._tier
+
+    def mark_tier(self, tier: str) -> "StudentCardInfo":
+        self._tier = tier
+        return self
+
     @validator("name")
     def validate_name(cls, v):
         if not v:
@@ -32,3 +45,71 @@ class StudentCardInfo(BaseModel):
         if not (1 <= v <= 4):
             raise ValueError("학년은 1-4 사이여야 합니다")
         return v
+
+
+class StudentCardAnalysis(BaseModel):
+    """분석 파이프라인 결과
+
+    ``source`` 는 결과를 만든 단계를 나타냅니다.
+    (``cache``: 분석 캐시, ``db``: 기존 학생 정보, ``ocr``: 로컬 OCR 분석,
+    ``llm``: GPT-4o 분석)
+    """
+
+    student_number: str
+    department: str
+    year: int
+    name: str = ""
+    source: str
+    image_digest: str = ""
+    processed_at: datetime = Field(default_factory=datetime.utcnow)
+
+    def response_data(self) -> dict:
+        """API 응답의 ``data`` 필드"""
+        return {
+            "student_number": self.student_number,
+            "department": self.department,
+            "year": self.year,
+            "name": self.name,
+            "processed_at": self.processed_at.isoformat(),
+            "cached": self.source == "cache",
+            "source": self.source,
+        }
+
+
+class AnalysisJobInfo(BaseModel):
+    """비동기 분석 작업 상태 (``result`` 는 성공 시 ``StudentCardAnalysis.response_data()``)"""
+
+    job_id: str
+    status: str
+    attempts: int = 0
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    error_status: Optional[int] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        return self.status in ("succeeded", "failed")
+
+    def response_data(self) -> dict:
+        """API 응답의 ``data`` 필드"""
+        return {
+            "job_id": self.job_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "result": self.result,
+            "error": self.error,
+            "error_status": self.error_status,
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class ClaimedAnalysisJob(BaseModel):
+    """워커가 처리하기 위해 가져온 작업"""
+
+    job_id: str
+    image: bytes
+    mime_type: str = "image/jpeg"
+    attempts: int
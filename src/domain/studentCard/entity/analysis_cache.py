@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlalchemy import Column, Integer, String, DateTime
+from src.infrastructure.common.persistence.database import Base
+
+
+class AnalysisCache(Base):
+    """이미지 SHA-256 다이제스트로 색인한 학생증 분석 결과 (워커 간 공유 캐시)"""
+
+    __tablename__ = "analysis_cache"
+
+    image_digest = Column(String(64), primary_key=True)
+    student_number = Column(String)
+    name = Column(String)
+    department = Column(String)
+    year = Column(Integer)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
@@ -0,0 +1,42 @@
+from datetime import datetime
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+)
+from src.infrastructure.common.persistence.database import Base
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+
+class AnalysisJob(Base):
+    """비동기 분석 작업 (업로드 이미지와 처리 상태/결과)
+
+    이미지는 API 와 워커가 다른 머신에 있어도 읽을 수 있도록 DB 에 보관하며,
+    처리가 끝나면 지웁니다.
+    """
+
+    __tablename__ = "analysis_jobs"
+    __table_args__ = (Index("ix_analysis_jobs_status_created_at", "status", "created_at"),)
+
+    id = Column(String(32), primary_key=True)
+    status = Column(String(16), nullable=False, default=JOB_QUEUED)
+    image = Column(LargeBinary, nullable=True)
+    mime_type = Column(String(64))
+    result = Column(JSON)
+    error = Column(Text)
+    error_status = Column(Integer)  # 동기 API 였다면 응답했을 HTTP 상태 코드
+    attempts = Column(Integer, nullable=False, default=0)
+    worker_id = Column(String(64))
+    lease_expires_at = Column(DateTime)  # running: 임대 만료 시각, queued: 다시 가져갈 수 있는 시각
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime)
+    finished_at = Column(DateTime)
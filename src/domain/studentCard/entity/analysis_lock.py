@@ -0,0 +1,13 @@
+from datetime import datetime
+from sqlalchemy import Column, String, DateTime
+from src.infrastructure.common.persistence.database import Base
+
+
+class AnalysisLock(Base):
+    """uvicorn 워커 간에 같은 이미지의 분석이 한 번만 실행되도록 하는 잠금 행"""
+
+    __tablename__ = "analysis_locks"
+
+    image_digest = Column(String(64), primary_key=True)
+    owner = Column(String(64), nullable=False)
+    acquired_at = Column(DateTime, default=datetime.utcnow, nullable=False)
@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class DomainException(Exception):
     pass
 
@@ -14,5 +17,42 @@ class OCRProcessingException(DomainException):
     pass
 
 
+class OCRRetryableException(OCRProcessingException):
+    """다시 시도하면 성공할 수 있는 OCR(LLM) 호출 실패
+
+    ``reason`` 은 ``timeout``, ``connection``, ``rate_limit``, ``server_error``,
+    ``empty``, ``parse`` 중 하나이며, ``retry_after`` 는 API 가 알려준 대기 시간(초)입니다.
+    """
+
+    def __init__(self, message: str, reason: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class UpstreamServiceException(Exception):
+    """외부 API(LLM)가 서버 설정 문제로 요청을 거절함 (인증, 권한, 모델 이름, 요청 형식 등)
+
+    업로드한 이미지와 관계없는 실패이므로 ``DomainException`` 이 아니며, 다시
+    시도해도 성공하지 않습니다. ``status_code`` 는 외부 API 가 돌려준 상태 코드입니다.
+    """
+
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
 class BarcodeProcessingException(DomainException):
     pass
+
+
+class ImageTooLargeException(DomainException):
+    pass
+
+
+class ServiceOverloadedException(DomainException):
+    """처리 대기열이 가득 차 요청을 받을 수 없음 (``retry_after`` 초 후 재시도)"""
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
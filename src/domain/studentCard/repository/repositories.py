@@ -1,19 +1,59 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import func, or_, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.future import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.studentCard.dto.schemas import (
+    AnalysisJobInfo,
+    ClaimedAnalysisJob,
+    StudentCardInfo,
+)
 from src.domain.studentCard.entity.student import Student
 from src.domain.studentCard.entity.student_card import StudentCard
+from src.domain.studentCard.entity.analysis_cache import AnalysisCache
+from src.domain.studentCard.entity.analysis_job import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    AnalysisJob,
+)
+from src.infrastructure.common.metrics import metrics
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _upsert_insert(session: AsyncSession, entity):
+    """``INSERT ... ON CONFLICT`` 를 지원하는 방언별 insert 구문 생성"""
+    if session.bind.dialect.name == "sqlite":
+        return sqlite.insert(entity)
+    return postgresql.insert(entity)
+
+
 class StudentRepositoryInterface(ABC):
     @abstractmethod
     async def save(self, student: Student) -> Student:
         pass
 
+    @abstractmethod
+    async def save_many(self, students: List[Student]) -> None:
+        pass
+
+    @abstractmethod
+    async def upsert_many(self, students: List[Student]) -> None:
+        pass
+
+    @abstractmethod
+    async def commit(self) -> None:
+        pass
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        pass
+
     @abstractmethod
     async def find_by_student_number(self, student_number: str) -> Optional[Student]:
         pass
@@ -24,31 +64,91 @@ class SQLAlchemyStudentRepository(StudentRepositoryInterface):
         self._session = session
 
     async def save(self, student: Student) -> Student:
+        """학번 기준 upsert (이미 있으면 학과/학년/수정 시각만 갱신, 빈 학과/학년은 기존 값 유지)"""
         try:
-            # StudentCard 객체 생성
-            student_card = StudentCard(
-                student_number=student.student_number,
-                department=student.department,
-                year=student.year,
+            result = await self._session.execute(
+                self._upsert_statement([student]).returning(
+                    StudentCard.id,
+                    StudentCard.student_number,
+                    StudentCard.department,
+                    StudentCard.year,
+                    StudentCard.created_at,
+                    StudentCard.updated_at,
+                )
             )
-            self._session.add(student_card)
-            await self._session.commit()
-            await self._session.refresh(student_card)
+            row = result.one()
+            with metrics.stage("db_commit"):
+                await self._session.commit()
 
             # Student 객체로 변환하여 반환
             return Student(
-                id=student_card.id,
-                student_number=student_card.student_number,
-                department=student_card.department,
-                year=student_card.year,
-                created_at=student_card.created_at,
-                updated_at=student_card.updated_at,
+                id=row.id,
+                student_number=row.student_number,
+                department=row.department,
+                year=row.year,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
             )
         except Exception as e:
             await self._session.rollback()
             logger.error(f"학생 저장 중 오류 발생: {str(e)}")
             raise
 
+    async def save_many(self, students: List[Student]) -> None:
+        """여러 학생을 하나의 upsert 구문과 트랜잭션으로 저장"""
+        if not students:
+            return
+        try:
+            await self.upsert_many(students)
+            await self.commit()
+        except Exception as e:
+            await self.rollback()
+            logger.error(f"학생 일괄 저장 중 오류 발생: {str(e)}")
+            raise
+
+    async def upsert_many(self, students: List[Student]) -> None:
+        """커밋하지 않고 upsert 구문만 실행 (같은 세션의 다른 저장과 한 트랜잭션으로 묶을 때 사용)"""
+        if students:
+            await self._session.execute(self._upsert_statement(students))
+
+    async def commit(self) -> None:
+        with metrics.stage("db_commit"):
+            await self._session.commit()
+
+    async def rollback(self) -> None:
+        await self._session.rollback()
+
+    def _upsert_statement(self, students: List[Student]):
+        # 같은 구문 안에서 같은 학번이 두 번 갱신되면 오류가 나므로 마지막 값만 사용
+        now = datetime.utcnow()
+        rows = {
+            student.student_number: {
+                "student_number": student.student_number,
+                "department": student.department,
+                "year": student.year,
+                "created_at": student.created_at or now,
+                "updated_at": student.updated_at or now,
+            }
+            for student in students
+        }
+        statement = _upsert_insert(self._session, StudentCard).values(
+            list(rows.values())
+        )
+        # LLM 이 확실하지 않아 비워 둔 학과("")/학년(0)은 저장된 값을 덮어쓰지 않음
+        return statement.on_conflict_do_update(
+            index_elements=[StudentCard.student_number],
+            set_={
+                "department": func.coalesce(
+                    func.nullif(statement.excluded.department, ""),
+                    StudentCard.department,
+                ),
+                "year": func.coalesce(
+                    func.nullif(statement.excluded.year, 0), StudentCard.year
+                ),
+                "updated_at": statement.excluded.updated_at,
+            },
+        )
+
     async def find_by_student_number(self, student_number: str) -> Optional[Student]:
         try:
             query = select(StudentCard).where(
@@ -70,3 +170,331 @@ class SQLAlchemyStudentRepository(StudentRepositoryInterface):
         except Exception as e:
             logger.error(f"학생 조회 중 오류 발생: {str(e)}")
             return None
+
+
+class AnalysisCacheRepositoryInterface(ABC):
+    @abstractmethod
+    async def get(
+        self, image_digest: str, not_before: datetime
+    ) -> Optional[StudentCardInfo]:
+        pass
+
+    @abstractmethod
+    async def put(self, image_digest: str, info: StudentCardInfo) -> None:
+        pass
+
+    @abstractmethod
+    async def put_many(self, entries: List[Tuple[str, StudentCardInfo]]) -> None:
+        pass
+
+    @abstractmethod
+    async def upsert_many(self, entries: List[Tuple[str, StudentCardInfo]]) -> None:
+        pass
+
+
+class SQLAlchemyAnalysisCacheRepository(AnalysisCacheRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def get(
+        self, image_digest: str, not_before: datetime
+    ) -> Optional[StudentCardInfo]:
+        try:
+            query = select(AnalysisCache).where(
+                AnalysisCache.image_digest == image_digest,
+                AnalysisCache.created_at >= not_before,
+            )
+            result = await self._session.execute(query)
+            entry = result.scalar_one_or_none()
+
+            if entry:
+                return StudentCardInfo(
+                    name=entry.name or "",
+                    department=entry.department or "",
+                    year=entry.year or 0,
+                    student_number=entry.student_number or "",
+                )
+            return None
+        except Exception as e:
+            logger.error(f"분석 캐시 조회 중 오류 발생: {str(e)}")
+            return None
+
+    async def put(self, image_digest: str, info: StudentCardInfo) -> None:
+        await self.put_many([(image_digest, info)])
+
+    async def put_many(self, entries: List[Tuple[str, StudentCardInfo]]) -> None:
+        if not entries:
+            return
+        try:
+            await self.upsert_many(entries)
+            with metrics.stage("db_commit"):
+                await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            logger.error(f"분석 캐시 저장 중 오류 발생: {str(e)}")
+
+    async def upsert_many(self, entries: List[Tuple[str, StudentCardInfo]]) -> None:
+        """커밋하지 않고 upsert 구문만 실행 (오류는 호출한 쪽으로 전달)"""
+        if not entries:
+            return
+        now = datetime.utcnow()
+        rows = {
+            image_digest: {
+                "image_digest": image_digest,
+                "student_number": info.student_number,
+                "name": info.name,
+                "department": info.department,
+                "year": info.year,
+                "created_at": now,
+            }
+            for image_digest, info in entries
+        }
+        statement = _upsert_insert(self._session, AnalysisCache).values(
+            list(rows.values())
+        )
+        await self._session.execute(
+            statement.on_conflict_do_update(
+                index_elements=[AnalysisCache.image_digest],
+                set_={
+                    column: statement.excluded[column]
+                    for column in (
+                        "student_number",
+                        "name",
+                        "department",
+                        "year",
+                        "created_at",
+                    )
+                },
+            )
+        )
+
+
+class AnalysisJobRepositoryInterface(ABC):
+    @abstractmethod
+    async def create(self, job_id: str, image: bytes, mime_type: str) -> AnalysisJobInfo:
+        pass
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[AnalysisJobInfo]:
+        pass
+
+    @abstractmethod
+    async def claim(
+        self, worker_id: str, limit: int, lease_seconds: float, max_attempts: int
+    ) -> List[ClaimedAnalysisJob]:
+        pass
+
+    @abstractmethod
+    async def complete(self, job_id: str, worker_id: str, result: dict) -> bool:
+        pass
+
+    @abstractmethod
+    async def fail(
+        self, job_id: str, worker_id: str, error: str, error_status: int
+    ) -> bool:
+        pass
+
+    @abstractmethod
+    async def release(
+        self,
+        job_id: str,
+        worker_id: str,
+        delay_seconds: float = 0,
+        refund_attempt: bool = False,
+    ) -> bool:
+        pass
+
+
+class SQLAlchemyAnalysisJobRepository(AnalysisJobRepositoryInterface):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def create(self, job_id: str, image: bytes, mime_type: str) -> AnalysisJobInfo:
+        job = AnalysisJob(
+            id=job_id,
+            status=JOB_QUEUED,
+            image=image,
+            mime_type=mime_type,
+            attempts=0,
+            created_at=datetime.utcnow(),
+        )
+        try:
+            self._session.add(job)
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            logger.error(f"분석 작업 등록 중 오류 발생: {str(e)}")
+            raise
+        return self._to_info(job)
+
+    async def get(self, job_id: str) -> Optional[AnalysisJobInfo]:
+        # 이미지 컬럼은 읽지 않음
+        query = select(
+            AnalysisJob.id,
+            AnalysisJob.status,
+            AnalysisJob.attempts,
+            AnalysisJob.result,
+            AnalysisJob.error,
+            AnalysisJob.error_status,
+            AnalysisJob.created_at,
+            AnalysisJob.finished_at,
+        ).where(AnalysisJob.id == job_id)
+        row = (await self._session.execute(query)).one_or_none()
+        return self._to_info(row) if row else None
+
+    async def claim(
+        self, worker_id: str, limit: int, lease_seconds: float, max_attempts: int
+    ) -> List[ClaimedAnalysisJob]:
+        """대기 중이거나 임대가 만료된 작업을 ``FOR UPDATE SKIP LOCKED`` 로 가져와 실행 중으로 표시
+
+        여러 워커가 동시에 호출해도 같은 작업을 가져가지 않습니다. 대기 중인 작업의
+        ``lease_expires_at`` 은 다시 시도할 수 있는 시각이므로 그 전에는 가져가지 않습니다.
+        임대가 만료된 작업 중 이미 ``max_attempts`` 번 시도한 작업은 가져가지 않고
+        실패(500)로 기록합니다. (워커를 죽게 만드는 이미지가 계속 재시도되지 않도록)
+        (SQLite 는 행 잠금을 지원하지 않아 단일 워커 개발 환경에서만 사용)
+        """
+        now = datetime.utcnow()
+        expired = (AnalysisJob.status == JOB_RUNNING) & (AnalysisJob.lease_expires_at < now)
+        try:
+            abandoned = await self._session.execute(
+                update(AnalysisJob)
+                .where(expired, AnalysisJob.attempts >= max_attempts)
+                .values(
+                    status=JOB_FAILED,
+                    error=f"Worker lease expired after {max_attempts} attempts",
+                    error_status=500,
+                    image=None,
+                    worker_id=None,
+                    lease_expires_at=None,
+                    finished_at=now,
+                )
+            )
+            if abandoned.rowcount:
+                logger.warning(
+                    f"임대가 만료된 작업 {abandoned.rowcount}건을 최대 시도 횟수 초과로 실패 처리"
+                )
+
+            query = (
+                select(AnalysisJob)
+                .where(
+                    or_(
+                        (AnalysisJob.status == JOB_QUEUED)
+                        & (
+                            AnalysisJob.lease_expires_at.is_(None)
+                            | (AnalysisJob.lease_expires_at <= now)
+                        ),
+                        expired,
+                    )
+                )
+                .order_by(AnalysisJob.created_at)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            jobs = (await self._session.execute(query)).scalars().all()
+            claimed = []
+            for job in jobs:
+                job.status = JOB_RUNNING
+                job.attempts += 1
+                job.worker_id = worker_id
+                job.started_at = now
+                job.lease_expires_at = now + timedelta(seconds=lease_seconds)
+                claimed.append(
+                    ClaimedAnalysisJob(
+                        job_id=job.id,
+                        image=job.image or b"",
+                        mime_type=job.mime_type or "image/jpeg",
+                        attempts=job.attempts,
+                    )
+                )
+            await self._session.commit()
+            return claimed
+        except Exception as e:
+            await self._session.rollback()
+            logger.error(f"분석 작업 가져오기 중 오류 발생: {str(e)}")
+            raise
+
+    async def complete(self, job_id: str, worker_id: str, result: dict) -> bool:
+        return await self._finish(job_id, worker_id, status=JOB_SUCCEEDED, result=result)
+
+    async def fail(
+        self, job_id: str, worker_id: str, error: str, error_status: int
+    ) -> bool:
+        return await self._finish(
+            job_id, worker_id, status=JOB_FAILED, error=error, error_status=error_status
+        )
+
+    async def release(
+        self,
+        job_id: str,
+        worker_id: str,
+        delay_seconds: float = 0,
+        refund_attempt: bool = False,
+    ) -> bool:
+        """처리하지 못한 작업을 다시 대기열로 돌려놓음
+
+        ``delay_seconds`` 동안은 다시 가져가지 않으며, ``refund_attempt`` 면 이번 시도를
+        시도 횟수에서 뺍니다. (과부하로 처리를 시작하지도 못한 경우)
+        """
+        values = {
+            "status": JOB_QUEUED,
+            "worker_id": None,
+            "lease_expires_at": (
+                datetime.utcnow() + timedelta(seconds=delay_seconds)
+                if delay_seconds > 0
+                else None
+            ),
+        }
+        if refund_attempt:
+            values["attempts"] = AnalysisJob.attempts - 1
+        return await self._update(job_id, worker_id, values)
+
+    async def _finish(self, job_id: str, worker_id: str, **values) -> bool:
+        # 처리가 끝난 작업의 이미지는 보관하지 않음
+        return await self._update(
+            job_id,
+            worker_id,
+            {
+                "image": None,
+                "lease_expires_at": None,
+                "finished_at": datetime.utcnow(),
+                **values,
+            },
+        )
+
+    async def _update(self, job_id: str, worker_id: str, values: dict) -> bool:
+        """이 워커가 실행 중인 작업일 때만 갱신 (임대가 만료되어 다른 워커가 가져갔으면 ``False``)"""
+        try:
+            result = await self._session.execute(
+                update(AnalysisJob)
+                .where(
+                    AnalysisJob.id == job_id,
+                    AnalysisJob.worker_id == worker_id,
+                    AnalysisJob.status == JOB_RUNNING,
+                )
+                .values(values)
+            )
+            await self._session.commit()
+        except Exception as e:
+            await self._session.rollback()
+            logger.error(f"분석 작업 상태 저장 중 오류 발생: {str(e)}")
+            raise
+        if result.rowcount == 0:
+            logger.warning(
+                f"분석 작업 상태를 기록하지 않음 ({job_id}): "
+                f"워커 {worker_id} 가 더 이상 실행 중인 작업이 아님"
+            )
+            return False
+        return True
+
+    @staticmethod
+    def _to_info(row) -> AnalysisJobInfo:
+        return AnalysisJobInfo(
+            job_id=row.id,
+            status=row.status,
+            attempts=row.attempts or 0,
+            result=row.result,
+            error=row.error,
+            error_status=row.error_status,
+            created_at=row.created_at,
+            finished_at=row.finished_at,
+        )
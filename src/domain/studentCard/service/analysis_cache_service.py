@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from cachetools import TTLCache
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.domain.studentCard.repository.repositories import (
+    AnalysisCacheRepositoryInterface,
+)
+from src.infrastructure.common.metrics import metrics
+import logging
+
+
+def create_memory_cache(max_entries: int, ttl: int) -> TTLCache:
+    """요청 간에 공유하는 메모리 LRU 캐시 생성"""
+    return TTLCache(maxsize=max_entries, ttl=ttl)
+
+
+class AnalysisCacheService:
+    """학생증 분석 결과 2단계 캐시
+
+    1단계는 프로세스 내 LRU(TTL) 캐시, 2단계는 모든 uvicorn 워커가 공유하는
+    ``analysis_cache`` 테이블입니다. 2단계에서 찾은 항목은 1단계로 끌어올립니다.
+    """
+
+    def __init__(
+        self,
+        memory_cache: TTLCache,
+        repository: AnalysisCacheRepositoryInterface,
+        ttl: int,
+    ):
+        self._memory_cache = memory_cache
+        self._repository = repository
+        self._ttl = ttl
+        self._logger = logging.getLogger(__name__)
+
+    def with_repository(
+        self, repository: AnalysisCacheRepositoryInterface
+    ) -> "AnalysisCacheService":
+        """같은 메모리 캐시를 공유하고 DB 는 다른 저장소(세션)로 읽고 쓰는 캐시 서비스"""
+        return AnalysisCacheService(self._memory_cache, repository, self._ttl)
+
+    async def get(self, image_digest: str) -> Optional[StudentCardInfo]:
+        cached = self._memory_cache.get(image_digest)
+        if cached is not None:
+            self._logger.info(f"분석 캐시 적중 (memory): {image_digest[:12]}")
+            metrics.increment("student_card_cache_lookups_total", tier="memory", result="hit")
+            return cached.model_copy()
+        metrics.increment("student_card_cache_lookups_total", tier="memory", result="miss")
+
+        not_before = datetime.utcnow() - timedelta(seconds=self._ttl)
+        cached = await self._repository.get(image_digest, not_before)
+        if cached is not None:
+            self._logger.info(f"분석 캐시 적중 (db): {image_digest[:12]}")
+            metrics.increment("student_card_cache_lookups_total", tier="db", result="hit")
+            self._memory_cache[image_digest] = cached
+            return cached.model_copy()
+
+        metrics.increment("student_card_cache_lookups_total", tier="db", result="miss")
+        return None
+
+    async def put(self, image_digest: str, info: StudentCardInfo) -> None:
+        await self.put_many([(image_digest, info)])
+
+    async def put_many(
+        self, entries: List[Tuple[str, StudentCardInfo]], commit: bool = True
+    ) -> None:
+        """분석 결과를 두 단계 캐시에 저장
+
+        ``commit`` 이 ``False`` 면 DB 에는 upsert 구문만 실행하고 커밋은 같은 세션을
+        쓰는 호출한 쪽에 맡기며, DB 오류도 그대로 전달합니다.
+        """
+        # 불완전한 결과는 캐시하지 않음
+        complete = [
+            (image_digest, info)
+            for image_digest, info in entries
+            if info.student_number and info.department and info.year
+        ]
+        for image_digest, info in complete:
+            self._memory_cache[image_digest] = info.model_copy()
+        if commit:
+            await self._repository.put_many(complete)
+        else:
+            await self._repository.upsert_many(complete)
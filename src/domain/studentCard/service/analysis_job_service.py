@@ -0,0 +1,197 @@
+from contextlib import suppress
+from typing import Callable, Optional, Set, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.studentCard.dto.schemas import AnalysisJobInfo, ClaimedAnalysisJob
+from src.domain.studentCard.exception.exceptions import (
+    DomainException,
+    OCRRetryableException,
+    ServiceOverloadedException,
+    UpstreamServiceException,
+)
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisJobRepository,
+)
+from src.domain.studentCard.service.batch_analysis_service import (
+    AnalysisServiceFactory,
+)
+from src.infrastructure.common.deadline import request_deadline
+import asyncio
+import logging
+import uuid
+
+
+class AnalysisJobService:
+    """비동기 분석 작업 접수와 상태 조회 (API 프로세스)
+
+    조회마다 짧은 세션을 새로 열어 long-poll 중에도 DB 연결을 붙잡지 않습니다.
+    """
+
+    def __init__(
+        self, session_factory: Callable[[], AsyncSession], poll_interval: float
+    ):
+        self._session_factory = session_factory
+        self._poll_interval = poll_interval
+
+    async def submit(
+        self, image_bytes: Union[bytes, memoryview], mime_type: str
+    ) -> AnalysisJobInfo:
+        async with self._session_factory() as session:
+            return await SQLAlchemyAnalysisJobRepository(session).create(
+                uuid.uuid4().hex, bytes(image_bytes), mime_type
+            )
+
+    async def get(self, job_id: str) -> Optional[AnalysisJobInfo]:
+        async with self._session_factory() as session:
+            return await SQLAlchemyAnalysisJobRepository(session).get(job_id)
+
+    async def wait(self, job_id: str, timeout: float) -> Optional[AnalysisJobInfo]:
+        """작업이 끝나거나 ``timeout`` 초가 지날 때까지 기다린 뒤 상태 반환 (long-poll)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            job = await self.get(job_id)
+            remaining = deadline - loop.time()
+            if job is None or job.done or remaining <= 0:
+                return job
+            await asyncio.sleep(min(self._poll_interval, remaining))
+
+
+class AnalysisJobRunner:
+    """대기열의 작업을 가져와 ``StudentCardAnalysisService`` 로 처리 (워커 프로세스)
+
+    동시에 ``concurrency`` 개까지 처리하며, 작업마다 분석용 세션을 따로 엽니다.
+    잘못된 이미지처럼 다시 해도 같은 결과인 오류는 바로 실패로 기록하고,
+    시간 초과 등 일시적인 오류는 ``max_attempts`` 번까지 다시 대기열에 넣습니다.
+    처리 중 워커가 죽으면 ``lease_seconds`` 뒤 다른 워커가 작업을 다시 가져갑니다.
+    과부하로 처리를 시작하지 못한 작업은 시도 횟수를 돌려주고 ``poll_interval``
+    뒤에 다시 가져가도록 대기열에 넣어 같은 작업을 곧바로 반복해 가져가지 않습니다.
+    """
+
+    def __init__(
+        self,
+        service_factory: AnalysisServiceFactory,
+        session_factory: Callable[[], AsyncSession],
+        worker_id: str,
+        concurrency: int,
+        poll_interval: float,
+        lease_seconds: float,
+        max_attempts: int,
+        job_timeout: float,
+    ):
+        self._service_factory = service_factory
+        self._session_factory = session_factory
+        self._worker_id = worker_id
+        self._concurrency = max(1, concurrency)
+        self._poll_interval = poll_interval
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max(1, max_attempts)
+        self._job_timeout = job_timeout
+        self._logger = logging.getLogger(__name__)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """``stop`` 이 설정될 때까지 작업을 가져와 처리하고, 종료 시 실행 중인 작업을 마침"""
+        running: Set[asyncio.Task] = set()
+        self._logger.info(f"분석 작업 워커 시작: {self._worker_id}")
+        while not stop.is_set():
+            claimed = []
+            capacity = self._concurrency - len(running)
+            if capacity > 0:
+                try:
+                    async with self._session_factory() as session:
+                        claimed = await SQLAlchemyAnalysisJobRepository(session).claim(
+                            self._worker_id,
+                            capacity,
+                            self._lease_seconds,
+                            self._max_attempts,
+                        )
+                except Exception as e:
+                    self._logger.error(f"작업 대기열 조회 실패: {str(e)}")
+
+            for job in claimed:
+                task = asyncio.create_task(self._process(job))
+                running.add(task)
+                task.add_done_callback(running.discard)
+
+            if not claimed:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(stop.wait(), self._poll_interval)
+
+        if running:
+            self._logger.info(f"실행 중인 작업 {len(running)}건 완료 대기")
+            await asyncio.gather(*running, return_exceptions=True)
+        self._logger.info(f"분석 작업 워커 종료: {self._worker_id}")
+
+    async def _process(self, job: ClaimedAnalysisJob) -> None:
+        self._logger.info(f"분석 작업 시작: {job.job_id} ({job.attempts}회차)")
+        try:
+            async with self._session_factory() as session:
+                async with request_deadline(self._job_timeout):
+                    analysis = await self._service_factory(session).analyze(job.image)
+        except ServiceOverloadedException:
+            await self._update(
+                job,
+                lambda repository: repository.release(
+                    job.job_id,
+                    self._worker_id,
+                    delay_seconds=self._poll_interval,
+                    refund_attempt=True,
+                ),
+            )
+            return
+        except OCRRetryableException as e:
+            await self._retry_or_fail(job, str(e), 503)
+            return
+        except UpstreamServiceException as e:
+            # LLM API 설정 문제는 다시 시도해도 같은 결과
+            await self._update(
+                job,
+                lambda repository: repository.fail(job.job_id, self._worker_id, str(e), 502),
+            )
+            return
+        except DomainException as e:
+            await self._update(
+                job,
+                lambda repository: repository.fail(job.job_id, self._worker_id, str(e), 400),
+            )
+            return
+        except TimeoutError:
+            await self._retry_or_fail(
+                job, f"Processing did not finish within {self._job_timeout}s", 504
+            )
+            return
+        except Exception as e:
+            self._logger.error(f"분석 작업 처리 중 오류 발생 ({job.job_id}): {str(e)}")
+            await self._retry_or_fail(
+                job, f"Internal server error while processing image: {str(e)}", 500
+            )
+            return
+
+        result = analysis.response_data()
+        await self._update(
+            job,
+            lambda repository: repository.complete(job.job_id, self._worker_id, result),
+        )
+        self._logger.info(f"분석 작업 완료: {job.job_id}")
+
+    async def _retry_or_fail(
+        self, job: ClaimedAnalysisJob, error: str, error_status: int
+    ) -> None:
+        if job.attempts < self._max_attempts:
+            await self._update(
+                job, lambda repository: repository.release(job.job_id, self._worker_id)
+            )
+        else:
+            await self._update(
+                job,
+                lambda repository: repository.fail(
+                    job.job_id, self._worker_id, error, error_status
+                ),
+            )
+
+    async def _update(self, job: ClaimedAnalysisJob, change) -> None:
+        try:
+            async with self._session_factory() as session:
+                await change(SQLAlchemyAnalysisJobRepository(session))
+        except Exception as e:
+            # 기록하지 못한 작업은 임대가 만료되면 다시 처리됨
+            self._logger.error(f"분석 작업 상태 기록 실패 ({job.job_id}): {str(e)}")
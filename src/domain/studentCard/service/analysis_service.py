@@ -0,0 +1,346 @@
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional, Tuple, Union
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.studentCard.dto.schemas import StudentCardAnalysis, StudentCardInfo
+from src.domain.studentCard.entity.student import Student
+from src.domain.studentCard.exception.exceptions import (
+    BarcodeProcessingException,
+    InvalidImageException,
+)
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+    SQLAlchemyStudentRepository,
+    StudentRepositoryInterface,
+)
+from src.domain.studentCard.service.analysis_cache_service import (
+    AnalysisCacheService,
+)
+from src.domain.studentCard.service.barcode_service import BarcodeService
+from src.domain.studentCard.service.ocr_service import OCRService
+from src.infrastructure.common.admission import AdmissionController
+from src.infrastructure.common.digest import compute_image_digest
+from src.infrastructure.common.memory import release_allocation, track_allocation
+from src.infrastructure.common.metrics import metrics
+from src.infrastructure.common.single_flight import SingleFlight
+from src.infrastructure.studentCard.external.image_preprocessor import (
+    ImagePreprocessor,
+)
+from src.infrastructure.studentCard.persistence.digest_lock import (
+    DatabaseDigestLock,
+)
+import asyncio
+import logging
+import numpy as np
+
+PIPELINE_PARALLEL = "parallel"
+PIPELINE_BARCODE_FIRST = "barcode_first"
+
+# 이미지를 새로 분석한 결과의 source (저장 대상)
+ANALYZED_SOURCES = ("ocr", "llm")
+
+
+class StudentCardAnalysisService:
+    """학생증 분석 파이프라인 (캐시 → 디코딩 → 바코드 → 기존 학생 확인 → OCR → 저장)
+
+    업로드 이미지는 한 번만 디코딩되어 바코드 인식과 OCR 전처리(축소/재인코딩)가
+    같은 배열을 공유합니다. 업로드 버퍼는 ``memoryview`` 로도 받을 수 있으며
+    해시 계산과 디코딩 모두 복사 없이 읽습니다. CPU 풀이 프로세스 풀이면 배열을
+    pickle 로 주고받는 대신 바코드 인식과 OCR 전처리 작업자가 각자 업로드 바이트를
+    디코딩합니다. 이때 디코딩할 수 없는 이미지는 바코드 인식 실패로 거절됩니다.
+
+    바코드 결과가 이후 단계를 결정합니다.
+
+    - 바코드 인식에 실패하면 진행 중인 OCR 작업을 즉시 취소합니다.
+    - 최근(``freshness_seconds`` 이내) 갱신된 학생이면 LLM 호출 없이 저장된
+      학과/학년을 반환합니다.
+
+    ``parallel`` 모드는 바코드와 OCR 을 동시에 시작해 신규 학생의 지연을 줄이고,
+    ``barcode_first`` 모드는 바코드 결과를 확인한 뒤에만 OCR 을 시작해
+    기존 학생에 대한 OpenAI 호출을 완전히 없앱니다.
+
+    OCR 단계(로컬 OCR 과 필요 시 LLM 호출)는 ``admission`` 의 슬롯 안에서만 실행되며, 대기열이 가득 차면
+    디코딩 등 무거운 작업을 시작하기 전에 ``ServiceOverloadedException`` 으로 거절합니다.
+
+    캐시에 없는 같은 이미지(다이제스트)가 동시에 들어오면 ``single_flight`` 로
+    디코딩부터 저장까지를 한 번만 실행하고 모든 요청이 그 결과를 받습니다.
+    합쳐진 작업은 먼저 끝난 요청의 세션을 계속 쓰지 않도록 ``session_factory`` 로
+    자체 세션을 엽니다.
+    ``digest_lock`` 이 있으면 다른 워커가 같은 이미지를 처리하는 동안 기다렸다가
+    그 워커가 저장한 캐시 결과를 사용합니다.
+    """
+
+    def __init__(
+        self,
+        barcode_service: BarcodeService,
+        ocr_service: OCRService,
+        student_repository: StudentRepositoryInterface,
+        cache_service: AnalysisCacheService,
+        image_preprocessor: ImagePreprocessor,
+        admission: AdmissionController,
+        mode: str = PIPELINE_PARALLEL,
+        freshness_seconds: int = 0,
+        single_flight: Optional[SingleFlight] = None,
+        digest_lock: Optional[DatabaseDigestLock] = None,
+        session_factory: Optional[Callable[[], AsyncSession]] = None,
+    ):
+        self._barcode_service = barcode_service
+        self._ocr_service = ocr_service
+        self._student_repository = student_repository
+        self._cache_service = cache_service
+        self._image_preprocessor = image_preprocessor
+        self._admission = admission
+        self._mode = mode
+        self._freshness_seconds = freshness_seconds
+        self._single_flight = single_flight
+        self._digest_lock = digest_lock
+        self._session_factory = session_factory
+        self._logger = logging.getLogger(__name__)
+
+    async def analyze(
+        self, image_bytes: Union[bytes, memoryview], persist: bool = True
+    ) -> StudentCardAnalysis:
+        """이미지 분석
+
+        ``persist`` 가 ``False`` 면 결과를 저장하지 않고 반환하므로, 호출자가
+        ``save_results()`` 로 여러 결과를 한 트랜잭션에 묶어 저장할 수 있습니다.
+        """
+        # 동일 이미지 재업로드는 저장된 결과로 즉시 응답
+        image_digest = compute_image_digest(image_bytes)
+        cached_info = await self._cache_service.get(image_digest)
+        if cached_info:
+            return self._to_analysis(cached_info, "cache", image_digest)
+
+        if self._single_flight is None:
+            analysis, persisted = await self._analyze_exclusive(
+                image_bytes, image_digest, persist
+            )
+        else:
+            (analysis, persisted), leader = await self._single_flight.run(
+                image_digest,
+                lambda: self._analyze_shared(image_bytes, image_digest, persist),
+            )
+            if not leader:
+                metrics.increment("student_card_coalesced_requests_total")
+                self._logger.info(f"진행 중인 동일 이미지 분석 결과 공유: {image_digest[:12]}")
+                analysis = analysis.model_copy()
+
+        # 저장하지 않는 분석(일괄 처리 등)에 합류한 경우 직접 저장
+        if persist and not persisted and analysis.source in ANALYZED_SOURCES:
+            await self._persist(analysis)
+        return analysis
+
+    async def _analyze_shared(
+        self, image_bytes: Union[bytes, memoryview], image_digest: str, persist: bool
+    ) -> Tuple[StudentCardAnalysis, bool]:
+        """합쳐진 작업 실행 (요청 범위 세션 대신 작업 전용 세션 사용)"""
+        if self._session_factory is None:
+            return await self._analyze_exclusive(image_bytes, image_digest, persist)
+        async with self._session_factory() as session:
+            return await self._with_session(session)._analyze_exclusive(
+                image_bytes, image_digest, persist
+            )
+
+    def _with_session(self, session: AsyncSession) -> "StudentCardAnalysisService":
+        return StudentCardAnalysisService(
+            self._barcode_service,
+            self._ocr_service,
+            SQLAlchemyStudentRepository(session),
+            self._cache_service.with_repository(
+                SQLAlchemyAnalysisCacheRepository(session)
+            ),
+            self._image_preprocessor,
+            self._admission,
+            mode=self._mode,
+            freshness_seconds=self._freshness_seconds,
+            digest_lock=self._digest_lock,
+        )
+
+    async def _analyze_exclusive(
+        self, image_bytes: Union[bytes, memoryview], image_digest: str, persist: bool
+    ) -> Tuple[StudentCardAnalysis, bool]:
+        """다른 워커가 같은 이미지를 처리 중이면 끝날 때까지 기다린 뒤 캐시 결과 사용"""
+        if self._digest_lock is None:
+            return await self._analyze_image(image_bytes, image_digest, persist)
+
+        acquired = await self._digest_lock.acquire(image_digest)
+        try:
+            if not acquired:
+                cached_info = await self._cache_service.get(image_digest)
+                if cached_info:
+                    return self._to_analysis(cached_info, "cache", image_digest), True
+            return await self._analyze_image(image_bytes, image_digest, persist)
+        finally:
+            if acquired:
+                await self._digest_lock.release(image_digest)
+
+    async def _analyze_image(
+        self, image_bytes: Union[bytes, memoryview], image_digest: str, persist: bool
+    ) -> Tuple[StudentCardAnalysis, bool]:
+        """디코딩 → 바코드 → 기존 학생 확인 → OCR → 저장 (저장 여부를 함께 반환)"""
+        self._admission.ensure_capacity()
+        # 프로세스 풀이면 배열을 주고받지 않고 작업자가 각자 업로드 바이트를 디코딩
+        image = None
+        if not self._image_preprocessor.decodes_in_worker:
+            with metrics.stage("decode"):
+                image = await self._image_preprocessor.decode(image_bytes)
+            if image is None:
+                raise InvalidImageException("Could not decode image file.")
+            track_allocation("decoded", image.nbytes)
+
+        ocr_task = None
+        if self._mode != PIPELINE_BARCODE_FIRST:
+            ocr_task = asyncio.create_task(self._extract_info(image, image_bytes))
+
+        try:
+            with metrics.stage("barcode"):
+                barcode_data = await self._extract_barcode(image, image_bytes)
+            if not barcode_data:
+                metrics.increment("student_card_barcode_failures_total")
+                raise BarcodeProcessingException(
+                    "Could not extract student number from barcode"
+                )
+
+            known_student = await self._find_fresh_student(barcode_data)
+            if known_student:
+                self._logger.info(f"최근 갱신된 학생, OCR 생략: {barcode_data}")
+                return (
+                    StudentCardAnalysis(
+                        student_number=known_student.student_number,
+                        department=known_student.department,
+                        year=known_student.year,
+                        source="db",
+                        image_digest=image_digest,
+                    ),
+                    False,
+                )
+
+            if ocr_task is None:
+                ocr_task = asyncio.create_task(self._extract_info(image, image_bytes))
+            student_info = await ocr_task
+        finally:
+            if ocr_task is not None and not ocr_task.done():
+                await self._cancel(ocr_task)
+            release_allocation("decoded")
+
+        student_info.student_number = barcode_data
+        analysis = self._to_analysis(student_info, student_info.tier, image_digest)
+        if persist:
+            await self._persist(analysis)
+        return analysis, persist
+
+    async def _persist(self, analysis: StudentCardAnalysis) -> None:
+        # 학생 정보 생성 또는 업데이트
+        await self._student_repository.save(self._to_student(analysis))
+        await self._cache_service.put(analysis.image_digest, self._to_info(analysis))
+
+    async def save_results(self, analyses: List[StudentCardAnalysis]) -> None:
+        """새로 분석된 결과들을 학생 정보와 분석 캐시에 한 트랜잭션으로 저장"""
+        analyzed = [analysis for analysis in analyses if analysis.source in ANALYZED_SOURCES]
+        if not analyzed:
+            return
+        try:
+            await self._student_repository.upsert_many(
+                [self._to_student(analysis) for analysis in analyzed]
+            )
+            await self._cache_service.put_many(
+                [
+                    (analysis.image_digest, self._to_info(analysis))
+                    for analysis in analyzed
+                ],
+                commit=False,
+            )
+            await self._student_repository.commit()
+        except Exception as e:
+            await self._student_repository.rollback()
+            self._logger.error(f"분석 결과 일괄 저장 실패: {str(e)}")
+            raise
+
+    async def _extract_barcode(
+        self, image: Optional[np.ndarray], image_bytes: Union[bytes, memoryview]
+    ) -> str:
+        if image is None:
+            return await self._barcode_service.extract_barcode(image_bytes)
+
+        # 바코드 파이프라인의 grayscale 작업 버퍼
+        track_allocation("barcode", image.shape[0] * image.shape[1])
+        try:
+            return await self._barcode_service.extract_barcode_from_image(image)
+        finally:
+            release_allocation("barcode")
+
+    async def _extract_info(
+        self, image: Optional[np.ndarray], image_bytes: Union[bytes, memoryview]
+    ) -> StudentCardInfo:
+        with metrics.stage("preprocess"):
+            if image is None:
+                prepared = await self._image_preprocessor.prepare_encoded(image_bytes)
+            else:
+                prepared = await self._image_preprocessor.prepare(
+                    image, len(image_bytes)
+                )
+        if prepared is None:
+            raise InvalidImageException("Could not decode image file.")
+        track_allocation("prepared", len(prepared.data))
+        try:
+            async with self._admission.slot():
+                return await self._ocr_service.extract_info(
+                    prepared.data, prepared.mime_type
+                )
+        finally:
+            release_allocation("prepared")
+            release_allocation("data_url")
+
+    async def _find_fresh_student(self, student_number: str) -> Optional[Student]:
+        if self._freshness_seconds <= 0:
+            return None
+
+        student = await self._student_repository.find_by_student_number(
+            student_number
+        )
+        if not student or not student.department or not student.year:
+            return None
+
+        updated_at = student.updated_at or student.created_at
+        fresh_after = datetime.utcnow() - timedelta(seconds=self._freshness_seconds)
+        if updated_at is None or updated_at < fresh_after:
+            return None
+        return student
+
+    async def _cancel(self, task: asyncio.Task) -> None:
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            self._logger.info("진행 중인 OCR 작업 취소")
+        except Exception as e:
+            self._logger.warning(f"취소된 OCR 작업에서 오류 발생: {str(e)}")
+
+    @staticmethod
+    def _to_analysis(
+        info: StudentCardInfo, source: str, image_digest: str
+    ) -> StudentCardAnalysis:
+        return StudentCardAnalysis(
+            student_number=info.student_number,
+            department=info.department,
+            year=info.year,
+            name=info.name,
+            source=source,
+            image_digest=image_digest,
+        )
+
+    @staticmethod
+    def _to_info(analysis: StudentCardAnalysis) -> StudentCardInfo:
+        return StudentCardInfo(
+            name=analysis.name,
+            department=analysis.department,
+            year=analysis.year,
+            student_number=analysis.student_number,
+        )
+
+    @staticmethod
+    def _to_student(analysis: StudentCardAnalysis) -> Student:
+        return Student.create(
+            student_number=analysis.student_number,
+            department=analysis.department,
+            year=analysis.year,
+        )
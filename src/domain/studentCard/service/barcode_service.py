@@ -1,6 +1,7 @@
-from src.infrastructure.studentCard.external.barcode_reader import (
+from src.infrastructure.studentCard.external.interfaces import (
     BarcodeReaderInterface,
 )
+import numpy as np
 
 
 class BarcodeService:
@@ -11,3 +12,8 @@ class BarcodeService:
         if not image_bytes:
             raise ValueError("이미지 데이터가 없습니다")
         return await self._reader.extract_barcode(image_bytes)
+
+    async def extract_barcode_from_image(self, image: np.ndarray) -> str:
+        if image is None or image.size == 0:
+            raise ValueError("이미지 데이터가 없습니다")
+        return await self._reader.extract_barcode_from_image(image)
@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.domain.studentCard.dto.schemas import StudentCardAnalysis
+from src.domain.studentCard.exception.exceptions import (
+    DomainException,
+    UpstreamServiceException,
+)
+from src.domain.studentCard.service.analysis_service import StudentCardAnalysisService
+from src.infrastructure.common.deadline import request_deadline
+import asyncio
+import logging
+
+AnalysisServiceFactory = Callable[[AsyncSession], StudentCardAnalysisService]
+
+
+@dataclass
+class BatchItem:
+    """일괄 분석 대상 이미지 (``load`` 는 처리 직전에 이미지 바이트를 읽음)"""
+
+    index: int
+    filename: str
+    load: Callable[[], Awaitable[bytes]]
+    error: Optional[str] = None
+
+
+class BatchAnalysisService:
+    """여러 학생증 이미지를 제한된 동시성으로 분석하고 끝나는 순서대로 결과를 내보냄
+
+    동시에 처리하는 이미지 수는 ``max_parallel`` 개로 제한합니다. 새로 분석된
+    결과는 ``chunk_size`` 개씩 모아 한 트랜잭션으로 저장합니다. 각 작업자는
+    조회용 세션을 따로 사용하므로 하나의 ``AsyncSession`` 을 동시에 공유하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        service_factory: AnalysisServiceFactory,
+        session_factory: Callable[[], AsyncSession],
+        max_parallel: int,
+        chunk_size: int,
+        item_timeout: float,
+    ):
+        self._service_factory = service_factory
+        self._session_factory = session_factory
+        self._max_parallel = max(1, max_parallel)
+        self._chunk_size = max(1, chunk_size)
+        self._item_timeout = item_timeout
+        self._logger = logging.getLogger(__name__)
+
+    async def analyze(self, items: List[BatchItem]) -> AsyncIterator[dict]:
+        pending: asyncio.Queue = asyncio.Queue()
+        for item in items:
+            pending.put_nowait(item)
+        finished: asyncio.Queue = asyncio.Queue()
+
+        workers = [
+            asyncio.create_task(self._worker(pending, finished))
+            for _ in range(min(self._max_parallel, len(items)))
+        ]
+        unsaved: List[Tuple[BatchItem, StudentCardAnalysis]] = []
+        try:
+            for _ in range(len(items)):
+                item, analysis, error = await finished.get()
+                if analysis is not None:
+                    yield self._success_line(item, analysis)
+                    unsaved.append((item, analysis))
+                else:
+                    yield self._error_line(item, error)
+
+                if len(unsaved) >= self._chunk_size:
+                    for line in await self._save_chunk(unsaved):
+                        yield line
+                    unsaved = []
+
+            for line in await self._save_chunk(unsaved):
+                yield line
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    async def _worker(self, pending: asyncio.Queue, finished: asyncio.Queue) -> None:
+        while not pending.empty():
+            item = pending.get_nowait()
+            finished.put_nowait(await self._analyze_item(item))
+
+    async def _analyze_item(
+        self, item: BatchItem
+    ) -> Tuple[BatchItem, Optional[StudentCardAnalysis], Optional[str]]:
+        if item.error:
+            return item, None, item.error
+        try:
+            async with request_deadline(self._item_timeout):
+                image_bytes = await item.load()
+                async with self._session_factory() as session:
+                    service = self._service_factory(session)
+                    analysis = await service.analyze(image_bytes, persist=False)
+            return item, analysis, None
+        except TimeoutError:
+            return item, None, f"Processing did not finish within {self._item_timeout}s"
+        except (DomainException, UpstreamServiceException) as e:
+            return item, None, str(e)
+        except Exception as e:
+            self._logger.error(f"일괄 분석 실패 ({item.filename}): {str(e)}")
+            return item, None, f"Internal server error while processing image: {e}"
+
+    async def _save_chunk(
+        self, chunk: List[Tuple[BatchItem, StudentCardAnalysis]]
+    ) -> List[dict]:
+        """청크 단위 저장. 실패하면 한 건씩 다시 저장하고, 그래도 실패한 이미지의 저장 실패 라인을 반환
+
+        한 건의 오류로 같은 청크의 나머지 결과까지 잃지 않도록 청크 트랜잭션이
+        실패하면 이미지별 트랜잭션으로 나눠 다시 저장합니다.
+        """
+        if not chunk:
+            return []
+        try:
+            await self._save([analysis for _, analysis in chunk])
+            return []
+        except Exception as e:
+            self._logger.error(f"일괄 저장 실패 ({len(chunk)}건), 한 건씩 다시 저장: {str(e)}")
+
+        lines = []
+        for item, analysis in chunk:
+            try:
+                await self._save([analysis])
+            except Exception as e:
+                self._logger.error(f"저장 실패 ({item.filename}): {str(e)}")
+                lines.append({**self._error_line(item, str(e)), "stage": "persist"})
+        return lines
+
+    async def _save(self, analyses: List[StudentCardAnalysis]) -> None:
+        async with self._session_factory() as session:
+            service = self._service_factory(session)
+            await service.save_results(analyses)
+
+    @staticmethod
+    def _success_line(item: BatchItem, analysis: StudentCardAnalysis) -> dict:
+        return {
+            "index": item.index,
+            "filename": item.filename,
+            "status": "success",
+            "data": analysis.response_data(),
+        }
+
+    @staticmethod
+    def _error_line(item: BatchItem, error: Optional[str]) -> dict:
+        return {
+            "index": item.index,
+            "filename": item.filename,
+            "status": "error",
+            "detail": error,
+        }
@@ -1,33 +1,27 @@
-from src.infrastructure.studentCard.external.gpt_vision_reader import (
+from src.infrastructure.studentCard.external.interfaces import (
     GPTVisionReaderInterface,
 )
 from src.domain.studentCard.dto.schemas import StudentCardInfo
-from src.domain.studentCard.repository.repositories import StudentRepositoryInterface
 import logging
-from tenacity import retry, stop_after_attempt, wait_exponential
 
 
 class OCRService:
-    def __init__(
-        self, reader: GPTVisionReaderInterface, repository: StudentRepositoryInterface
-    ):
+    """학생 정보 추출
+
+    LLM 호출 재시도와 헤지는 리더(``ResilientCardReader``)가 요청의 남은 처리
+    시간과 재시도 예산을 보고 처리하므로 여기서는 다시 시도하지 않습니다.
+    """
+
+    def __init__(self, reader: GPTVisionReaderInterface):
         self._reader = reader
-        self._repository = repository
         self._logger = logging.getLogger(__name__)
 
-    @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
-    )
-    async def extract_info(self, image_bytes: bytes) -> StudentCardInfo:
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
         self._logger.info("OCR 처리 시작")
         try:
-            result = await self._reader.extract_info(image_bytes)
-            # 기존 학생 정보 확인
-            existing_student = await self._repository.find_by_student_number(
-                result.student_number
-            )
-            if existing_student:
-                self._logger.info(f"기존 학생 정보 발견: {existing_student}")
+            result = await self._reader.extract_info(image_bytes, mime_type)
             self._logger.info(f"OCR 처리 완료: {result}")
             return result
         except Exception as e:
@@ -0,0 +1,101 @@
+from contextlib import asynccontextmanager
+from src.domain.studentCard.exception.exceptions import ServiceOverloadedException
+import asyncio
+import logging
+import math
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class AdmissionController:
+    """LLM 호출 동시 실행 수 제한과 제한된 대기열 기반 부하 차단
+
+    동시에 ``max_concurrent`` 개까지만 실행하고, 최대 ``max_queued`` 개까지 대기시킵니다.
+    대기열이 가득 차면 기다리지 않고 즉시 ``ServiceOverloadedException`` 을 발생시켜
+    p99 지연이 한없이 늘어나는 대신 빠르게 503 으로 응답하도록 합니다.
+    ``Retry-After`` 값은 최근 슬롯 점유 시간의 지수 이동 평균으로 추정합니다.
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int):
+        self._max_concurrent = max(1, max_concurrent)
+        self._max_queued = max(0, max_queued)
+        self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        self._in_flight = 0
+        self._waiting = 0
+        self._avg_hold_seconds = 5.0
+
+        # 누적 카운터
+        self.admitted_total = 0
+        self.queued_total = 0
+        self.rejected_total = 0
+        self.timeouts_total = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._waiting
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def retry_after(self) -> int:
+        backlog = self._waiting + 1
+        return max(
+            1, math.ceil(self._avg_hold_seconds * backlog / self._max_concurrent)
+        )
+
+    def ensure_capacity(self) -> None:
+        """대기열이 가득 찼으면 무거운 작업을 시작하기 전에 바로 거절"""
+        if (
+            self._in_flight >= self._max_concurrent
+            and self._waiting >= self._max_queued
+        ):
+            self.rejected_total += 1
+            retry_after = self.retry_after()
+            logger.warning(
+                f"요청 거절: 대기열 포화 (in_flight={self._in_flight}, "
+                f"queued={self._waiting}, retry_after={retry_after}s)"
+            )
+            raise ServiceOverloadedException(
+                "Server is busy. Please retry later.", retry_after=retry_after
+            )
+
+    @asynccontextmanager
+    async def slot(self):
+        self.ensure_capacity()
+
+        if self._semaphore.locked():
+            self.queued_total += 1
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+
+        self._in_flight += 1
+        self.admitted_total += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            held = time.perf_counter() - started
+            self._avg_hold_seconds = 0.8 * self._avg_hold_seconds + 0.2 * held
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    def record_timeout(self) -> None:
+        self.timeouts_total += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "max_concurrent": self._max_concurrent,
+            "max_queued": self._max_queued,
+            "in_flight": self._in_flight,
+            "queue_depth": self._waiting,
+            "admitted_total": self.admitted_total,
+            "queued_total": self.queued_total,
+            "rejected_total": self.rejected_total,
+            "timeouts_total": self.timeouts_total,
+        }
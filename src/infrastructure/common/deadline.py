@@ -0,0 +1,34 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Optional
+import asyncio
+
+# 현재 요청의 처리 기한 (이벤트 루프 시간), 여기서 생성한 태스크에도 전달됨
+_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+
+@asynccontextmanager
+async def request_deadline(seconds: float):
+    """``asyncio.timeout`` 처럼 처리 기한을 걸고, 안쪽 코드가 남은 시간을 알 수 있게 기록
+
+    바깥에 더 이른 기한이 있으면 그 기한을 유지합니다. 기한을 넘기면
+    ``TimeoutError`` 가 발생합니다.
+    """
+    when = asyncio.get_running_loop().time() + seconds
+    outer = _deadline.get()
+    if outer is not None:
+        when = min(when, outer)
+    token = _deadline.set(when)
+    try:
+        async with asyncio.timeout_at(when):
+            yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """현재 요청의 남은 처리 시간(초), 기한이 없으면 ``None``"""
+    when = _deadline.get()
+    if when is None:
+        return None
+    return when - asyncio.get_running_loop().time()
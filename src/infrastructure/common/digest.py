@@ -0,0 +1,7 @@
+from typing import Union
+import hashlib
+
+
+def compute_image_digest(image_bytes: Union[bytes, memoryview]) -> str:
+    """프로세스/재시작과 무관하게 동일한 이미지 식별자 (SHA-256 hex)"""
+    return hashlib.sha256(image_bytes).hexdigest()
@@ -0,0 +1,41 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+import multiprocessing
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+def create_cpu_executor(
+    kind: str,
+    workers: int,
+    initializer: Optional[Callable] = None,
+    initargs: Tuple = (),
+    name: str = "cpu-worker",
+) -> Executor:
+    """CPU 작업(이미지 디코딩, 바코드 인식 등)을 이벤트 루프 밖에서 실행할 풀 생성
+
+    ``kind`` 가 ``"process"`` 면 GIL 과 무관하게 병렬 처리되는 프로세스 풀을,
+    그 외에는 스레드 풀을 만듭니다. OpenCV 와 zbar 는 연산 중 GIL 을 해제하므로
+    대부분의 경우 스레드 풀로 충분합니다.
+
+    ``initializer`` 는 작업자(스레드/프로세스)마다 한 번 실행되므로 모델처럼
+    작업자별로 한 번만 불러올 리소스를 준비하는 데 사용합니다.
+    """
+    workers = max(1, workers)
+    if kind == "process":
+        logger.info(f"{name} 프로세스 풀 생성 (workers={workers})")
+        return ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=initializer,
+            initargs=initargs,
+        )
+    logger.info(f"{name} 스레드 풀 생성 (workers={workers})")
+    return ThreadPoolExecutor(
+        max_workers=workers,
+        thread_name_prefix=name,
+        initializer=initializer,
+        initargs=initargs,
+    )
@@ -0,0 +1,51 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+_current_tracker: ContextVar[Optional["RequestMemoryTracker"]] = ContextVar(
+    "request_memory_tracker", default=None
+)
+
+
+class RequestMemoryTracker:
+    """요청 하나가 동시에 붙잡고 있는 큰 버퍼(업로드, 디코딩 비트맵 등)의 크기 집계
+
+    실제 RSS 측정이 아니라, 파이프라인 각 단계가 보고한 버퍼 크기의 합으로
+    요청당 최대 메모리 사용량을 추정합니다. 컨테이너 메모리 산정에 사용합니다.
+    """
+
+    def __init__(self):
+        self._allocations: Dict[str, int] = {}
+        self.current_bytes = 0
+        self.peak_bytes = 0
+
+    def allocate(self, label: str, nbytes: int) -> None:
+        self.current_bytes += nbytes - self._allocations.get(label, 0)
+        self._allocations[label] = nbytes
+        self.peak_bytes = max(self.peak_bytes, self.current_bytes)
+
+    def release(self, label: str) -> None:
+        self.current_bytes -= self._allocations.pop(label, 0)
+
+
+@contextmanager
+def memory_tracking():
+    """현재 컨텍스트(및 여기서 생성한 태스크)에 메모리 집계기를 설정"""
+    tracker = RequestMemoryTracker()
+    token = _current_tracker.set(tracker)
+    try:
+        yield tracker
+    finally:
+        _current_tracker.reset(token)
+
+
+def track_allocation(label: str, nbytes: int) -> None:
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.allocate(label, nbytes)
+
+
+def release_allocation(label: str) -> None:
+    tracker = _current_tracker.get()
+    if tracker is not None:
+        tracker.release(label)
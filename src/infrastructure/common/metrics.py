@@ -0,0 +1,219 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import time
+from src.config import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+TOKEN_BUCKETS = (100, 250, 500, 1000, 2000, 4000, 8000, 16000)
+
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar(
+    "request_stage_timings", default=None
+)
+
+
+class _Histogram:
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.count += 1
+
+
+class MetricsRegistry:
+    """Prometheus 텍스트 형식으로 내보내는 프로세스 내 카운터/히스토그램 모음
+
+    ``enabled`` 가 ``False`` 면 모든 기록 함수가 플래그 확인만 하고 반환하며,
+    ``stage()`` 는 아무 일도 하지 않는 공용 컨텍스트 매니저를 돌려줍니다.
+    uvicorn 워커가 여러 개면 워커별로 따로 집계됩니다.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        self._histograms: Dict[Tuple[str, Tuple], _Histogram] = {}
+        self._help: Dict[str, Tuple[str, str]] = {}
+
+    def describe(self, name: str, kind: str, help_text: str) -> None:
+        self._help[name] = (kind, help_text)
+
+    def increment(self, name: str, amount: float = 1, **labels) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+        **labels,
+    ) -> None:
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = _Histogram(buckets)
+        histogram.observe(value)
+
+    def stage(self, name: str):
+        """단계 소요 시간을 히스토그램과 요청별 Server-Timing 에 기록"""
+        if not self.enabled:
+            return _NOOP_TIMER
+        return _StageTimer(self, name)
+
+    def observe_stage(self, name: str, seconds: float) -> None:
+        self.observe("student_card_stage_seconds", seconds, stage=name)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + seconds
+
+    def render(self, samples: Iterable[Tuple[str, str, str, float]] = ()) -> str:
+        """레지스트리 값과 호출 시점에 수집한 ``(이름, 종류, 설명, 값)`` 샘플을 함께 출력"""
+        lines: List[str] = []
+        described = set()
+
+        def header(name: str, default_kind: str) -> None:
+            if name in described:
+                return
+            described.add(name)
+            kind, help_text = self._help.get(name, (default_kind, ""))
+            if help_text:
+                lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        for (name, labels), value in sorted(self._counters.items()):
+            header(name, "counter")
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+        for (name, labels), histogram in sorted(self._histograms.items()):
+            header(name, "histogram")
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                bucket_labels = labels + (("le", _format_value(bound)),)
+                lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {cumulative}")
+            bucket_labels = labels + (("le", "+Inf"),)
+            lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {histogram.count}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.total)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+
+        for name, kind, help_text, value in samples:
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.append(f"{name} {_format_value(value)}")
+
+        return "\n".join(lines) + "\n"
+
+
+class _StageTimer:
+    __slots__ = ("_registry", "_name", "_started")
+
+    def __init__(self, registry: MetricsRegistry, name: str):
+        self._registry = registry
+        self._name = name
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._registry.observe_stage(self._name, time.perf_counter() - self._started)
+        return False
+
+
+class _NoopTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NOOP_TIMER = _NoopTimer()
+
+
+@contextmanager
+def request_timings():
+    """현재 컨텍스트(및 여기서 생성한 태스크)의 단계 소요 시간 집계 (Server-Timing 용)"""
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        _request_timings.reset(token)
+
+
+def format_server_timing(timings: Dict[str, float]) -> str:
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.1f}" for name, seconds in timings.items()
+    )
+
+
+def _format_labels(labels: Tuple) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels) + "}"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# 프로세스 전역 레지스트리
+metrics = MetricsRegistry(enabled=settings.metrics_enabled)
+
+metrics.describe(
+    "student_card_stage_seconds", "histogram", "학생증 분석 단계별 소요 시간(초)"
+)
+metrics.describe(
+    "student_card_cache_lookups_total", "counter", "분석 캐시 조회 결과 (tier/result)"
+)
+metrics.describe(
+    "student_card_coalesced_requests_total", "counter", "진행 중인 동일 이미지 분석에 합류한 요청 수"
+)
+metrics.describe(
+    "student_card_ocr_retries_total", "counter", "LLM 호출 재시도 횟수 (reason)"
+)
+metrics.describe(
+    "student_card_ocr_retries_skipped_total",
+    "counter",
+    "재시도하지 않고 실패로 끝낸 LLM 호출 수 (reason=attempts/deadline/budget)",
+)
+metrics.describe(
+    "student_card_llm_hedges_total", "counter", "응답 지연으로 보낸 헤지 LLM 호출 수"
+)
+metrics.describe(
+    "student_card_llm_hedge_wins_total", "counter", "헤지 호출이 먼저 성공한 횟수"
+)
+metrics.describe(
+    "student_card_barcode_failures_total", "counter", "바코드 인식 실패 횟수"
+)
+metrics.describe(
+    "student_card_parse_failures_total", "counter", "LLM 응답 파싱 실패 횟수"
+)
+metrics.describe(
+    "student_card_extraction_tier_total", "counter", "학생 정보를 읽어낸 단계 (tier=ocr/llm)"
+)
+metrics.describe(
+    "student_card_ocr_escalations_total", "counter", "로컬 OCR 결과를 쓰지 못해 GPT-4o 로 넘긴 횟수 (reason)"
+)
+metrics.describe(
+    "student_card_llm_tokens", "histogram", "요청당 LLM 토큰 사용량 (kind=prompt/completion)"
+)
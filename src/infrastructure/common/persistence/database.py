@@ -1,6 +1,8 @@
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy import text
 from sqlalchemy.orm import sessionmaker, declarative_base
 from src.config import settings
+import asyncio
 import logging
 
 # 로거 설정
@@ -26,3 +28,12 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+async def warm_up_connections(connections: int) -> None:
+    """연결 풀에 ``connections`` 개의 연결을 미리 열어 첫 요청의 연결 비용 제거"""
+    async def ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(max(1, connections))))
@@ -0,0 +1,57 @@
+from collections import deque
+from typing import Optional
+
+
+class RetryBudget:
+    """프로세스 전체에서 공유하는 재시도 토큰 예산
+
+    원래 호출마다 ``ratio`` 개의 토큰이 쌓이고(최대 ``max_tokens``), 재시도나
+    헤지 호출은 토큰 1개를 써야 실행됩니다. 장애로 모든 호출이 실패해도 추가
+    호출은 원래 호출의 ``ratio`` 배(와 처음 쌓여 있던 ``max_tokens``)를 넘지 않으므로
+    재시도가 장애를 키우지 않습니다.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float):
+        self._ratio = max(0.0, ratio)
+        self._max_tokens = max(0.0, max_tokens)
+        self._tokens = self._max_tokens
+
+        # 누적 카운터
+        self.withdrawn_total = 0
+        self.exhausted_total = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(self._max_tokens, self._tokens + self._ratio)
+
+    def try_withdraw(self) -> bool:
+        if self._tokens < 1:
+            self.exhausted_total += 1
+            return False
+        self._tokens -= 1
+        self.withdrawn_total += 1
+        return True
+
+
+class LatencyTracker:
+    """최근 ``window`` 개 호출 소요 시간의 분위수 추정
+
+    표본이 ``min_samples`` 개보다 적으면 분위수를 알 수 없다고 보고 ``None`` 을 반환합니다.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self._samples = deque(maxlen=max(1, window))
+        self._min_samples = max(1, min_samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        if len(self._samples) < self._min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, int(round(q * (len(ordered) - 1)))))
+        return ordered[index]
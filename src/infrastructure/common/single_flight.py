@@ -0,0 +1,71 @@
+from typing import Awaitable, Callable, Dict, Generic, Tuple, TypeVar
+import asyncio
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight(Generic[T]):
+    """같은 키로 동시에 들어온 작업을 하나의 실행으로 합침 (프로세스 내)
+
+    처음 들어온 호출(leader)이 작업을 별도 태스크로 시작하고, 작업이 끝나기 전에
+    같은 키로 들어온 호출(follower)은 새로 실행하지 않고 그 결과(또는 예외)를
+    함께 받습니다. 호출자는 ``asyncio.shield`` 로 기다리므로 일부 호출자가
+    취소되어도(클라이언트 연결 끊김, 요청 기한 초과) 남은 대기자를 위해 작업은
+    계속됩니다. 마지막 대기자까지 취소되면 작업도 취소하고 끝날 때까지 기다리므로
+    아무도 받지 않을 결과를 위해 LLM 호출과 처리 슬롯을 붙잡지 않습니다.
+    작업이 끝나면 키를 지우므로 결과를 보관하지는 않습니다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[str, _Flight] = {}
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    async def run(
+        self, key: str, factory: Callable[[], Awaitable[T]]
+    ) -> Tuple[T, bool]:
+        """작업 결과와 이 호출이 leader 였는지 여부를 반환"""
+        flight = self._flights.get(key)
+        leader = flight is None
+        if leader:
+            flight = self._flights[key] = _Flight(asyncio.create_task(factory()))
+            flight.task.add_done_callback(lambda done: self._forget(key, done))
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), leader
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                await self._abandon(key, flight)
+            raise
+
+    async def _abandon(self, key: str, flight: _Flight) -> None:
+        """기다리는 호출자가 없는 작업 취소 (새 호출은 취소 중인 작업에 합류하지 않음)"""
+        logger.info(f"합쳐진 작업을 기다리는 요청이 없어 취소 ({key[:12]})")
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+        flight.task.cancel()
+        await asyncio.wait({flight.task})
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        # 모든 대기자가 먼저 취소된 경우에도 예외가 "never retrieved" 로 남지 않게 확인
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"합쳐진 작업 실패 ({key[:12]}): {str(task.exception())}")
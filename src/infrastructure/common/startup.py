@@ -0,0 +1,62 @@
+from contextlib import contextmanager
+from typing import Dict, Optional
+import logging
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class StartupState:
+    """프로세스 시작(import → warm-up → ready) 진행 상태와 단계별 소요 시간
+
+    ``started_at`` 은 ``src.main`` import 를 시작한 시점의 ``time.perf_counter()``
+    값이며, ``/ready`` 와 ``/metrics`` 는 이 객체를 읽어 준비 여부와
+    time-to-ready 를 보고합니다.
+    """
+
+    def __init__(self, started_at: float):
+        self.started_at = started_at
+        self.phase = "starting"
+        self.steps: Dict[str, float] = {}
+        self.attempts = 0
+        self.last_error: Optional[str] = None
+        self.import_seconds: Optional[float] = None
+        self.ready_seconds: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.phase == "ready"
+
+    def mark_imported(self) -> None:
+        self.import_seconds = time.perf_counter() - self.started_at
+
+    @contextmanager
+    def step(self, name: str):
+        """warm-up 단계 하나의 소요 시간 기록 (실패하면 오류를 남기고 예외 전파)"""
+        self.phase = name
+        started = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.last_error = f"{name}: {str(e)}"
+            raise
+        self.steps[name] = time.perf_counter() - started
+        logger.info(f"warm-up 단계 완료: {name} ({self.steps[name]:.3f}s)")
+
+    def mark_ready(self) -> None:
+        self.phase = "ready"
+        self.last_error = None
+        self.ready_seconds = time.perf_counter() - self.started_at
+        logger.info(f"서비스 준비 완료 (시작 후 {self.ready_seconds:.3f}s)")
+
+    def snapshot(self) -> dict:
+        return {
+            "phase": self.phase,
+            "ready": self.ready,
+            "attempts": self.attempts,
+            "last_error": self.last_error,
+            "import_seconds": self.import_seconds,
+            "ready_seconds": self.ready_seconds,
+            "steps": dict(self.steps),
+        }
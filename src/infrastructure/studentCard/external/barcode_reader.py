@@ -1,26 +1,201 @@
-from abc import ABC, abstractmethod
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List, Optional, Union
+import asyncio
 import cv2
+import logging
 import numpy as np
+import time
 from pyzbar.pyzbar import decode
+from src.infrastructure.studentCard.external.image_preprocessor import downscale_image
+from src.infrastructure.studentCard.external.interfaces import BarcodeReaderInterface
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BarcodeResult:
+    """바코드 인식 결과와 단계별 소요 시간(ms)"""
+
+    data: str = ""
+    strategy: Optional[str] = None
+    timings: Dict[str, float] = field(default_factory=dict)
 
-class BarcodeReaderInterface(ABC):
-    @abstractmethod
-    async def extract_barcode(self, image_bytes: bytes) -> str:
-        pass
 
 class BarcodeReader(BarcodeReaderInterface):
+    """CPU 풀에서 다단계 디코딩 파이프라인을 실행하는 바코드 리더
+
+    이미지 디코딩과 zbar 호출은 수백 ms 가 걸릴 수 있으므로 이벤트 루프가 아닌
+    ``executor`` 에서 실행합니다. ``executor`` 가 없으면 기본 스레드 풀을 사용합니다.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_edge: int = 1024):
+        self._executor = executor
+        self._max_edge = max_edge
+        # 프로세스 풀에는 memoryview 를 넘길 수 없으므로 bytes 로 복사
+        self._copy_payload = isinstance(executor, ProcessPoolExecutor)
+
     async def extract_barcode(self, image_bytes: bytes) -> str:
-        # 바이트를 numpy 배열로 변환
-        nparr = np.frombuffer(image_bytes, np.uint8)
-        image = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
-        
-        # 이미지 전처리
+        result = await self.scan(image_bytes)
+        return result.data
+
+    async def extract_barcode_from_image(self, image: np.ndarray) -> str:
+        result = await self.scan_image(image)
+        return result.data
+
+    async def scan(self, image_bytes: Union[bytes, memoryview]) -> BarcodeResult:
+        if self._copy_payload:
+            image_bytes = bytes(image_bytes)
+        return await self._run(partial(scan_image_bytes, image_bytes, self._max_edge))
+
+    async def scan_image(self, image: np.ndarray) -> BarcodeResult:
+        return await self._run(partial(scan_decoded_image, image, self._max_edge))
+
+    async def _run(self, job) -> BarcodeResult:
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(self._executor, job)
+        if result.data:
+            logger.info(
+                f"바코드 인식 성공 (strategy={result.strategy}, timings={result.timings})"
+            )
+        else:
+            logger.warning(f"바코드 인식 실패 (timings={result.timings})")
+        return result
+
+
+def scan_image_bytes(image_bytes: Union[bytes, memoryview], max_edge: int) -> BarcodeResult:
+    """인코딩된 이미지를 디코딩한 뒤 파이프라인 실행 (작업자 풀에서 호출)"""
+    started = time.perf_counter()
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    gray = cv2.imdecode(nparr, cv2.IMREAD_GRAYSCALE)
+    decode_ms = _elapsed_ms(started)
+
+    if gray is None:
+        return BarcodeResult(timings={"decode": decode_ms})
+
+    result = scan_gray_image(gray, max_edge)
+    result.timings = {"decode": decode_ms, **result.timings}
+    return result
+
+
+def scan_decoded_image(image: np.ndarray, max_edge: int) -> BarcodeResult:
+    """디코딩된 BGR/grayscale 배열에서 파이프라인 실행 (작업자 풀에서 호출)"""
+    if image.ndim == 3:
+        started = time.perf_counter()
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        blurred = cv2.GaussianBlur(gray, (5, 5), 0)
-        _, binary = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-        # 바코드 디코딩
-        barcodes = decode(binary)
-        if barcodes:
-            return barcodes[0].data.decode('utf-8')
-        return "" 
\ No newline at end of file
+        grayscale_ms = _elapsed_ms(started)
+        result = scan_gray_image(gray, max_edge)
+        result.timings = {"grayscale": grayscale_ms, **result.timings}
+        return result
+    return scan_gray_image(image, max_edge)
+
+
+def scan_gray_image(gray: np.ndarray, max_edge: int) -> BarcodeResult:
+    """비용이 낮은 전략부터 차례로 시도하고 처음 성공한 결과를 반환
+
+    마지막 단계는 기존 리더와 같은 원본 해상도 Otsu 이진화입니다. 축소 과정에서
+    가는 막대가 뭉개진 이미지도 이전과 같은 조건으로 한 번 더 시도합니다.
+    """
+    small = downscale_image(gray, max_edge)
+    strategies: List[tuple] = [
+        ("downscaled", lambda: _try_decode(small)),
+        ("localized", lambda: _decode_localized(gray, small)),
+        ("adaptive_threshold", lambda: _decode_thresholded(small)),
+        ("rotation", lambda: _decode_rotated(small)),
+    ]
+    if small is not gray:
+        # 축소하지 않았다면 adaptive_threshold 단계에서 이미 같은 이미지를 시도함
+        strategies.append(("full_resolution", lambda: _try_decode(_otsu(gray))))
+
+    timings: Dict[str, float] = {}
+    for name, strategy in strategies:
+        started = time.perf_counter()
+        data = strategy()
+        timings[name] = _elapsed_ms(started)
+        if data:
+            return BarcodeResult(data=data, strategy=name, timings=timings)
+    return BarcodeResult(timings=timings)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 2)
+
+
+def _try_decode(image: np.ndarray) -> str:
+    barcodes = decode(image)
+    if barcodes:
+        return barcodes[0].data.decode("utf-8")
+    return ""
+
+
+def _decode_localized(gray: np.ndarray, small: np.ndarray) -> str:
+    """가로 방향 그래디언트가 강한 영역을 바코드 후보로 보고 원본 해상도로 잘라 인식"""
+    region = _locate_barcode_region(small)
+    if region is None:
+        return ""
+
+    scale = gray.shape[1] / small.shape[1]
+    x, y, w, h = (int(v * scale) for v in region)
+    crop = gray[y : y + h, x : x + w]
+    if crop.size == 0:
+        return ""
+    return _try_decode(crop) or _try_decode(_otsu(crop))
+
+
+def _locate_barcode_region(gray: np.ndarray) -> Optional[tuple]:
+    grad_x = cv2.Sobel(gray, ddepth=cv2.CV_32F, dx=1, dy=0, ksize=-1)
+    grad_y = cv2.Sobel(gray, ddepth=cv2.CV_32F, dx=0, dy=1, ksize=-1)
+    gradient = cv2.convertScaleAbs(cv2.subtract(grad_x, grad_y))
+
+    blurred = cv2.blur(gradient, (9, 9))
+    _, thresh = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (21, 7))
+    closed = cv2.morphologyEx(thresh, cv2.MORPH_CLOSE, kernel)
+    closed = cv2.erode(closed, None, iterations=4)
+    closed = cv2.dilate(closed, None, iterations=4)
+
+    contours, _ = cv2.findContours(closed, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+    if not contours:
+        return None
+
+    x, y, w, h = cv2.boundingRect(max(contours, key=cv2.contourArea))
+    # 조용한 영역(quiet zone)이 잘리지 않도록 여백 추가
+    pad_x, pad_y = int(w * 0.1) + 4, int(h * 0.2) + 4
+    height, width = gray.shape[:2]
+    x0, y0 = max(0, x - pad_x), max(0, y - pad_y)
+    x1, y1 = min(width, x + w + pad_x), min(height, y + h + pad_y)
+    return x0, y0, x1 - x0, y1 - y0
+
+
+def _otsu(gray: np.ndarray) -> np.ndarray:
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    _, binary = cv2.threshold(blurred, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    return binary
+
+
+def _decode_thresholded(gray: np.ndarray) -> str:
+    """조명이 고르지 않은 사진을 위해 Otsu 와 적응형 이진화를 시도"""
+    data = _try_decode(_otsu(gray))
+    if data:
+        return data
+    adaptive = cv2.adaptiveThreshold(
+        gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 31, 10
+    )
+    return _try_decode(adaptive)
+
+
+def _decode_rotated(gray: np.ndarray) -> str:
+    """기울어진 학생증을 위해 몇 가지 각도로 회전해 시도"""
+    height, width = gray.shape[:2]
+    center = (width / 2, height / 2)
+    for angle in (-15, 15, -30, 30, 45, -45):
+        matrix = cv2.getRotationMatrix2D(center, angle, 1.0)
+        rotated = cv2.warpAffine(
+            gray, matrix, (width, height), borderMode=cv2.BORDER_REPLICATE
+        )
+        data = _try_decode(rotated)
+        if data:
+            return data
+    return ""
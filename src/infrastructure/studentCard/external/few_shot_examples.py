@@ -0,0 +1,81 @@
+from collections import OrderedDict
+from typing import Optional
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+import json
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class FewShotExampleStore:
+    """프롬프트에 넣을 대표 분석 사례를 학과별로 하나씩 메모리에 보관
+
+    새 분석 결과가 저장될 때마다 ``add()`` 로 갱신되며, 최근에 갱신된 학과부터
+    ``max_examples`` 개까지 유지합니다. 렌더링된 프롬프트 문자열은 변경이 있을 때만
+    다시 만들기 때문에 요청 경로에서는 Chroma 조회나 임베딩 호출이 일어나지 않습니다.
+    """
+
+    def __init__(self, max_examples: int = 3):
+        self._max_examples = max(0, max_examples)
+        self._examples: "OrderedDict[str, dict]" = OrderedDict()
+        self._rendered: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._examples)
+
+    def add(self, result: StudentCardInfo) -> None:
+        if self._max_examples == 0:
+            return
+        if not (result.name and result.department and result.year):
+            return
+
+        self._examples[result.department] = {"analysis_result": result.model_dump()}
+        self._examples.move_to_end(result.department)
+        while len(self._examples) > self._max_examples:
+            self._examples.popitem(last=False)
+        self._rendered = None
+
+    def add_document(self, page_content: str) -> None:
+        """벡터 DB 에 저장된 분석 문서(JSON)에서 사례 복원"""
+        try:
+            analysis_result = json.loads(page_content)["analysis_result"]
+            self.add(StudentCardInfo(**analysis_result))
+        except Exception:
+            # 형식이 다른 오래된 문서는 건너뜀
+            return
+
+    def load_from_vectorstore(self, vectorstore, limit: int) -> None:
+        """시작 시 한 번 기존 분석 문서 중 최근 ``limit`` 개로 사례를 채움
+
+        메타데이터의 ``created_at`` (저장 시각, epoch 초) 순으로 정렬하며, 이 값이
+        없는 이전 문서는 가장 오래된 문서로 봅니다. 메타데이터만 먼저 읽고 본문은
+        고른 문서만 읽습니다.
+        """
+        try:
+            index = vectorstore.get(
+                where={"type": "student_card_analysis"}, include=["metadatas"]
+            )
+            created_at = {
+                document_id: (metadata or {}).get("created_at", 0)
+                for document_id, metadata in zip(index["ids"], index["metadatas"])
+            }
+            recent = sorted(created_at, key=created_at.get)[-limit:] if limit > 0 else []
+            if recent:
+                data = vectorstore.get(ids=recent, include=["documents"])
+                documents = dict(zip(data["ids"], data["documents"]))
+                # 오래된 문서부터 추가해야 최근 학과가 남음
+                for document_id in recent:
+                    if documents.get(document_id):
+                        self.add_document(documents[document_id])
+            logger.info(f"few-shot 사례 {len(self)}개 로드 (문서 {len(created_at)}개 중)")
+        except Exception as e:
+            logger.error(f"few-shot 사례 로드 중 오류: {e}")
+
+    def render(self) -> str:
+        if self._rendered is None:
+            self._rendered = "\n".join(
+                json.dumps(example, ensure_ascii=False)
+                for example in reversed(self._examples.values())
+            )
+        return self._rendered
@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
 from langchain.output_parsers import PydanticOutputParser
@@ -8,11 +7,31 @@ from langchain_core.documents import Document
 from langchain_core.memory import BaseMemory
 from dotenv import load_dotenv
 import base64
+import httpx
 import json
+import openai
 import os
+from src.config import settings
+from src.infrastructure.common.digest import compute_image_digest
+from src.infrastructure.common.memory import track_allocation
+from src.infrastructure.common.metrics import TOKEN_BUCKETS, metrics
 from src.domain.studentCard.dto.schemas import StudentCardInfo
-from typing import List
+from src.domain.studentCard.exception.exceptions import (
+    OCRRetryableException,
+    UpstreamServiceException,
+)
+from src.infrastructure.studentCard.external.interfaces import (
+    GPTVisionReaderInterface,
+)
+from src.infrastructure.studentCard.external.few_shot_examples import (
+    FewShotExampleStore,
+)
+from src.infrastructure.studentCard.external.vectorstore_writer import (
+    VectorStoreWriter,
+)
+from typing import List, Optional, Tuple
 import logging
+import time
 
 
 # 환경 변수 로드
@@ -22,28 +41,107 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 
 
-class GPTVisionReaderInterface(ABC):
-    @abstractmethod
-    async def extract_info(self, image_bytes: bytes) -> StudentCardInfo:
-        pass
+def _create_openai_clients(api_key: str) -> Tuple[openai.OpenAI, openai.AsyncOpenAI]:
+    """keep-alive 연결 풀이 설정된 OpenAI 동기/비동기 클라이언트 생성"""
+    limits = httpx.Limits(
+        max_connections=settings.openai_max_connections,
+        max_keepalive_connections=settings.openai_max_keepalive_connections,
+        keepalive_expiry=settings.openai_keepalive_expiry,
+    )
+    timeout = httpx.Timeout(settings.request_timeout, connect=5.0)
+
+    client = openai.OpenAI(
+        api_key=api_key,
+        base_url=settings.OPENAI_BASE_URL,
+        http_client=httpx.Client(limits=limits, timeout=timeout),
+    )
+    async_client = openai.AsyncOpenAI(
+        api_key=api_key,
+        base_url=settings.OPENAI_BASE_URL,
+        http_client=httpx.AsyncClient(limits=limits, timeout=timeout),
+    )
+    return client, async_client
+
+
+def _record_token_usage(llm_output: Optional[dict]) -> None:
+    """응답의 prompt/completion 토큰 수를 요청 단위 히스토그램에 기록"""
+    usage = (llm_output or {}).get("token_usage") or {}
+    for kind in ("prompt", "completion"):
+        tokens = usage.get(f"{kind}_tokens")
+        if tokens is not None:
+            metrics.observe("student_card_llm_tokens", tokens, TOKEN_BUCKETS, kind=kind)
+
+
+def _retry_after(response: Optional[httpx.Response]) -> Optional[float]:
+    """``Retry-After`` 헤더(초) 값, 없거나 숫자가 아니면 ``None``"""
+    if response is None:
+        return None
+    try:
+        return float(response.headers.get("retry-after", ""))
+    except ValueError:
+        return None
+
+
+def _to_ocr_exception(error: openai.APIError) -> Exception:
+    """OpenAI SDK 예외를 재시도 가능 여부가 드러나는 도메인 예외로 변환"""
+    if isinstance(error, openai.APITimeoutError):
+        return OCRRetryableException("GPT request timed out", "timeout")
+    if isinstance(error, openai.APIConnectionError):
+        return OCRRetryableException(f"Could not reach GPT API: {str(error)}", "connection")
+    if isinstance(error, openai.RateLimitError):
+        return OCRRetryableException(
+            "GPT API rate limit exceeded", "rate_limit", _retry_after(error.response)
+        )
+    if isinstance(error, openai.InternalServerError):
+        return OCRRetryableException(
+            f"GPT API server error ({error.status_code})",
+            "server_error",
+            _retry_after(error.response),
+        )
+    # 400/401/403/404 등은 API 키, 권한, 모델 설정 문제라 다시 시도해도 실패함
+    return UpstreamServiceException(
+        f"GPT API rejected the request: {str(error)}",
+        getattr(error, "status_code", None),
+    )
+
+
+def _to_data_url(image_bytes: bytes, mime_type: str) -> str:
+    """이미지를 base64 data URL 로 변환 (중간 문자열 없이 한 번에 조립)"""
+    prefix = f"data:{mime_type};base64,".encode("ascii")
+    encoded = bytearray(prefix)
+    encoded += base64.b64encode(image_bytes)
+    track_allocation("data_url", len(encoded))
+    return encoded.decode("ascii")
 
 
 class GPTVisionReader(GPTVisionReaderInterface):
+    """GPT-4o 기반 학생증 리더
+
+    OpenAI HTTP 클라이언트와 Chroma 컬렉션을 여는 비용이 크기 때문에
+    애플리케이션 lifespan 에서 한 번만 생성해 모든 요청이 공유합니다.
+    종료 시에는 ``aclose()`` 로 연결 풀을 정리해야 합니다.
+    """
+
     def __init__(self):
         if not os.getenv("OPENAI_API_KEY"):
             raise ValueError("OPENAI_API_KEY 환경변수가 설정되지 않았습니다")
 
         logger.info("GPTVisionReader 초기화 시작")
 
-        # 캐시 초기화
-        self._cache = {}
+        # keep-alive 연결 풀을 공유하는 OpenAI 클라이언트 (chat, embeddings 공용)
+        self._client, self._async_client = _create_openai_clients(
+            os.getenv("OPENAI_API_KEY")
+        )
 
         # LLM 설정
         self.llm = ChatOpenAI(
-            model="gpt-4o",
-            temperature=0,
-            max_tokens=1000,
+            model=settings.openai_model,
+            temperature=settings.openai_temperature,
+            max_tokens=settings.openai_max_tokens,
             api_key=os.getenv("OPENAI_API_KEY"),
+            # 재시도는 ResilientCardReader 가 처리 기한과 예산을 보고 결정하므로 SDK 재시도는 끔
+            client=self._client.with_options(max_retries=0).chat.completions,
+            async_client=self._async_client.with_options(max_retries=0).chat.completions,
         )
 
         # Parser 설정
@@ -54,45 +152,112 @@ class GPTVisionReader(GPTVisionReaderInterface):
         os.makedirs(persist_directory, exist_ok=True)
 
         self.embeddings = OpenAIEmbeddings(
-            openai_api_key=os.getenv("OPENAI_API_KEY"), disallowed_special=()
+            openai_api_key=os.getenv("OPENAI_API_KEY"),
+            disallowed_special=(),
+            client=self._client.embeddings,
+            async_client=self._async_client.embeddings,
         )
 
         try:
             self.vectorstore = Chroma(
-                collection_name="student_card_analysis",
+                collection_name=settings.vector_db_collection,
                 embedding_function=self.embeddings,
                 persist_directory=persist_directory,
             )
-
-            # 메모리 초기화
-            self.memory = CustomVectorStoreMemory(vectorstore=self.vectorstore)
-
         except Exception as e:
             print(f"Vector store 초기화 오류: {e}")
             # 기본 vectorstore 생성
             self.vectorstore = Chroma(
-                collection_name="student_card_analysis",
+                collection_name=settings.vector_db_collection,
                 embedding_function=self.embeddings,
             )
-            self.memory = CustomVectorStoreMemory(vectorstore=self.vectorstore)
+
+        # 메모리 초기화 (기존 분석 문서에서 few-shot 사례를 한 번만 복원)
+        examples = FewShotExampleStore(max_examples=settings.few_shot_max_examples)
+        examples.load_from_vectorstore(self.vectorstore, settings.few_shot_seed_limit)
+        self.memory = CustomVectorStoreMemory(
+            vectorstore=self.vectorstore, examples=examples
+        )
+
+        # 분석 결과는 백그라운드에서 모아서 기록
+        self.vectorstore_writer = VectorStoreWriter(
+            self.vectorstore,
+            max_queue=settings.vector_write_queue_size,
+            batch_size=settings.vector_write_batch_size,
+            flush_interval=settings.vector_write_flush_interval,
+            overflow_policy=settings.vector_write_overflow_policy,
+        )
 
         logger.info("GPTVisionReader 초기화 완료")
 
-    async def extract_info(self, image_bytes: bytes) -> StudentCardInfo:
+    async def warm_up(self) -> None:
+        """첫 분석 요청이 TCP/TLS 연결 비용을 치르지 않도록 연결 풀에 연결을 열어둠"""
+        try:
+            await self._async_client.get("/models", cast_to=httpx.Response)
+            logger.info("OpenAI 연결 warm-up 완료")
+        except Exception as e:
+            # 연결 준비는 최선 노력이며 실패해도 요청 처리는 가능
+            logger.warning(f"OpenAI 연결 warm-up 실패: {str(e)}")
+
+    async def aclose(self) -> None:
+        """대기 중인 벡터 DB 기록을 마친 뒤 공유 HTTP 연결 풀 종료"""
+        await self.vectorstore_writer.stop()
+        await self._async_client.close()
+        self._client.close()
+        logger.info("GPTVisionReader 연결 종료")
+
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
+        """GPT-4o 로 학생 정보 추출
+
+        다시 시도하면 성공할 수 있는 실패(시간 초과, 연결 오류, 429, 5xx, 빈 응답,
+        파싱 실패)는 ``OCRRetryableException``, 그 밖의 API 오류(인증, 권한, 잘못된
+        요청 등)는 ``UpstreamServiceException`` 으로 알립니다.
+        """
+        with metrics.stage("prompt_build"):
+            messages = await self._build_messages(image_bytes, mime_type)
+
+        # GPT로 정보 추출 (토큰 사용량을 받기 위해 agenerate 사용)
+        try:
+            with metrics.stage("llm"):
+                generation = await self.llm.agenerate([messages])
+        except openai.APIError as e:
+            raise _to_ocr_exception(e) from e
+        response = generation.generations[0][0].message
+        _record_token_usage(generation.llm_output)
+
+        if not response.content or response.content.isspace():
+            logger.error("GPT가 빈 응답을 반환했습니다")
+            metrics.increment("student_card_parse_failures_total")
+            raise OCRRetryableException("GPT returned an empty response", "empty")
+
         try:
-            # 캐시 확인
-            image_hash = str(hash(image_bytes))
-            if image_hash in self._cache:
-                return self._cache[image_hash]
+            # 응답 파싱
+            with metrics.stage("parse"):
+                result = self.parser.parse(response.content)
+        except Exception as e:
+            logger.error(f"GPT Vision 응답 파싱 실패: {str(e)}")
+            logger.error(f"Raw response: {response.content}")
+            metrics.increment("student_card_parse_failures_total")
+            raise OCRRetryableException(
+                f"Could not parse GPT response: {str(e)}", "parse"
+            ) from e
+
+        # 분석 결과 저장
+        self._save_to_vectorstore(image_bytes, result)
 
-            # 벡터 DB 검색 최적화
-            similar_cases = await self.memory.load_memory_variables({})
+        return result
 
-            # 이미지를 base64로 인코딩
-            base64_image = base64.b64encode(image_bytes).decode("utf-8")
+    async def _build_messages(self, image_bytes: bytes, mime_type: str) -> list:
+        # 메모리에 보관된 few-shot 사례 (I/O 없음)
+        similar_cases = await self.memory.load_memory_variables({})
 
-            # 프롬프트 준비 (수정된 부분)
-            system_prompt = """
+        # 축소/재인코딩된 이미지를 data URL 로 한 번만 인코딩
+        image_url = _to_data_url(image_bytes, mime_type)
+
+        # 프롬프트 준비 (수정된 부분)
+        system_prompt = """
 당신은 학생증 이미지를 분석하여 정확한 학생 정보를 추출하는 전문가입니다.
 이미지에서 다음 정보를 찾아 정확하게 추출해주세요.
 
@@ -108,63 +273,34 @@ class GPTVisionReader(GPTVisionReaderInterface):
 - 불확실한 정보는 빈 값으로 남겨두세요
 """
 
-            format_instructions = self.parser.get_format_instructions()
-            prompt_with_format = system_prompt + "\n" + format_instructions
-
-            # 이전 분석 결과 추가
-            if similar_cases.get("chat_history"):
-                prompt_with_format += (
-                    "\n\n참고할 만한 이전 분석 사례:\n" + similar_cases["chat_history"]
-                )
-
-            # 메시지 구성
-            messages = [
-                SystemMessage(content=prompt_with_format),
-                HumanMessage(
-                    content=[
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/jpeg;base64,{base64_image}"
-                            },
-                        }
-                    ]
-                ),
-            ]
-
-            # GPT로 정보 추출
-            response = await self.llm.ainvoke(messages)
-
-            if not response.content or response.content.isspace():
-                logger.error("GPT가 빈 응답을 반환했습니다")
-                return StudentCardInfo(
-                    name="", department="", year=0, student_number=""
-                )
-
-            try:
-                # 응답 파싱
-                result = self.parser.parse(response.content)
+        format_instructions = self.parser.get_format_instructions()
+        prompt_with_format = system_prompt + "\n" + format_instructions
 
-                # 분석 결과 저장
-                self._save_to_vectorstore(image_bytes, result)
-
-                return result
-            except Exception as e:
-                logger.error(f"GPT Vision 응답 파싱 실패: {str(e)}")
-                logger.error(f"Raw response: {response.content}")
-                return StudentCardInfo(
-                    name="", department="", year=0, student_number=""
-                )
+        # 이전 분석 결과 추가
+        if similar_cases.get("chat_history"):
+            prompt_with_format += (
+                "\n\n참고할 만한 이전 분석 사례:\n" + similar_cases["chat_history"]
+            )
 
-        except Exception as e:
-            logger.error(f"OCR 처리 중 예외 발생: {str(e)}")
-            return StudentCardInfo(name="", department="", year=0, student_number="")
+        # 메시지 구성
+        messages = [
+            SystemMessage(content=prompt_with_format),
+            HumanMessage(
+                content=[
+                    {
+                        "type": "image_url",
+                        "image_url": {"url": image_url},
+                    }
+                ]
+            ),
+        ]
+        return messages
 
     def _save_to_vectorstore(self, image_bytes: bytes, result: StudentCardInfo):
         # 분석 결과를 문서화
         doc_content = {
             "analysis_result": result.dict(),
-            "image_hash": str(hash(image_bytes)),  # 간단한 이미지 해시
+            "image_hash": compute_image_digest(image_bytes),
         }
 
         # VectorDB에 저장
@@ -174,23 +310,30 @@ class GPTVisionReader(GPTVisionReaderInterface):
                 "type": "student_card_analysis",
                 "department": result.department,
                 "year": result.year,
+                # 시작 시 최근 사례를 고르는 기준 (epoch 초)
+                "created_at": time.time(),
             },
         )
 
-        self.vectorstore.add_documents([document])
-        self.vectorstore.persist()  # 디스크에 저장
+        # 임베딩/디스크 기록은 write-behind 큐에서 처리
+        self.vectorstore_writer.submit(document)
+
+        # few-shot 사례 갱신
+        self.memory.save_context({}, {"analysis_result": result})
 
 
 class CustomVectorStoreMemory(BaseMemory):
     memory_key: str
     return_messages: bool
     vectorstore: Chroma
+    examples: FewShotExampleStore
 
-    def __init__(self, vectorstore: Chroma):
+    def __init__(self, vectorstore: Chroma, examples: FewShotExampleStore):
         # 일반 객체 속성으로 초기화
         object.__setattr__(self, "memory_key", "chat_history")
         object.__setattr__(self, "return_messages", True)
         object.__setattr__(self, "vectorstore", vectorstore)
+        object.__setattr__(self, "examples", examples)
 
     @property
     def memory_variables(self) -> List[str]:
@@ -198,26 +341,18 @@ class CustomVectorStoreMemory(BaseMemory):
         return [self.memory_key]
 
     async def load_memory_variables(self, inputs: dict) -> dict:
-        """메모리에서 관련 문서 검색"""
+        """메모리에 보관된 대표 분석 사례 반환 (벡터 DB, 임베딩 호출 없음)"""
         try:
-            # 문서가 있는지 먼저 확인
-            collection_size = len(self.vectorstore.get())
-            k = min(3, max(1, collection_size))  # 컬렉션 크기에 따라 k 조정
-
-            if collection_size > 0:
-                docs = self.vectorstore.similarity_search("", k=k)
-                memory_data = "\n".join(doc.page_content for doc in docs)
-            else:
-                memory_data = ""
-
-            return {self.memory_key: memory_data}
+            return {self.memory_key: self.examples.render()}
         except Exception as e:
             logger.error(f"메모리 로드 중 오류: {e}")
             return {self.memory_key: ""}
 
     def save_context(self, inputs: dict, outputs: dict) -> None:
-        """컨텍스트 저장"""
-        pass
+        """새 분석 결과로 대표 사례 갱신"""
+        result = outputs.get("analysis_result")
+        if isinstance(result, StudentCardInfo):
+            self.examples.add(result)
 
     def clear(self) -> None:
         """메모리 초기화"""
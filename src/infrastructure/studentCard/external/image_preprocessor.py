@@ -0,0 +1,247 @@
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Optional, Union
+import asyncio
+import logging
+import numpy as np
+
+# OpenCV 는 import 비용이 크므로 각 함수에서 처음 사용할 때 불러옵니다.
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+_ENCODINGS = {
+    "jpeg": (".jpg", "image/jpeg", "IMWRITE_JPEG_QUALITY"),
+    "webp": (".webp", "image/webp", "IMWRITE_WEBP_QUALITY"),
+}
+
+
+@dataclass
+class PreparedImage:
+    """GPT Vision 에 전달할 재인코딩된 이미지"""
+
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+
+
+class ImagePreprocessor:
+    """업로드 이미지를 한 번만 디코딩하고 LLM 전송용으로 축소/재인코딩
+
+    ``decode()`` 결과(BGR 배열)는 바코드 인식과 ``prepare()`` 가 함께 사용합니다.
+    ``prepare()`` 는 학생증 영역을 잘라내고 방향을 맞춘 뒤 긴 변을 ``max_edge`` 로
+    줄여 JPEG/WebP 로 다시 인코딩합니다. EXIF 회전 정보는 디코딩 시 반영되며,
+    ``orientation`` (``landscape``/``portrait``)을 지정하면 그 방향으로 추가 회전합니다.
+
+    ``decode()`` 는 업로드 버퍼(``bytes``/``memoryview``)를 복사 없이 그대로 읽습니다.
+
+    프로세스 풀에서는 작업자와 주고받는 값이 모두 pickle 되므로 디코딩된 배열을
+    넘기면 이미지 크기(가로x세로x3)만큼의 복사가 단계마다 생깁니다. 이때는
+    ``decodes_in_worker`` 가 참이 되고, 호출자는 ``decode()`` 대신 인코딩된 업로드
+    바이트를 ``prepare_encoded()`` 와 바코드 리더에 각각 넘겨 작업자 안에서 디코딩합니다.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_edge: int = 1280,
+        encode_format: str = "jpeg",
+        quality: int = 85,
+        orientation: str = "",
+    ):
+        if encode_format not in _ENCODINGS:
+            raise ValueError(f"지원하지 않는 인코딩 형식입니다: {encode_format}")
+        self._executor = executor
+        self._max_edge = max_edge
+        self._encode_format = encode_format
+        self._quality = quality
+        self._orientation = orientation
+        self._copy_payload = isinstance(executor, ProcessPoolExecutor)
+
+    @property
+    def decodes_in_worker(self) -> bool:
+        """디코딩된 배열 대신 업로드 바이트를 작업자에 넘겨야 하는지 (프로세스 풀)"""
+        return self._copy_payload
+
+    async def decode(self, image_bytes: Union[bytes, memoryview]) -> Optional[np.ndarray]:
+        if self._copy_payload:
+            image_bytes = bytes(image_bytes)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, partial(decode_image, image_bytes)
+        )
+
+    async def prepare(self, image: np.ndarray, original_size: int) -> PreparedImage:
+        return await self._prepare(partial(prepare_image, image), original_size)
+
+    async def prepare_encoded(
+        self, image_bytes: Union[bytes, memoryview]
+    ) -> Optional[PreparedImage]:
+        """작업자 안에서 디코딩부터 재인코딩까지 실행 (디코딩할 수 없으면 ``None``)"""
+        if self._copy_payload:
+            image_bytes = bytes(image_bytes)
+        return await self._prepare(
+            partial(decode_and_prepare_image, image_bytes), len(image_bytes)
+        )
+
+    async def _prepare(self, job, original_size: int) -> Optional[PreparedImage]:
+        loop = asyncio.get_running_loop()
+        prepared = await loop.run_in_executor(
+            self._executor,
+            partial(
+                job,
+                max_edge=self._max_edge,
+                encode_format=self._encode_format,
+                quality=self._quality,
+                orientation=self._orientation,
+            ),
+        )
+        if prepared is None:
+            return None
+        logger.info(
+            f"이미지 전처리 완료: {original_size} bytes -> {len(prepared.data)} bytes "
+            f"({prepared.width}x{prepared.height}, {prepared.mime_type})"
+        )
+        return prepared
+
+
+def decode_image(image_bytes: Union[bytes, memoryview]) -> Optional[np.ndarray]:
+    """인코딩된 이미지를 BGR 배열로 디코딩 (EXIF 회전 정보 반영, 입력 버퍼는 복사하지 않음)"""
+    import cv2
+
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    return cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+
+
+def decode_and_prepare_image(
+    image_bytes: Union[bytes, memoryview],
+    max_edge: int,
+    encode_format: str,
+    quality: int,
+    orientation: str = "",
+) -> Optional[PreparedImage]:
+    """디코딩과 재인코딩을 한 작업자에서 실행 (배열을 프로세스 밖으로 보내지 않음)"""
+    image = decode_image(image_bytes)
+    if image is None:
+        return None
+    return prepare_image(image, max_edge, encode_format, quality, orientation)
+
+
+def prepare_image(
+    image: np.ndarray,
+    max_edge: int,
+    encode_format: str,
+    quality: int,
+    orientation: str = "",
+) -> PreparedImage:
+    import cv2
+
+    card = _crop_card(image)
+    card = _auto_rotate(card, orientation)
+    card = downscale_image(card, max_edge)
+
+    extension, mime_type, quality_flag = _ENCODINGS[encode_format]
+    ok, encoded = cv2.imencode(extension, card, [getattr(cv2, quality_flag), quality])
+    if not ok:
+        raise ValueError("이미지 인코딩에 실패했습니다")
+
+    height, width = card.shape[:2]
+    return PreparedImage(
+        data=encoded.tobytes(), mime_type=mime_type, width=width, height=height
+    )
+
+
+def _crop_card(image: np.ndarray) -> np.ndarray:
+    """가장 큰 사각형 윤곽을 학생증으로 보고 원근 보정하여 잘라냄 (없으면 원본)"""
+    import cv2
+
+    height, width = image.shape[:2]
+    scale = min(1.0, 640 / max(height, width))
+    small = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    blurred = cv2.GaussianBlur(gray, (5, 5), 0)
+    edges = cv2.dilate(cv2.Canny(blurred, 50, 150), None, iterations=2)
+    contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+
+    min_area = small.shape[0] * small.shape[1] * 0.2
+    for contour in sorted(contours, key=cv2.contourArea, reverse=True)[:5]:
+        if cv2.contourArea(contour) < min_area:
+            break
+        approx = cv2.approxPolyDP(contour, 0.02 * cv2.arcLength(contour, True), True)
+        if len(approx) == 4:
+            corners = approx.reshape(4, 2).astype(np.float32) / scale
+            return _warp_quadrilateral(image, corners)
+    return image
+
+
+def _warp_quadrilateral(image: np.ndarray, corners: np.ndarray) -> np.ndarray:
+    import cv2
+
+    # 좌상, 우상, 우하, 좌하 순서로 정렬
+    sums = corners.sum(axis=1)
+    diffs = np.diff(corners, axis=1).ravel()
+    ordered = np.array(
+        [
+            corners[np.argmin(sums)],
+            corners[np.argmin(diffs)],
+            corners[np.argmax(sums)],
+            corners[np.argmax(diffs)],
+        ],
+        dtype=np.float32,
+    )
+    top_left, top_right, bottom_right, bottom_left = ordered
+    width = int(
+        max(
+            np.linalg.norm(top_right - top_left),
+            np.linalg.norm(bottom_right - bottom_left),
+        )
+    )
+    height = int(
+        max(
+            np.linalg.norm(bottom_left - top_left),
+            np.linalg.norm(bottom_right - top_right),
+        )
+    )
+    target = np.array(
+        [[0, 0], [width - 1, 0], [width - 1, height - 1], [0, height - 1]],
+        dtype=np.float32,
+    )
+    matrix = cv2.getPerspectiveTransform(ordered, target)
+    return cv2.warpPerspective(image, matrix, (width, height))
+
+
+def _auto_rotate(image: np.ndarray, orientation: str) -> np.ndarray:
+    """학생증 형태(가로형/세로형)와 다른 방향으로 찍힌 사진을 90도 회전"""
+    import cv2
+
+    height, width = image.shape[:2]
+    if (orientation == "landscape" and height > width) or (
+        orientation == "portrait" and width > height
+    ):
+        return cv2.rotate(image, cv2.ROTATE_90_CLOCKWISE)
+    return image
+
+
+def warm_up_worker() -> None:
+    """CPU 풀 작업자에서 OpenCV 를 미리 불러오고 초기화 (warm-up 단계에서 호출)"""
+    import cv2
+
+    ok, encoded = cv2.imencode(".png", np.zeros((8, 8, 3), np.uint8))
+    if ok:
+        decode_image(encoded.tobytes())
+
+
+def downscale_image(image: np.ndarray, max_edge: int) -> np.ndarray:
+    """긴 변이 ``max_edge`` 를 넘지 않도록 비율을 유지하며 축소"""
+    import cv2
+
+    height, width = image.shape[:2]
+    scale = max_edge / max(height, width)
+    if scale >= 1:
+        return image
+    return cv2.resize(
+        image, (int(width * scale), int(height * scale)), interpolation=cv2.INTER_AREA
+    )
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+import numpy as np
+
+# 구현체(OpenCV, pyzbar, langchain, Chroma)는 import 비용이 크므로 인터페이스만 따로 둡니다.
+# 라우터와 도메인 서비스는 이 모듈만 import 하고, 구현체는 Container 가 warm-up 단계에서 불러옵니다.
+
+
+class BarcodeReaderInterface(ABC):
+    @abstractmethod
+    async def extract_barcode(self, image_bytes: bytes) -> str:
+        pass
+
+    @abstractmethod
+    async def extract_barcode_from_image(self, image: np.ndarray) -> str:
+        """이미 디코딩된 이미지(BGR 또는 grayscale 배열)에서 바코드 추출"""
+        pass
+
+
+class GPTVisionReaderInterface(ABC):
+    @abstractmethod
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
+        pass
+
+    async def warm_up(self) -> None:
+        """첫 요청 전에 외부 연결 등을 미리 준비 (기본 구현은 아무것도 하지 않음)"""
+        pass
+
+    async def aclose(self) -> None:
+        """보유한 외부 리소스 정리 (기본 구현은 아무것도 하지 않음)"""
+        pass
@@ -0,0 +1,174 @@
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+import asyncio
+import logging
+import re
+import threading
+
+# easyocr(torch) 는 import 와 모델 로드 비용이 크므로 풀 작업자 안에서만 불러옵니다.
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 작업자(스레드/프로세스)별 easyocr 모델
+_worker = threading.local()
+
+_LABELS = {
+    "성명": "name",
+    "이름": "name",
+    "name": "name",
+    "학과": "department",
+    "소속": "department",
+    "전공": "department",
+    "학년": "year",
+    "학번": "student_number",
+}
+_LABEL = re.compile(r"^(성명|이름|name|학과|소속|전공|학년|학번)[:：.]?", re.IGNORECASE)
+_NAME = re.compile(r"[가-힣]{2,3}")
+_DEPARTMENT = re.compile(r"[가-힣]{1,20}학과")
+_YEAR = re.compile(r"([1-4])학년")
+_NOT_NAMES = ("학생", "대학", "총장", "학과", "학년", "학번")
+
+
+def init_worker(languages: Tuple[str, ...], model_dir: str) -> None:
+    """풀 작업자마다 한 번 easyocr 모델 로드 (executor initializer)"""
+    import easyocr
+
+    _worker.reader = easyocr.Reader(
+        list(languages),
+        gpu=False,
+        model_storage_directory=model_dir or None,
+        verbose=False,
+    )
+
+
+def ping_worker() -> bool:
+    """모델이 로드된 작업자인지 확인 (warm-up 용)"""
+    return getattr(_worker, "reader", None) is not None
+
+
+def recognize(image_bytes: bytes) -> List[Tuple[str, float]]:
+    """인식한 텍스트 줄과 신뢰도 목록 (위에서 아래, 왼쪽에서 오른쪽 순)"""
+    lines = []
+    for box, text, confidence in _worker.reader.readtext(image_bytes, detail=1):
+        center_y = sum(point[1] for point in box) / len(box)
+        left_x = min(point[0] for point in box)
+        lines.append((center_y, left_x, text, float(confidence)))
+    lines.sort()
+    return [(text, confidence) for _, _, text, confidence in lines]
+
+
+@dataclass
+class LocalOCRResult:
+    """로컬 OCR 결과와 필드별 신뢰도 (``unlabeled`` 는 라벨 없이 추정한 필드)"""
+
+    fields: Dict[str, str] = field(default_factory=dict)
+    confidences: Dict[str, float] = field(default_factory=dict)
+    unlabeled: Set[str] = field(default_factory=set)
+
+    @property
+    def confidence(self) -> float:
+        return min(self.confidences.values(), default=0.0)
+
+
+def parse_card_fields(lines: List[Tuple[str, float]]) -> LocalOCRResult:
+    """학생증 레이아웃의 텍스트 줄에서 이름/학과/학년 추출
+
+    ``성명 홍길동`` 처럼 라벨과 값이 한 줄에 있거나, 라벨 다음 줄에 값이 있는 경우를
+    모두 처리합니다. 라벨 없는 이름은 다른 필드가 아닌 2-3글자 한글 줄로 추정하고
+    ``unlabeled`` 에 표시합니다. (학교명 일부 등과 구분할 수 없으므로 호출자가 판단)
+    """
+    result = LocalOCRResult()
+    pending_field = None
+
+    def found(name: str, value: str, confidence: float, labeled: bool = True) -> None:
+        if name not in result.fields:
+            result.fields[name] = value
+            result.confidences[name] = confidence
+            if not labeled:
+                result.unlabeled.add(name)
+
+    for text, confidence in lines:
+        compact = re.sub(r"\s+", "", text)
+        label = _LABEL.match(compact)
+        if label:
+            field_name = _LABELS[label.group(1).lower()]
+            value = compact[label.end() :]
+        else:
+            field_name, value = pending_field, compact
+        # 라벨만 있는 줄이면 다음 줄을 그 값으로 봄
+        pending_field = field_name if label and not value else None
+        if not value:
+            continue
+
+        year = _YEAR.search(value)
+        if year or (field_name == "year" and value[0] in "1234"):
+            found("year", year.group(1) if year else value[0], confidence)
+        elif _DEPARTMENT.fullmatch(value) and field_name in (None, "department"):
+            found("department", value, confidence)
+        elif field_name == "name" and _NAME.fullmatch(value):
+            found("name", value, confidence)
+        elif (
+            field_name is None
+            and _NAME.fullmatch(value)
+            and not any(word in value for word in _NOT_NAMES)
+        ):
+            found("name", value, confidence, labeled=False)
+
+    return result
+
+
+class LocalOCRReader:
+    """CPU 에서 실행하는 로컬 OCR(easyocr) 기반 학생증 필드 추출기
+
+    모델은 전용 풀의 작업자마다 한 번만 로드되며(``init_worker``), 추출한 값이
+    ``StudentCardInfo`` 검증을 통과하고 모든 필드의 신뢰도가 ``min_confidence``
+    이상일 때만 결과를 반환합니다. 그렇지 않으면 이유와 함께 ``None`` 을 반환해
+    호출자가 GPT-4o 로 넘길 수 있게 합니다. 이름은 라벨(``성명``, ``이름`` 등)로
+    확인된 경우에만 받아들이며, 라벨 없이 추정한 이름은 ``validation`` 으로 넘깁니다.
+    """
+
+    def __init__(self, executor: Executor, workers: int, min_confidence: float):
+        self._executor = executor
+        self._workers = max(1, workers)
+        self._min_confidence = min_confidence
+
+    async def warm_up(self) -> None:
+        """작업자마다 모델 로드를 끝내 둠 (로드 실패 시 예외 전파)"""
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(self._executor, ping_worker)
+                for _ in range(self._workers)
+            )
+        )
+
+    async def read(self, image_bytes: bytes) -> Tuple[Optional[StudentCardInfo], str]:
+        """검증을 통과한 결과(또는 ``None``)와 판정 이유"""
+        loop = asyncio.get_running_loop()
+        lines = await loop.run_in_executor(self._executor, recognize, bytes(image_bytes))
+        result = parse_card_fields(lines)
+
+        missing = [name for name in ("name", "department", "year") if name not in result.fields]
+        if missing:
+            return None, "missing"
+        if result.confidence < self._min_confidence:
+            return None, "confidence"
+        if "name" in result.unlabeled:
+            logger.info(f"라벨 없는 이름은 로컬 OCR 결과로 쓰지 않음: {result.fields['name']}")
+            return None, "validation"
+        try:
+            info = StudentCardInfo(
+                name=result.fields["name"],
+                department=result.fields["department"],
+                year=int(result.fields["year"]),
+            )
+        except ValueError as e:
+            logger.info(f"로컬 OCR 결과 검증 실패: {str(e)}")
+            return None, "validation"
+        return info.mark_tier("ocr"), "accepted"
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
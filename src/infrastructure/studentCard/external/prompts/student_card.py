@@ -1,10 +1,4 @@
-from langchain_core.prompts import (
-    ChatPromptTemplate,
-    SystemMessagePromptTemplate,
-    HumanMessagePromptTemplate,
-)
-from langchain_core.output_parsers import StrOutputParser
-from langchain_openai import ChatOpenAI
+from functools import lru_cache
 from dotenv import load_dotenv
 import os
 
@@ -33,10 +27,18 @@ SYSTEM_TEMPLATE = """
 {format_instructions}
 """
 
-student_card_prompt = (
-    ChatPromptTemplate.from_messages(
-        [("system", SYSTEM_TEMPLATE), ("human", "이미지를 분석해주세요.")]
+
+@lru_cache(maxsize=1)
+def get_student_card_chain():
+    """프롬프트 | ChatOpenAI | 문자열 파서 체인 (langchain import 와 생성은 첫 호출 시)"""
+    from langchain_core.prompts import ChatPromptTemplate
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_openai import ChatOpenAI
+
+    return (
+        ChatPromptTemplate.from_messages(
+            [("system", SYSTEM_TEMPLATE), ("human", "이미지를 분석해주세요.")]
+        )
+        | ChatOpenAI(temperature=0, api_key=os.getenv("OPENAI_API_KEY"))
+        | StrOutputParser()
     )
-    | ChatOpenAI(temperature=0, api_key=os.getenv("OPENAI_API_KEY"))
-    | StrOutputParser()
-)
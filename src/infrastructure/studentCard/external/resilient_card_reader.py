@@ -0,0 +1,172 @@
+from typing import Optional
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.domain.studentCard.exception.exceptions import OCRRetryableException
+from src.infrastructure.common.deadline import time_remaining
+from src.infrastructure.common.metrics import metrics
+from src.infrastructure.common.retry import LatencyTracker, RetryBudget
+from src.infrastructure.studentCard.external.interfaces import (
+    GPTVisionReaderInterface,
+)
+import asyncio
+import logging
+import random
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class ResilientCardReader(GPTVisionReaderInterface):
+    """LLM 리더에 처리 기한을 고려한 재시도와 헤지 호출을 더하는 리더
+
+    ``OCRRetryableException`` 만 다시 시도하며, 다음 경우에는 재시도하지 않고
+    마지막 오류를 그대로 전달합니다.
+
+    - ``max_attempts`` 번 모두 실패한 경우
+    - 대기 시간(지수 백오프 + jitter, 429 는 ``Retry-After``)과 예상 호출 시간(최근
+      중앙값과 방금 실패한 시도 중 긴 쪽)을 더한 값이 요청의 남은 처리 시간보다 긴 경우
+    - 프로세스 전체 재시도 예산(``RetryBudget``)이 바닥난 경우
+
+    ``hedge_enabled`` 면 호출이 최근 ``hedge_percentile`` 분위 소요 시간을 넘길 때
+    같은 요청을 한 번 더 보내고 먼저 성공한 응답을 사용합니다. 헤지 호출도 재시도
+    예산을 쓰므로 지연이 전반적으로 늘어난 상황에서 호출 수가 불어나지 않습니다.
+    """
+
+    def __init__(
+        self,
+        reader: GPTVisionReaderInterface,
+        budget: RetryBudget,
+        latency: LatencyTracker,
+        max_attempts: int,
+        base_delay: float,
+        max_delay: float,
+        hedge_enabled: bool = False,
+        hedge_percentile: float = 0.95,
+        hedge_min_delay: float = 0.0,
+    ):
+        self._reader = reader
+        self._budget = budget
+        self._latency = latency
+        self._max_attempts = max(1, max_attempts)
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._hedge_enabled = hedge_enabled
+        self._hedge_percentile = hedge_percentile
+        self._hedge_min_delay = hedge_min_delay
+        # /metrics 가 벡터 DB 쓰기 큐 상태를 읽을 수 있도록 노출
+        self.vectorstore_writer = getattr(reader, "vectorstore_writer", None)
+
+    def _hedge_delay(self) -> Optional[float]:
+        """헤지 호출을 보내기까지 기다릴 시간 (표본이 부족하거나 꺼져 있으면 ``None``)"""
+        if not self._hedge_enabled:
+            return None
+        threshold = self._latency.percentile(self._hedge_percentile)
+        if threshold is None:
+            return None
+        return max(self._hedge_min_delay, threshold)
+
+    async def warm_up(self) -> None:
+        await self._reader.warm_up()
+
+    async def aclose(self) -> None:
+        await self._reader.aclose()
+
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
+        self._budget.deposit()
+        attempt = 1
+        while True:
+            started = time.perf_counter()
+            try:
+                return await self._call(image_bytes, mime_type)
+            except OCRRetryableException as e:
+                delay = self._backoff(attempt, e.retry_after)
+                skipped = self._skip_reason(
+                    attempt, delay, time.perf_counter() - started
+                )
+                if skipped:
+                    metrics.increment("student_card_ocr_retries_skipped_total", reason=skipped)
+                    logger.warning(
+                        f"LLM 호출 실패, 재시도하지 않음 (사유: {e.reason}, {skipped})"
+                    )
+                    raise
+                metrics.increment("student_card_ocr_retries_total", reason=e.reason)
+                logger.warning(
+                    f"LLM 호출 실패, {delay:.2f}s 후 재시도 "
+                    f"({attempt}/{self._max_attempts}, 사유: {e.reason})"
+                )
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        """지수 백오프 상한 안에서 full jitter, API 가 알려준 대기 시간은 반드시 지킴"""
+        delay = random.uniform(
+            0, min(self._max_delay, self._base_delay * 2 ** (attempt - 1))
+        )
+        return max(delay, retry_after or 0.0)
+
+    def _skip_reason(
+        self, attempt: int, delay: float, last_seconds: float
+    ) -> Optional[str]:
+        if attempt >= self._max_attempts:
+            return "attempts"
+        # 다음 시도도 최근 중앙값이나 방금 실패한 시도만큼은 걸린다고 봄
+        remaining = time_remaining()
+        expected = max(self._latency.percentile(0.5) or 0.0, last_seconds)
+        if remaining is not None and remaining < delay + expected:
+            return "deadline"
+        if not self._budget.try_withdraw():
+            return "budget"
+        return None
+
+    async def _call(self, image_bytes: bytes, mime_type: str) -> StudentCardInfo:
+        hedge_delay = self._hedge_delay()
+        remaining = time_remaining()
+        if hedge_delay is None or (remaining is not None and remaining <= hedge_delay):
+            return await self._timed(image_bytes, mime_type)
+
+        started = time.perf_counter()
+        primary = asyncio.create_task(self._timed(image_bytes, mime_type))
+        hedge = None
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=hedge_delay)
+            if done or not self._budget.try_withdraw():
+                return await primary
+
+            metrics.increment("student_card_llm_hedges_total")
+            logger.info(f"LLM 응답 지연 ({hedge_delay:.2f}s 초과), 헤지 호출 시작")
+            hedge = asyncio.create_task(self._timed(image_bytes, mime_type))
+            result, winner = await self._first_success(primary, hedge)
+            if winner is hedge:
+                metrics.increment("student_card_llm_hedge_wins_total")
+                # 취소되는 첫 호출도 최소 이만큼 걸렸으므로 기록 (분위수 과소추정 방지)
+                self._latency.record(time.perf_counter() - started)
+            return result
+        finally:
+            pending = [task for task in (primary, hedge) if task and not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    @staticmethod
+    async def _first_success(*tasks: asyncio.Task):
+        """먼저 성공한 태스크의 결과와 그 태스크 (모두 실패하면 처음 난 오류 전달)"""
+        pending = set(tasks)
+        error = None
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), task
+                error = error or task.exception()
+        raise error
+
+    async def _timed(self, image_bytes: bytes, mime_type: str) -> StudentCardInfo:
+        started = time.perf_counter()
+        result = await self._reader.extract_info(image_bytes, mime_type)
+        self._latency.record(time.perf_counter() - started)
+        return result
@@ -0,0 +1,64 @@
+from typing import Optional
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.infrastructure.common.metrics import metrics
+from src.infrastructure.studentCard.external.interfaces import (
+    GPTVisionReaderInterface,
+)
+from src.infrastructure.studentCard.external.local_ocr_reader import LocalOCRReader
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class TieredCardReader(GPTVisionReaderInterface):
+    """로컬 OCR 을 먼저 시도하고 검증/신뢰도 기준을 통과하지 못하면 GPT-4o 로 넘기는 리더
+
+    반환한 ``StudentCardInfo.tier`` 로 어느 단계가 답했는지(``ocr``/``llm``) 알 수
+    있습니다. 로컬 OCR 모델을 불러오지 못하면 warm-up 에서 로컬 단계를 끄고
+    모든 요청을 GPT-4o 로 처리합니다.
+    """
+
+    def __init__(
+        self, local_reader: Optional[LocalOCRReader], fallback: GPTVisionReaderInterface
+    ):
+        self._local_reader = local_reader
+        self._fallback = fallback
+        # /metrics 가 벡터 DB 쓰기 큐 상태를 읽을 수 있도록 노출
+        self.vectorstore_writer = getattr(fallback, "vectorstore_writer", None)
+
+    async def warm_up(self) -> None:
+        if self._local_reader is not None:
+            try:
+                await self._local_reader.warm_up()
+                logger.info("로컬 OCR 모델 로드 완료")
+            except Exception as e:
+                logger.error(f"로컬 OCR 모델 로드 실패, GPT-4o 만 사용합니다: {str(e)}")
+                self._local_reader.close()
+                self._local_reader = None
+        await self._fallback.warm_up()
+
+    async def aclose(self) -> None:
+        if self._local_reader is not None:
+            self._local_reader.close()
+        await self._fallback.aclose()
+
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
+        reason = "unavailable"
+        if self._local_reader is not None:
+            try:
+                with metrics.stage("local_ocr"):
+                    info, reason = await self._local_reader.read(image_bytes)
+                if info is not None:
+                    metrics.increment("student_card_extraction_tier_total", tier="ocr")
+                    return info
+            except Exception as e:
+                logger.warning(f"로컬 OCR 처리 중 오류 발생: {str(e)}")
+                reason = "error"
+
+        logger.info(f"GPT-4o 로 분석 전환 (사유: {reason})")
+        metrics.increment("student_card_ocr_escalations_total", reason=reason)
+        metrics.increment("student_card_extraction_tier_total", tier="llm")
+        return (await self._fallback.extract_info(image_bytes, mime_type)).mark_tier("llm")
@@ -0,0 +1,129 @@
+from typing import List, Optional
+from langchain_core.documents import Document
+from src.infrastructure.common.metrics import metrics
+import asyncio
+import logging
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+
+
+class VectorStoreWriter:
+    """분석 결과 문서를 백그라운드에서 모아 벡터 DB 에 기록하는 write-behind 큐
+
+    ``submit()`` 은 기다리지 않고 즉시 반환하므로 응답이 임베딩 호출이나 디스크
+    flush 를 기다리지 않습니다. 문서는 ``batch_size`` 개가 모이거나 첫 문서가 들어온 뒤
+    ``flush_interval`` 초가 지나면 한 번의 ``add_documents`` 로 기록되고, ``stop()`` 시
+    남은 문서를 모두 기록합니다. 큐가 가득 차면 ``overflow_policy`` 에 따라 새 문서
+    (``drop_newest``) 또는 가장 오래된 문서(``drop_oldest``)를 버립니다.
+    """
+
+    def __init__(
+        self,
+        vectorstore,
+        max_queue: int = 1000,
+        batch_size: int = 32,
+        flush_interval: float = 5.0,
+        overflow_policy: str = DROP_OLDEST,
+    ):
+        if overflow_policy not in (DROP_NEWEST, DROP_OLDEST):
+            raise ValueError(f"지원하지 않는 overflow 정책입니다: {overflow_policy}")
+        self._vectorstore = vectorstore
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, max_queue))
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = flush_interval
+        self._overflow_policy = overflow_policy
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        # 누적 카운터
+        self.written_total = 0
+        self.dropped_total = 0
+        self.failed_total = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def submit(self, document: Document) -> bool:
+        """문서를 큐에 넣음 (대기하지 않음). 버려진 경우 ``False``"""
+        if self._stopping:
+            self.dropped_total += 1
+            return False
+        self._ensure_started()
+
+        if self._queue.full():
+            self.dropped_total += 1
+            if self._overflow_policy == DROP_NEWEST:
+                logger.warning("벡터 DB 쓰기 큐가 가득 차 새 문서를 버립니다")
+                return False
+            self._queue.get_nowait()
+            logger.warning("벡터 DB 쓰기 큐가 가득 차 가장 오래된 문서를 버립니다")
+
+        self._queue.put_nowait(document)
+        return True
+
+    async def stop(self) -> None:
+        """남은 문서를 모두 기록하고 백그라운드 작업 종료"""
+        self._stopping = True
+        if self._task is None:
+            return
+        await self._queue.put(None)
+        try:
+            await self._task
+        finally:
+            self._task = None
+
+    def _ensure_started(self) -> None:
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        batch: List[Document] = []
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0, deadline - time.monotonic())
+            try:
+                document = await asyncio.wait_for(self._queue.get(), timeout)
+            except asyncio.TimeoutError:
+                # 시간 기준 flush
+                await self._flush(batch)
+                batch, deadline = [], None
+                continue
+
+            if document is None:
+                await self._flush(batch)
+                return
+
+            if not batch:
+                deadline = time.monotonic() + self._flush_interval
+            batch.append(document)
+            if len(batch) >= self._batch_size:
+                await self._flush(batch)
+                batch, deadline = [], None
+
+    async def _flush(self, batch: List[Document]) -> None:
+        if not batch:
+            return
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._write, batch)
+            # 요청과 무관한 백그라운드 작업이므로 Server-Timing 없이 히스토그램에만 기록
+            metrics.observe(
+                "student_card_stage_seconds",
+                time.perf_counter() - started,
+                stage="vector_store_save",
+            )
+            self.written_total += len(batch)
+            logger.info(f"벡터 DB 에 분석 결과 {len(batch)}건 기록")
+        except Exception as e:
+            self.failed_total += len(batch)
+            logger.error(f"벡터 DB 기록 중 오류 발생 ({len(batch)}건): {e}")
+
+    def _write(self, batch: List[Document]) -> None:
+        self._vectorstore.add_documents(batch)
+        self._vectorstore.persist()  # 디스크에 저장
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+from sqlalchemy import delete, select
+from src.domain.studentCard.entity.analysis_lock import AnalysisLock
+from src.domain.studentCard.repository.repositories import _upsert_insert
+import asyncio
+import logging
+import time
+import uuid
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class DatabaseDigestLock:
+    """``analysis_locks`` 테이블 기반의 워커 간 이미지 다이제스트 잠금
+
+    행 삽입에 성공한 워커만 분석을 실행하고, 나머지는 행이 지워질 때까지
+    ``poll_interval`` 간격으로 확인하며 기다립니다. 잠금을 가진 워커가 비정상
+    종료해 남은 행은 ``ttl`` 이 지나면 만료된 것으로 보고 무시/삭제합니다.
+    각 조회는 요청 세션과 별개인 짧은 트랜잭션으로 실행됩니다.
+    """
+
+    def __init__(self, session_factory, ttl: float, poll_interval: float):
+        self._session_factory = session_factory
+        self._ttl = ttl
+        self._poll_interval = poll_interval
+        self._owner = uuid.uuid4().hex
+
+    async def acquire(self, image_digest: str) -> bool:
+        """잠금을 얻으면 ``True``, 다른 워커의 작업이 끝날 때까지 기다렸으면 ``False``"""
+        if await self._try_insert(image_digest):
+            return True
+
+        deadline = time.monotonic() + self._ttl
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self._poll_interval)
+            if not await self._is_held(image_digest):
+                return False
+        logger.warning(f"분석 잠금 대기 시간 초과: {image_digest[:12]}")
+        return False
+
+    async def release(self, image_digest: str) -> None:
+        try:
+            async with self._session_factory() as session:
+                await session.execute(
+                    delete(AnalysisLock).where(
+                        AnalysisLock.image_digest == image_digest,
+                        AnalysisLock.owner == self._owner,
+                    )
+                )
+                await session.commit()
+        except Exception as e:
+            # 지우지 못한 행은 ttl 이 지나면 만료됨
+            logger.error(f"분석 잠금 해제 중 오류 발생: {str(e)}")
+
+    def _expired_before(self) -> datetime:
+        return datetime.utcnow() - timedelta(seconds=self._ttl)
+
+    async def _try_insert(self, image_digest: str) -> bool:
+        async with self._session_factory() as session:
+            # 만료된 잠금 정리 후 삽입 (이미 있으면 아무것도 하지 않음)
+            await session.execute(
+                delete(AnalysisLock).where(
+                    AnalysisLock.image_digest == image_digest,
+                    AnalysisLock.acquired_at < self._expired_before(),
+                )
+            )
+            result = await session.execute(
+                _upsert_insert(session, AnalysisLock)
+                .values(
+                    image_digest=image_digest,
+                    owner=self._owner,
+                    acquired_at=datetime.utcnow(),
+                )
+                .on_conflict_do_nothing(index_elements=[AnalysisLock.image_digest])
+            )
+            await session.commit()
+            return result.rowcount == 1
+
+    async def _is_held(self, image_digest: str) -> bool:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AnalysisLock.image_digest).where(
+                    AnalysisLock.image_digest == image_digest,
+                    AnalysisLock.acquired_at >= self._expired_before(),
+                )
+            )
+            return result.first() is not None
@@ -0,0 +1,117 @@
+from typing import List, Optional, Tuple
+from fastapi import UploadFile
+from src.domain.studentCard.service.batch_analysis_service import BatchItem
+import asyncio
+import mimetypes
+import os
+import shutil
+import tempfile
+import zipfile
+
+ZIP_CONTENT_TYPES = {"application/zip", "application/x-zip-compressed"}
+
+
+class BatchUploadStaging:
+    """일괄 업로드 파일을 임시 디렉터리에 옮겨두고 필요할 때 하나씩 읽어오도록 준비
+
+    FastAPI 는 응답 스트리밍이 시작되기 전에 업로드 파일을 닫으므로, 스트리밍
+    도중 읽을 수 있도록 파일을 임시 디렉터리로 복사합니다. 이미지 바이트는 각
+    항목이 처리되는 시점에만 메모리에 올라오며, ``max_image_bytes`` 를 넘는
+    이미지(zip 내부 파일 포함)는 읽지 않고 오류 항목으로 처리합니다.
+    """
+
+    def __init__(self, max_image_bytes: int):
+        self._max_image_bytes = max_image_bytes
+        self._workdir = tempfile.TemporaryDirectory(
+            prefix="student-card-batch-", ignore_cleanup_errors=True
+        )
+
+    def cleanup(self) -> None:
+        self._workdir.cleanup()
+
+    async def stage(self, uploads: List[UploadFile], max_images: int) -> List[BatchItem]:
+        items: List[BatchItem] = []
+        for upload in uploads:
+            path = os.path.join(self._workdir.name, f"upload-{len(items)}")
+            await asyncio.to_thread(_copy_upload, upload, path)
+
+            if _is_zip(upload):
+                members = await asyncio.to_thread(_list_zip_images, path)
+                for name, size in members:
+                    items.append(
+                        BatchItem(
+                            index=len(items),
+                            filename=name,
+                            load=_zip_member_loader(path, name),
+                            error=self._size_error(size),
+                        )
+                    )
+            else:
+                content_type = upload.content_type or ""
+                items.append(
+                    BatchItem(
+                        index=len(items),
+                        filename=upload.filename or "",
+                        load=_file_loader(path),
+                        error=(
+                            self._size_error(os.path.getsize(path))
+                            if content_type.startswith("image/")
+                            else "Invalid file type. Please upload an image file."
+                        ),
+                    )
+                )
+
+            if len(items) > max_images:
+                raise ValueError(f"한 번에 최대 {max_images}개의 이미지만 처리할 수 있습니다")
+        return items
+
+    def _size_error(self, size: int) -> Optional[str]:
+        if size > self._max_image_bytes:
+            return f"Image file too large. Maximum size is {self._max_image_bytes} bytes."
+        return None
+
+
+def _is_zip(upload: UploadFile) -> bool:
+    return upload.content_type in ZIP_CONTENT_TYPES or (
+        upload.filename or ""
+    ).lower().endswith(".zip")
+
+
+def _copy_upload(upload: UploadFile, path: str) -> None:
+    upload.file.seek(0)
+    with open(path, "wb") as target:
+        shutil.copyfileobj(upload.file, target)
+
+
+def _list_zip_images(path: str) -> List[Tuple[str, int]]:
+    with zipfile.ZipFile(path) as archive:
+        return [
+            (info.filename, info.file_size)
+            for info in archive.infolist()
+            if not info.is_dir()
+            and (mimetypes.guess_type(info.filename)[0] or "").startswith("image/")
+        ]
+
+
+def _file_loader(path: str):
+    async def load() -> bytes:
+        return await asyncio.to_thread(_read_file, path)
+
+    return load
+
+
+def _zip_member_loader(path: str, name: str):
+    async def load() -> bytes:
+        return await asyncio.to_thread(_read_zip_member, path, name)
+
+    return load
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as source:
+        return source.read()
+
+
+def _read_zip_member(path: str, name: str) -> bytes:
+    with zipfile.ZipFile(path) as archive:
+        return archive.read(name)
@@ -0,0 +1,75 @@
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
+from src.config import settings
+from src.domain.studentCard.exception.exceptions import (
+    DomainException,
+    ImageTooLargeException,
+    InvalidImageException,
+)
+from src.domain.studentCard.service.analysis_job_service import AnalysisJobService
+from src.infrastructure.common.persistence.database import AsyncSessionLocal
+from src.interfaces.api.upload_reader import read_upload
+import logging
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def get_job_service():
+    return AnalysisJobService(
+        AsyncSessionLocal, poll_interval=settings.job_status_poll_interval
+    )
+
+
+@router.post("/student-card/jobs", status_code=202)
+async def submit_analysis_job(
+    request: Request,
+    response: Response,
+    image: UploadFile = File(...),
+    job_service: AnalysisJobService = Depends(get_job_service),
+):
+    """이미지를 저장하고 작업 ID 를 바로 반환 (분석은 워커 프로세스가 처리)"""
+    try:
+        if not (image.content_type or "").startswith("image/"):
+            raise InvalidImageException(
+                "Invalid file type. Please upload an image file."
+            )
+        contents = await read_upload(
+            image, settings.max_upload_bytes, settings.upload_read_chunk_size
+        )
+        job = await job_service.submit(contents, image.content_type)
+    except ImageTooLargeException as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except DomainException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    status_url = str(request.url_for("get_analysis_job", job_id=job.job_id))
+    response.headers["Location"] = status_url
+    logger.info(f"분석 작업 접수: {job.job_id}")
+    return {"status": "accepted", "data": {**job.response_data(), "status_url": status_url}}
+
+
+@router.get("/student-card/jobs/{job_id}")
+async def get_analysis_job(
+    job_id: str,
+    wait: float = Query(0, ge=0, description="작업이 끝날 때까지 기다릴 최대 시간 (초)"),
+    job_service: AnalysisJobService = Depends(get_job_service),
+):
+    """작업 상태 조회 (``wait`` 를 주면 끝나거나 시간이 다 될 때까지 기다림)"""
+    if wait > 0:
+        job = await job_service.wait(job_id, min(wait, settings.job_long_poll_max))
+    else:
+        job = await job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return {"status": "success", "data": job.response_data()}
@@ -0,0 +1,127 @@
+from typing import Dict, Optional
+from src.infrastructure.common.metrics import format_server_timing, request_timings
+import json
+import logging
+import time
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+class UploadSizeLimitMiddleware:
+    """경로별 요청 본문 크기 제한 (ASGI 미들웨어)
+
+    ``Content-Length`` 가 제한을 넘으면 본문을 읽기 전에 413 으로 거절합니다.
+    길이를 알 수 없는 chunked 요청은 받은 만큼 세다가 제한을 넘는 순간 본문
+    수신을 끊고, 앱이 만든 응답 대신 413 을 보냅니다.
+    """
+
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope.get("path")) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = _content_length(scope)
+        if content_length is not None and content_length > limit:
+            logger.warning(
+                f"업로드 크기 초과로 거절: {content_length} bytes > {limit} bytes"
+            )
+            await _send_too_large(send, limit)
+            return
+
+        state = {"received": 0, "exceeded": False, "started": False}
+
+        async def limited_receive():
+            if state["exceeded"]:
+                return {"type": "http.disconnect"}
+            message = await receive()
+            if message["type"] == "http.request":
+                state["received"] += len(message.get("body", b""))
+                if state["received"] > limit:
+                    state["exceeded"] = True
+                    logger.warning(f"업로드 크기 초과로 수신 중단: {limit} bytes 초과")
+                    return {"type": "http.disconnect"}
+            return message
+
+        async def guarded_send(message):
+            if state["exceeded"]:
+                # 본문 파싱 실패로 앱이 만든 응답은 버리고 413 으로 대체
+                if message["type"] == "http.response.start" and not state["started"]:
+                    state["started"] = True
+                    await _send_too_large(send, limit)
+                return
+            if message["type"] == "http.response.start":
+                state["started"] = True
+            await send(message)
+
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except Exception:
+            if not state["exceeded"]:
+                raise
+            if not state["started"]:
+                state["started"] = True
+                await _send_too_large(send, limit)
+
+
+class ServerTimingMiddleware:
+    """요청 처리 중 기록된 단계별 소요 시간을 ``Server-Timing`` 응답 헤더로 노출
+
+    응답 헤더를 보내는 시점까지 끝난 단계만 포함되며, ``total`` 은 요청 수신부터
+    헤더 전송까지의 시간입니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        with request_timings() as timings:
+
+            async def timed_send(message):
+                if message["type"] == "http.response.start":
+                    timings["total"] = time.perf_counter() - started
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (b"server-timing", format_server_timing(timings).encode("ascii"))
+                    )
+                    message = {**message, "headers": headers}
+                await send(message)
+
+            await self.app(scope, receive, timed_send)
+
+
+def _content_length(scope) -> Optional[int]:
+    for name, value in scope.get("headers", []):
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+async def _send_too_large(send, limit: int) -> None:
+    body = json.dumps(
+        {"detail": f"Request body too large. Maximum size is {limit} bytes."}
+    ).encode("utf-8")
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,102 @@
+from fastapi import APIRouter, Request, Response
+from fastapi.responses import JSONResponse
+from src.config import settings
+from src.container import Container
+from src.infrastructure.common.metrics import metrics
+from src.infrastructure.common.startup import StartupState
+
+# 상태 확인 (항상 등록)
+router = APIRouter()
+
+# 지표 (metrics_enabled 일 때만 등록)
+metrics_router = APIRouter()
+
+
+@router.get("/health", include_in_schema=False)
+async def health():
+    """liveness: 프로세스가 요청을 받을 수 있으면 항상 200"""
+    return {"status": "ok"}
+
+
+@router.get("/ready", include_in_schema=False)
+async def ready(request: Request):
+    """readiness: warm-up 이 끝났으면 200, 아니면 진행 단계와 함께 503"""
+    startup: StartupState = request.app.state.startup
+    if startup.ready:
+        return {"status": "ready", **startup.snapshot()}
+    return JSONResponse(
+        status_code=503,
+        content={"status": "starting", **startup.snapshot()},
+        headers={"Retry-After": str(max(1, round(settings.warmup_retry_interval)))},
+    )
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics(request: Request):
+    """Prometheus 텍스트 형식 지표 (단계별 지연, 캐시/재시도/실패 카운터, 토큰, 부하 상태)"""
+    samples = _collect_startup_samples(request.app.state.startup)
+    container = getattr(request.app.state, "container", None)
+    if container is not None:
+        samples += _collect_samples(container)
+    return Response(
+        content=metrics.render(samples),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
+def _collect_startup_samples(startup: StartupState):
+    samples = [("student_card_ready", "gauge", "warm-up 완료 여부 (1=준비됨)", int(startup.ready))]
+    if startup.import_seconds is not None:
+        samples.append(
+            ("student_card_import_seconds", "gauge", "애플리케이션 모듈 import 시간(초)", startup.import_seconds)
+        )
+    if startup.ready_seconds is not None:
+        samples.append(
+            ("student_card_time_to_ready_seconds", "gauge", "import 시작부터 준비 완료까지(초)", startup.ready_seconds)
+        )
+    return samples
+
+
+def _collect_samples(container: Container):
+    """공유 컴포넌트가 직접 관리하는 값은 조회 시점에 읽어옴"""
+    admission = container.admission
+    samples = [
+        ("student_card_llm_in_flight", "gauge", "실행 중인 LLM 호출 수", admission.in_flight),
+        ("student_card_llm_queue_depth", "gauge", "LLM 슬롯 대기 요청 수", admission.queue_depth),
+        ("student_card_admitted_total", "counter", "LLM 슬롯을 얻은 요청 수", admission.admitted_total),
+        ("student_card_rejected_total", "counter", "대기열 포화로 거절된 요청 수", admission.rejected_total),
+        ("student_card_timeouts_total", "counter", "처리 기한을 넘긴 요청 수", admission.timeouts_total),
+        (
+            "student_card_analysis_cache_entries",
+            "gauge",
+            "메모리 분석 캐시 항목 수",
+            len(container.analysis_memory_cache),
+        ),
+    ]
+
+    if container.single_flight is not None:
+        samples.append(
+            (
+                "student_card_single_flight_in_flight",
+                "gauge",
+                "진행 중인 (합쳐진) 이미지 분석 수",
+                container.single_flight.in_flight,
+            )
+        )
+
+    if container.retry_budget is not None:
+        budget = container.retry_budget
+        samples += [
+            ("student_card_retry_budget_tokens", "gauge", "남은 LLM 재시도/헤지 토큰", budget.tokens),
+            ("student_card_retry_budget_exhausted_total", "counter", "예산 부족으로 막힌 재시도/헤지 수", budget.exhausted_total),
+        ]
+
+    writer = getattr(container.ocr_reader, "vectorstore_writer", None)
+    if writer is not None:
+        samples += [
+            ("student_card_vector_write_queue_depth", "gauge", "벡터 DB 쓰기 대기 문서 수", writer.queue_depth),
+            ("student_card_vector_written_total", "counter", "벡터 DB 에 기록된 문서 수", writer.written_total),
+            ("student_card_vector_dropped_total", "counter", "쓰기 큐 포화로 버린 문서 수", writer.dropped_total),
+            ("student_card_vector_failed_total", "counter", "기록에 실패한 문서 수", writer.failed_total),
+        ]
+    return samples
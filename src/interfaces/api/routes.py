@@ -1,98 +1,274 @@
-from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
+from typing import List
+from fastapi import (
+    APIRouter,
+    UploadFile,
+    File,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.background import BackgroundTask
+from src.infrastructure.common.persistence.database import AsyncSessionLocal
 from src.infrastructure.studentCard.persistence.database import get_db
 from src.domain.studentCard.service.barcode_service import BarcodeService
 from src.domain.studentCard.service.ocr_service import OCRService
-from src.infrastructure.studentCard.external.barcode_reader import BarcodeReader
-from src.infrastructure.studentCard.external.gpt_vision_reader import GPTVisionReader
-from src.domain.studentCard.repository.repositories import SQLAlchemyStudentRepository
+from src.infrastructure.studentCard.external.interfaces import (
+    BarcodeReaderInterface,
+    GPTVisionReaderInterface,
+)
+from src.infrastructure.studentCard.external.image_preprocessor import (
+    ImagePreprocessor,
+)
+from src.domain.studentCard.service.analysis_cache_service import AnalysisCacheService
+from src.domain.studentCard.service.analysis_service import StudentCardAnalysisService
+from src.domain.studentCard.service.batch_analysis_service import (
+    BatchAnalysisService,
+)
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyStudentRepository,
+    SQLAlchemyAnalysisCacheRepository,
+)
 from src.domain.studentCard.exception.exceptions import (
     DomainException,
+    ImageTooLargeException,
     InvalidImageException,
-    BarcodeProcessingException,
+    OCRRetryableException,
+    ServiceOverloadedException,
+    UpstreamServiceException,
 )
-from src.domain.studentCard.entity.student import Student
-from datetime import datetime
-import asyncio
+from src.infrastructure.common.admission import AdmissionController
+from src.infrastructure.common.deadline import request_deadline
+from src.infrastructure.common.memory import memory_tracking
+from src.infrastructure.common.metrics import metrics
+from src.config import settings
+from src.container import Container
+from src.interfaces.api.batch_upload import BatchUploadStaging
+from src.interfaces.api.upload_reader import read_upload
+import json
+import logging
+import zipfile
+
+# 로거 설정
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
-def get_ocr_reader():
-    return GPTVisionReader()
+def get_container(request: Request) -> Container:
+    # warm-up 이 끝나기 전에는 공유 컴포넌트를 쓰지 않고 재시도를 안내
+    if not request.app.state.startup.ready:
+        raise HTTPException(
+            status_code=503,
+            detail="서비스를 준비하는 중입니다. 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": str(max(1, round(settings.warmup_retry_interval)))},
+        )
+    return request.app.state.container
+
+
+def get_ocr_reader(container: Container = Depends(get_container)):
+    return container.ocr_reader
 
 
-def get_barcode_reader():
-    return BarcodeReader()
+def get_barcode_reader(container: Container = Depends(get_container)):
+    return container.barcode_reader
 
 
 def get_student_repository(db: Session = Depends(get_db)):
     return SQLAlchemyStudentRepository(db)
 
 
-def get_ocr_service(
-    reader: GPTVisionReader = Depends(get_ocr_reader),
-    repository: SQLAlchemyStudentRepository = Depends(get_student_repository),
-):
-    return OCRService(reader, repository)
+def get_ocr_service(reader: GPTVisionReaderInterface = Depends(get_ocr_reader)):
+    return OCRService(reader)
+
+
+def get_image_preprocessor(container: Container = Depends(get_container)):
+    return container.image_preprocessor
 
 
-def get_barcode_service(reader: BarcodeReader = Depends(get_barcode_reader)):
+def get_admission_controller(container: Container = Depends(get_container)):
+    return container.admission
+
+
+def get_barcode_service(
+    reader: BarcodeReaderInterface = Depends(get_barcode_reader),
+):
     return BarcodeService(reader)
 
 
-@router.post("/student-card/analyze")
-async def analyze_student_card(
-    image: UploadFile = File(...),
+def get_analysis_cache_service(
     db: Session = Depends(get_db),
-    ocr_service: OCRService = Depends(get_ocr_service),
+    container: Container = Depends(get_container),
+):
+    return AnalysisCacheService(
+        container.analysis_memory_cache,
+        SQLAlchemyAnalysisCacheRepository(db),
+        settings.cache_ttl,
+    )
+
+
+def get_session_factory():
+    return AsyncSessionLocal
+
+
+def get_analysis_service(
     barcode_service: BarcodeService = Depends(get_barcode_service),
+    ocr_service: OCRService = Depends(get_ocr_service),
     student_repository: SQLAlchemyStudentRepository = Depends(get_student_repository),
+    cache_service: AnalysisCacheService = Depends(get_analysis_cache_service),
+    image_preprocessor: ImagePreprocessor = Depends(get_image_preprocessor),
+    admission: AdmissionController = Depends(get_admission_controller),
+    container: Container = Depends(get_container),
+    session_factory=Depends(get_session_factory),
 ):
-    # 이미지 형식 검증
-    if not image.content_type.startswith("image/"):
-        raise InvalidImageException("Invalid file type. Please upload an image file.")
+    return StudentCardAnalysisService(
+        barcode_service,
+        ocr_service,
+        student_repository,
+        cache_service,
+        image_preprocessor,
+        admission,
+        mode=settings.analyze_pipeline_mode,
+        freshness_seconds=settings.student_freshness_seconds,
+        single_flight=container.single_flight,
+        digest_lock=container.digest_lock,
+        session_factory=session_factory,
+    )
 
-    try:
-        contents = await image.read()
 
-        # 병렬 처리로 변경
-        barcode_task = asyncio.create_task(barcode_service.extract_barcode(contents))
-        ocr_task = asyncio.create_task(ocr_service.extract_info(contents))
+def get_batch_analysis_service(
+    barcode_service: BarcodeService = Depends(get_barcode_service),
+    ocr_service: OCRService = Depends(get_ocr_service),
+    image_preprocessor: ImagePreprocessor = Depends(get_image_preprocessor),
+    admission: AdmissionController = Depends(get_admission_controller),
+    container: Container = Depends(get_container),
+    session_factory=Depends(get_session_factory),
+):
+    def build_analysis_service(session):
+        return StudentCardAnalysisService(
+            barcode_service,
+            ocr_service,
+            SQLAlchemyStudentRepository(session),
+            AnalysisCacheService(
+                container.analysis_memory_cache,
+                SQLAlchemyAnalysisCacheRepository(session),
+                settings.cache_ttl,
+            ),
+            image_preprocessor,
+            admission,
+            mode=settings.analyze_pipeline_mode,
+            freshness_seconds=settings.student_freshness_seconds,
+            # 일괄 처리는 결과를 모아서 저장하므로 워커 간 잠금 없이 프로세스 내에서만 합침
+            single_flight=container.single_flight,
+            session_factory=session_factory,
+        )
+
+    return BatchAnalysisService(
+        build_analysis_service,
+        session_factory,
+        max_parallel=settings.max_parallel_requests,
+        chunk_size=settings.batch_commit_size,
+        item_timeout=settings.request_timeout,
+    )
+
+
+@router.post("/student-card/analyze")
+async def analyze_student_card(
+    response: Response,
+    image: UploadFile = File(...),
+    analysis_service: StudentCardAnalysisService = Depends(get_analysis_service),
+    admission: AdmissionController = Depends(get_admission_controller),
+):
+    # 요청 하나가 동시에 붙잡는 버퍼 크기 집계 (컨테이너 메모리 산정용)
+    with memory_tracking() as memory:
+        try:
+            # 이미지 형식 검증
+            if not (image.content_type or "").startswith("image/"):
+                raise InvalidImageException(
+                    "Invalid file type. Please upload an image file."
+                )
+
+            # 바코드, OCR, DB 저장을 모두 포함하는 요청 처리 기한
+            async with request_deadline(settings.request_timeout):
+                with metrics.stage("upload_read"):
+                    contents = await read_upload(
+                        image,
+                        settings.max_upload_bytes,
+                        settings.upload_read_chunk_size,
+                    )
+                analysis = await analysis_service.analyze(contents)
 
-        # 동시 실행 후 결과 대기
-        barcode_data, student_info = await asyncio.gather(barcode_task, ocr_task)
+            response.headers["X-Request-Peak-Memory"] = str(memory.peak_bytes)
+            return {"status": "success", "data": analysis.response_data()}
 
-        if not barcode_data:
-            raise BarcodeProcessingException(
-                "Could not extract student number from barcode"
+        except ImageTooLargeException as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ServiceOverloadedException as e:
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(e.retry_after)},
             )
+        except OCRRetryableException as e:
+            # 재시도 후에도 LLM 호출이 일시적인 오류로 실패
+            raise HTTPException(
+                status_code=503,
+                detail=str(e),
+                headers={"Retry-After": str(max(1, round(e.retry_after or 1)))},
+            )
+        except UpstreamServiceException as e:
+            # 이미지가 아니라 LLM API 설정 문제 (인증, 권한, 모델 등)
+            logger.error(f"LLM API 가 요청을 거절함 ({e.status_code}): {str(e)}")
+            raise HTTPException(status_code=502, detail=str(e))
+        except TimeoutError:
+            admission.record_timeout()
+            raise HTTPException(
+                status_code=504,
+                detail=f"Processing did not finish within {settings.request_timeout}s",
+            )
+        except DomainException as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Internal server error while processing image: {str(e)}",
+            )
+        finally:
+            logger.info(f"요청 최대 버퍼 메모리 추정치: {memory.peak_bytes} bytes")
+
+
+@router.get("/student-card/admission")
+async def get_admission_stats(
+    admission: AdmissionController = Depends(get_admission_controller),
+):
+    """LLM 호출 동시 실행/대기열 상태와 누적 거절 수"""
+    return admission.snapshot()
 
-        # 학생 정보 생성 또는 업데이트
-        student = Student.create(
-            student_number=barcode_data,
-            department=student_info.department,
-            year=student_info.year,
-        )
 
-        # DB에 저장
-        await student_repository.save(student)
-
-        return {
-            "status": "success",
-            "data": {
-                "student_number": barcode_data,
-                "department": student_info.department,
-                "year": student_info.year,
-                "name": student_info.name,
-                "processed_at": datetime.utcnow().isoformat(),
-            },
-        }
-
-    except DomainException as e:
+@router.post("/student-card/analyze-batch")
+async def analyze_student_card_batch(
+    images: List[UploadFile] = File(...),
+    batch_service: BatchAnalysisService = Depends(get_batch_analysis_service),
+):
+    """여러 이미지(또는 zip)를 받아 이미지별 결과를 NDJSON 으로 끝나는 순서대로 스트리밍"""
+    staging = BatchUploadStaging(settings.max_upload_bytes)
+    try:
+        items = await staging.stage(images, settings.batch_max_images)
+    except (ValueError, zipfile.BadZipFile) as e:
+        staging.cleanup()
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Internal server error while processing image: {str(e)}",
-        )
+
+    async def stream_lines():
+        try:
+            async for line in batch_service.analyze(items):
+                yield json.dumps(line, ensure_ascii=False) + "\n"
+        finally:
+            staging.cleanup()
+
+    return StreamingResponse(
+        stream_lines(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(staging.cleanup),
+    )
@@ -0,0 +1,35 @@
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from src.domain.studentCard.exception.exceptions import ImageTooLargeException
+from src.infrastructure.common.memory import track_allocation
+
+
+async def read_upload(upload: UploadFile, max_bytes: int, chunk_size: int) -> memoryview:
+    """업로드 파일을 하나의 버퍼로 읽어 ``memoryview`` 로 반환
+
+    크기를 알 수 있으면 읽기 전에 제한을 확인하고 미리 할당한 버퍼에 ``readinto``
+    로 바로 채워 중간 복사본을 만들지 않습니다. 크기를 모르면 ``chunk_size`` 단위로
+    읽으면서 제한을 넘는 즉시 중단합니다.
+    """
+    if upload.size is not None:
+        if upload.size > max_bytes:
+            raise _too_large(max_bytes)
+        buffer = bytearray(upload.size)
+        await upload.seek(0)
+        read = await run_in_threadpool(upload.file.readinto, buffer)
+        track_allocation("upload", len(buffer))
+        return memoryview(buffer)[:read]
+
+    buffer = bytearray()
+    while chunk := await upload.read(chunk_size):
+        if len(buffer) + len(chunk) > max_bytes:
+            raise _too_large(max_bytes)
+        buffer += chunk
+    track_allocation("upload", len(buffer))
+    return memoryview(buffer)
+
+
+def _too_large(max_bytes: int) -> ImageTooLargeException:
+    return ImageTooLargeException(
+        f"Image file too large. Maximum size is {max_bytes} bytes."
+    )
@@ -1,30 +1,100 @@
+import time
+
+# import 시간 측정 시작 (time-to-ready 기준점)
+_import_started = time.perf_counter()
+
 import uvicorn
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from src.interfaces.api import job_routes, monitoring
+from src.interfaces.api.middleware import (
+    ServerTimingMiddleware,
+    UploadSizeLimitMiddleware,
+)
 from src.interfaces.api.routes import router
 from src.config import settings
-from src.infrastructure.studentCard.persistence.database import init_student_card_db
+from src.container import Container
+from src.infrastructure.common.persistence.database import engine, warm_up_connections
+from src.infrastructure.common.startup import StartupState
+import asyncio
 import logging
 
 # 로거 설정
 logger = logging.getLogger(__name__)
 
 
-def create_app() -> FastAPI:
-    app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG)
+async def warm_up(app: FastAPI, startup: StartupState) -> None:
+    """공유 컴포넌트 생성, DB 연결 풀과 CPU 풀 준비 (실패하면 주기적으로 재시도)
 
-    @app.on_event("startup")
-    async def startup_event():
-        """애플리케이션 시작 시 실행되는 이벤트 핸들러"""
+    스키마는 ``alembic upgrade head`` 로 미리 만들어 두며, 여기서는 테이블을
+    만들거나 지우지 않습니다.
+    """
+    while True:
+        startup.attempts += 1
         try:
-            logger.info("데이터베이스 초기화 시작")
-            await init_student_card_db()
-            logger.info("데이터베이스 초기화 완료")
+            if getattr(app.state, "container", None) is None:
+                with startup.step("container"):
+                    # OpenCV/langchain import 와 Chroma 초기화는 블로킹이므로 스레드에서
+                    app.state.container = await asyncio.to_thread(Container.create)
+            with startup.step("database"):
+                await warm_up_connections(settings.warmup_db_connections)
+            with startup.step("workers"):
+                await app.state.container.warm_up(settings.image_workers)
+            startup.mark_ready()
+            return
         except Exception as e:
-            logger.error(f"데이터베이스 초기화 실패: {str(e)}")
-            raise
+            logger.error(
+                f"warm-up 실패 ({startup.attempts}회차), "
+                f"{settings.warmup_retry_interval}초 후 재시도: {str(e)}"
+            )
+            startup.phase = "retrying"
+            await asyncio.sleep(settings.warmup_retry_interval)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """warm-up 을 백그라운드로 시작하고 종료 시 공유 리소스 정리
+
+    warm-up 이 끝날 때까지 분석 API 는 503 을, ``/ready`` 는 진행 상태를 반환합니다.
+    """
+    app.state.container = None
+    warm_up_task = asyncio.create_task(warm_up(app, app.state.startup))
+    try:
+        yield
+    finally:
+        warm_up_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await warm_up_task
+        if app.state.container is not None:
+            await app.state.container.aclose()
+        await engine.dispose()
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(title=settings.APP_NAME, debug=settings.DEBUG, lifespan=lifespan)
+    app.state.startup = StartupState(started_at=_import_started)
+    app.state.startup.mark_imported()
 
     # 라우터 등록
     app.include_router(router, prefix=settings.API_PREFIX)
+    if settings.async_jobs_enabled:
+        app.include_router(job_routes.router, prefix=settings.API_PREFIX)
+    app.include_router(monitoring.router)
+    if settings.metrics_enabled:
+        app.include_router(monitoring.metrics_router)
+        app.add_middleware(ServerTimingMiddleware)
+
+    # 업로드 크기 제한 (multipart 경계 등 오버헤드를 위해 64KB 여유)
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        limits={
+            f"{settings.API_PREFIX}/student-card/analyze": settings.max_upload_bytes
+            + 64 * 1024,
+            f"{settings.API_PREFIX}/student-card/analyze-batch": settings.max_batch_upload_bytes,
+            f"{settings.API_PREFIX}/student-card/jobs": settings.max_upload_bytes
+            + 64 * 1024,
+        },
+    )
 
     return app
 
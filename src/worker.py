@@ -0,0 +1,57 @@
+"""비동기 분석 작업 워커 프로세스
+
+``analysis_jobs`` 대기열에서 작업을 가져와 API 와 같은 분석 서비스로 처리합니다.
+API 프로세스와 별개로 필요한 만큼 띄울 수 있습니다.
+
+    python -m src.worker
+"""
+
+from src.config import settings
+from src.container import Container
+from src.domain.studentCard.service.analysis_job_service import AnalysisJobRunner
+from src.infrastructure.common.persistence.database import (
+    AsyncSessionLocal,
+    engine,
+    warm_up_connections,
+)
+import asyncio
+import logging
+import os
+import signal
+import socket
+
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+
+async def run_worker() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop.set)
+
+    # API 의 warm-up 과 같은 순서로 공유 컴포넌트 준비
+    container = await asyncio.to_thread(Container.create)
+    try:
+        await warm_up_connections(settings.warmup_db_connections)
+        await container.warm_up(settings.image_workers)
+
+        runner = AnalysisJobRunner(
+            container.analysis_service,
+            AsyncSessionLocal,
+            worker_id=f"{socket.gethostname()}:{os.getpid()}",
+            concurrency=settings.job_worker_concurrency,
+            poll_interval=settings.job_poll_interval,
+            lease_seconds=settings.job_lease_seconds,
+            max_attempts=settings.job_max_attempts,
+            job_timeout=settings.request_timeout,
+        )
+        await runner.run(stop)
+    finally:
+        await container.aclose()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(run_worker())
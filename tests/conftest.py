@@ -0,0 +1,107 @@
+import os
+import tempfile
+
+# src.config 는 import 시점에 환경 변수를 읽으므로 src 를 불러오기 전에 설정
+os.environ.setdefault(
+    "DATABASE_URL",
+    f"sqlite+aiosqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}",
+)
+os.environ.setdefault("OPENAI_API_KEY", "test-key")
+os.environ.setdefault("DEBUG", "false")
+
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from src.container import Container
+from src.infrastructure.common.admission import AdmissionController
+from src.infrastructure.common.persistence.database import Base, get_db
+from src.infrastructure.common.single_flight import SingleFlight
+from src.infrastructure.studentCard.external.image_preprocessor import (
+    ImagePreprocessor,
+)
+from src.interfaces.api.routes import get_session_factory
+from tests.fakes import FakeBarcodeReader, FakeOCRReader
+import pytest
+
+# 엔티티를 Base.metadata 에 등록
+import src.infrastructure.studentCard.persistence.database  # noqa: F401
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine():
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+
+@pytest.fixture
+async def session(session_factory):
+    async with session_factory() as session:
+        yield session
+
+
+@pytest.fixture
+def barcode_reader():
+    return FakeBarcodeReader("20231234")
+
+
+@pytest.fixture
+def ocr_reader():
+    return FakeOCRReader()
+
+
+@pytest.fixture
+def container(barcode_reader, ocr_reader, session_factory):
+    executor = ThreadPoolExecutor(max_workers=2)
+    container = Container(
+        ocr_reader=ocr_reader,
+        barcode_reader=barcode_reader,
+        image_preprocessor=ImagePreprocessor(executor=executor),
+        analysis_memory_cache=TTLCache(maxsize=128, ttl=3600),
+        cpu_executor=executor,
+        admission=AdmissionController(max_concurrent=2, max_queued=4),
+        single_flight=SingleFlight(),
+        session_factory=session_factory,
+    )
+    yield container
+    executor.shutdown(wait=True)
+
+
+@pytest.fixture
+def app(container, session_factory):
+    from src.main import create_app
+
+    app = create_app()
+    app.state.container = container
+    app.state.startup.mark_ready()
+
+    async def get_test_db():
+        async with session_factory() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = get_test_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    return app
+
+
+@pytest.fixture
+async def client(app):
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
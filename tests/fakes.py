@@ -0,0 +1,77 @@
+from typing import List, Optional
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.infrastructure.studentCard.external.interfaces import (
+    BarcodeReaderInterface,
+    GPTVisionReaderInterface,
+)
+import asyncio
+import numpy as np
+
+
+def make_image(seed: int = 0, size: int = 64, extension: str = ".png") -> bytes:
+    """seed 마다 내용(다이제스트)이 다른 작은 테스트 이미지"""
+    import cv2
+
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 256, (size, size, 3), dtype=np.uint8)
+    ok, encoded = cv2.imencode(extension, pixels)
+    assert ok
+    return encoded.tobytes()
+
+
+class FakeBarcodeReader(BarcodeReaderInterface):
+    """고정된 학번을 돌려주는 바코드 리더 (``None`` 이면 인식 실패)"""
+
+    def __init__(self, student_number: Optional[str] = None, delay: float = 0.0):
+        self.student_number = student_number
+        self.delay = delay
+        self.calls = 0
+
+    async def extract_barcode(self, image_bytes: bytes) -> str:
+        return await self._read()
+
+    async def extract_barcode_from_image(self, image: np.ndarray) -> str:
+        return await self._read()
+
+    async def _read(self) -> str:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.student_number
+
+
+class FakeOCRReader(GPTVisionReaderInterface):
+    """호출 횟수와 취소 여부를 기록하는 OCR 리더
+
+    ``errors`` 에 넣은 예외를 앞에서부터 하나씩 발생시킨 뒤 ``info`` 를 반환합니다.
+    """
+
+    def __init__(
+        self,
+        info: Optional[StudentCardInfo] = None,
+        delay: float = 0.0,
+        errors: Optional[List[Exception]] = None,
+        tier: str = "llm",
+    ):
+        self.info = info or StudentCardInfo(name="홍길동", department="컴퓨터공학과", year=2)
+        self.delay = delay
+        self.errors = list(errors or [])
+        self.tier = tier
+        self.calls = 0
+        self.cancelled = 0
+        self.started = asyncio.Event()
+
+    async def extract_info(
+        self, image_bytes: bytes, mime_type: str = "image/jpeg"
+    ) -> StudentCardInfo:
+        self.calls += 1
+        self.started.set()
+        try:
+            if self.delay:
+                await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.info.model_copy().mark_tier(self.tier)
@@ -0,0 +1,59 @@
+from src.config import settings
+from src.domain.studentCard.exception.exceptions import ServiceOverloadedException
+from src.infrastructure.common.admission import AdmissionController
+from tests.fakes import make_image
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def upload(seed: int = 1):
+    return {"image": ("card.png", make_image(seed), "image/png")}
+
+
+async def test_slots_queue_then_reject():
+    admission = AdmissionController(max_concurrent=1, max_queued=1)
+    release = asyncio.Event()
+
+    async def hold():
+        async with admission.slot():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    assert admission.in_flight == 1
+    assert admission.queue_depth == 1
+    with pytest.raises(ServiceOverloadedException) as error:
+        admission.ensure_capacity()
+    assert error.value.retry_after >= 1
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+    assert admission.snapshot()["admitted_total"] == 2
+    assert admission.rejected_total == 1
+
+
+async def test_analyze_returns_503_with_retry_after_when_full(client, container):
+    container.admission = AdmissionController(max_concurrent=1, max_queued=0)
+
+    async with container.admission.slot():
+        response = await client.post("/api/v1/student-card/analyze", files=upload())
+
+    assert response.status_code == 503
+    assert int(response.headers["Retry-After"]) >= 1
+    assert container.admission.rejected_total == 1
+
+
+async def test_analyze_returns_504_after_deadline(client, container, ocr_reader, monkeypatch):
+    monkeypatch.setattr(settings, "request_timeout", 0.2)
+    ocr_reader.delay = 5
+
+    response = await client.post("/api/v1/student-card/analyze", files=upload())
+
+    assert response.status_code == 504
+    assert container.admission.timeouts_total == 1
+    assert container.admission.in_flight == 0
+    assert ocr_reader.cancelled == 1
@@ -0,0 +1,82 @@
+from datetime import datetime, timedelta
+from cachetools import TTLCache
+from sqlalchemy import update
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.domain.studentCard.entity.analysis_cache import AnalysisCache
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+)
+from src.domain.studentCard.service.analysis_cache_service import AnalysisCacheService
+from src.infrastructure.common.digest import compute_image_digest
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+DIGEST = compute_image_digest(b"card")
+INFO = StudentCardInfo(
+    name="홍길동", department="컴퓨터공학과", year=2, student_number="20231234"
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_service(session, memory_cache=None, ttl=3600):
+    return AnalysisCacheService(
+        memory_cache if memory_cache is not None else TTLCache(maxsize=16, ttl=ttl),
+        SQLAlchemyAnalysisCacheRepository(session),
+        ttl,
+    )
+
+
+def test_digest_is_stable_for_bytes_and_memoryview():
+    assert compute_image_digest(b"card") == compute_image_digest(memoryview(b"card"))
+    assert len(DIGEST) == 64
+
+
+async def test_db_hit_is_promoted_to_memory(session):
+    await make_service(session).put(DIGEST, INFO)
+
+    # 다른 워커: 메모리 캐시는 비어 있고 DB 에서 찾음
+    memory_cache = TTLCache(maxsize=16, ttl=3600)
+    service = make_service(session, memory_cache)
+    cached = await service.get(DIGEST)
+
+    assert cached == INFO
+    assert DIGEST in memory_cache
+
+
+async def test_db_entry_older_than_ttl_is_ignored(session):
+    await make_service(session).put(DIGEST, INFO)
+    await session.execute(
+        update(AnalysisCache).values(
+            created_at=datetime.utcnow() - timedelta(seconds=120)
+        )
+    )
+    await session.commit()
+
+    assert await make_service(session, ttl=60).get(DIGEST) is None
+    assert await make_service(session, ttl=600).get(DIGEST) == INFO
+
+
+async def test_memory_entry_expires_after_ttl(session):
+    clock = FakeClock()
+    memory_cache = TTLCache(maxsize=16, ttl=60, timer=clock)
+    service = make_service(session, memory_cache, ttl=60)
+    await service.put(DIGEST, INFO)
+
+    assert DIGEST in memory_cache
+    clock.now = 61
+    assert DIGEST not in memory_cache
+
+
+async def test_incomplete_results_are_not_cached(session):
+    service = make_service(session)
+    await service.put(DIGEST, StudentCardInfo(name="홍길동", department="", year=0))
+
+    assert await service.get(DIGEST) is None
@@ -0,0 +1,205 @@
+from datetime import datetime
+from sqlalchemy import select
+from src.domain.studentCard.entity.analysis_job import (
+    JOB_FAILED,
+    JOB_QUEUED,
+    JOB_RUNNING,
+    JOB_SUCCEEDED,
+    AnalysisJob,
+)
+from src.domain.studentCard.exception.exceptions import (
+    InvalidImageException,
+    ServiceOverloadedException,
+    UpstreamServiceException,
+)
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisJobRepository,
+)
+from src.domain.studentCard.service.analysis_job_service import AnalysisJobRunner
+from tests.fakes import make_image
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def create_job(session_factory, job_id: str = "job-1") -> None:
+    async with session_factory() as session:
+        await SQLAlchemyAnalysisJobRepository(session).create(job_id, b"image", "image/png")
+
+
+async def claim(session_factory, worker_id: str, lease_seconds: float = 60, max_attempts: int = 3):
+    async with session_factory() as session:
+        return await SQLAlchemyAnalysisJobRepository(session).claim(
+            worker_id, 10, lease_seconds, max_attempts
+        )
+
+
+async def load(session_factory, job_id: str = "job-1") -> AnalysisJob:
+    async with session_factory() as session:
+        return (
+            await session.execute(select(AnalysisJob).where(AnalysisJob.id == job_id))
+        ).scalar_one()
+
+
+async def call(session_factory, method: str, *args, **kwargs):
+    async with session_factory() as session:
+        repository = SQLAlchemyAnalysisJobRepository(session)
+        return await getattr(repository, method)(*args, **kwargs)
+
+
+async def test_claim_leases_job_to_one_worker(session_factory):
+    await create_job(session_factory)
+
+    claimed = await claim(session_factory, "worker-a")
+    again = await claim(session_factory, "worker-b")
+
+    assert [(job.job_id, job.attempts, job.image) for job in claimed] == [("job-1", 1, b"image")]
+    assert again == []
+    job = await load(session_factory)
+    assert (job.status, job.worker_id) == (JOB_RUNNING, "worker-a")
+
+
+async def test_complete_by_owner_clears_image(session_factory):
+    await create_job(session_factory)
+    await claim(session_factory, "worker-a")
+
+    assert await call(session_factory, "complete", "job-1", "worker-a", {"ok": True})
+
+    job = await load(session_factory)
+    assert (job.status, job.result, job.image) == (JOB_SUCCEEDED, {"ok": True}, None)
+    assert job.finished_at is not None
+
+
+async def test_stale_worker_cannot_overwrite_reclaimed_job(session_factory):
+    await create_job(session_factory)
+    # 임대가 바로 만료되어 다른 워커가 다시 가져감
+    await claim(session_factory, "worker-a", lease_seconds=-1)
+    reclaimed = await claim(session_factory, "worker-b")
+
+    assert reclaimed[0].attempts == 2
+    assert not await call(session_factory, "fail", "job-1", "worker-a", "late", 500)
+    assert not await call(session_factory, "release", "job-1", "worker-a")
+    assert await call(session_factory, "complete", "job-1", "worker-b", {"ok": True})
+    job = await load(session_factory)
+    assert (job.status, job.worker_id) == (JOB_SUCCEEDED, "worker-b")
+
+
+async def test_expired_lease_at_max_attempts_is_failed(session_factory):
+    await create_job(session_factory)
+    await claim(session_factory, "worker-a", lease_seconds=-1, max_attempts=1)
+
+    claimed = await claim(session_factory, "worker-b", max_attempts=1)
+
+    assert claimed == []
+    job = await load(session_factory)
+    assert (job.status, job.error_status, job.image) == (JOB_FAILED, 500, None)
+
+
+async def test_release_with_delay_refunds_attempt_and_waits(session_factory):
+    await create_job(session_factory)
+    await claim(session_factory, "worker-a")
+
+    assert await call(
+        session_factory, "release", "job-1", "worker-a", delay_seconds=60, refund_attempt=True
+    )
+
+    job = await load(session_factory)
+    assert (job.status, job.attempts, job.worker_id) == (JOB_QUEUED, 0, None)
+    assert job.lease_expires_at > datetime.utcnow()
+    assert await claim(session_factory, "worker-b") == []
+
+
+async def test_release_without_delay_is_claimable_again(session_factory):
+    await create_job(session_factory)
+    await claim(session_factory, "worker-a")
+    await call(session_factory, "release", "job-1", "worker-a")
+
+    claimed = await claim(session_factory, "worker-b")
+
+    assert claimed[0].attempts == 2
+
+
+class RaisingService:
+    def __init__(self, error: Exception):
+        self.error = error
+
+    async def analyze(self, image_bytes, persist=True):
+        raise self.error
+
+
+def runner(session_factory, service_factory, max_attempts: int = 3):
+    return AnalysisJobRunner(
+        service_factory,
+        session_factory,
+        worker_id="worker-a",
+        concurrency=2,
+        poll_interval=30,
+        lease_seconds=60,
+        max_attempts=max_attempts,
+        job_timeout=5,
+    )
+
+
+async def test_overloaded_job_is_released_with_backoff(session_factory):
+    await create_job(session_factory)
+    job_runner = runner(
+        session_factory,
+        lambda session: RaisingService(ServiceOverloadedException("busy", retry_after=1)),
+    )
+
+    (job,) = await claim(session_factory, "worker-a")
+    await job_runner._process(job)
+
+    stored = await load(session_factory)
+    assert (stored.status, stored.attempts) == (JOB_QUEUED, 0)
+    assert stored.lease_expires_at > datetime.utcnow()
+
+
+async def test_invalid_image_fails_without_retry(session_factory):
+    await create_job(session_factory)
+    job_runner = runner(
+        session_factory, lambda session: RaisingService(InvalidImageException("bad"))
+    )
+
+    (job,) = await claim(session_factory, "worker-a")
+    await job_runner._process(job)
+
+    stored = await load(session_factory)
+    assert (stored.status, stored.error_status) == (JOB_FAILED, 400)
+
+
+async def test_upstream_rejection_fails_with_502_without_retry(session_factory):
+    await create_job(session_factory)
+    job_runner = runner(
+        session_factory,
+        lambda session: RaisingService(UpstreamServiceException("bad key", 401)),
+    )
+
+    (job,) = await claim(session_factory, "worker-a")
+    await job_runner._process(job)
+
+    stored = await load(session_factory)
+    assert (stored.status, stored.error_status, stored.attempts) == (JOB_FAILED, 502, 1)
+
+
+async def test_runner_processes_queued_job(session_factory, container):
+    async with session_factory() as session:
+        await SQLAlchemyAnalysisJobRepository(session).create(
+            "job-1", make_image(1), "image/png"
+        )
+    job_runner = runner(session_factory, container.analysis_service)
+    job_runner._poll_interval = 0.01
+    stop = asyncio.Event()
+    task = asyncio.create_task(job_runner.run(stop))
+
+    for _ in range(200):
+        if (await load(session_factory)).status == JOB_SUCCEEDED:
+            break
+        await asyncio.sleep(0.01)
+    stop.set()
+    await task
+
+    job = await load(session_factory)
+    assert job.status == JOB_SUCCEEDED
+    assert job.result["student_number"] == "20231234"
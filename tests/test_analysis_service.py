@@ -0,0 +1,106 @@
+from datetime import datetime, timedelta
+from cachetools import TTLCache
+from src.domain.studentCard.entity.student import Student
+from src.domain.studentCard.exception.exceptions import BarcodeProcessingException
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+    SQLAlchemyStudentRepository,
+)
+from src.domain.studentCard.service.analysis_cache_service import AnalysisCacheService
+from src.domain.studentCard.service.analysis_service import (
+    PIPELINE_BARCODE_FIRST,
+    PIPELINE_PARALLEL,
+    StudentCardAnalysisService,
+)
+from src.domain.studentCard.service.barcode_service import BarcodeService
+from src.domain.studentCard.service.ocr_service import OCRService
+from tests.fakes import make_image
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+STUDENT_NUMBER = "20231234"
+
+
+def build_service(container, session, mode=PIPELINE_PARALLEL, freshness_seconds=3600):
+    return StudentCardAnalysisService(
+        BarcodeService(container.barcode_reader),
+        OCRService(container.ocr_reader),
+        SQLAlchemyStudentRepository(session),
+        AnalysisCacheService(
+            TTLCache(maxsize=16, ttl=3600),
+            SQLAlchemyAnalysisCacheRepository(session),
+            3600,
+        ),
+        container.image_preprocessor,
+        container.admission,
+        mode=mode,
+        freshness_seconds=freshness_seconds,
+    )
+
+
+async def save_student(session, updated_at=None):
+    student = Student.create(STUDENT_NUMBER, "기계공학과", 3)
+    if updated_at is not None:
+        student.created_at = student.updated_at = updated_at
+    await SQLAlchemyStudentRepository(session).save(student)
+
+
+async def test_new_student_is_analyzed_and_saved(container, session, ocr_reader):
+    analysis = await build_service(container, session).analyze(make_image(1))
+
+    assert analysis.source == "llm"
+    assert analysis.student_number == STUDENT_NUMBER
+    assert ocr_reader.calls == 1
+    saved = await SQLAlchemyStudentRepository(session).find_by_student_number(
+        STUDENT_NUMBER
+    )
+    assert saved.department == "컴퓨터공학과"
+
+
+async def test_fresh_student_cancels_running_ocr(container, session, ocr_reader):
+    await save_student(session)
+    # OCR 호출이 시작된 뒤에 바코드 결과가 나오도록 지연
+    container.barcode_reader.delay = 0.1
+    ocr_reader.delay = 5
+
+    analysis = await build_service(container, session).analyze(make_image(1))
+
+    assert analysis.source == "db"
+    assert analysis.department == "기계공학과"
+    assert ocr_reader.calls == 1
+    assert ocr_reader.cancelled == 1
+
+
+async def test_barcode_first_skips_ocr_for_fresh_student(container, session, ocr_reader):
+    await save_student(session)
+
+    analysis = await build_service(
+        container, session, mode=PIPELINE_BARCODE_FIRST
+    ).analyze(make_image(1))
+
+    assert analysis.source == "db"
+    assert ocr_reader.calls == 0
+
+
+async def test_stale_student_is_analyzed_again(container, session, ocr_reader):
+    await save_student(session, updated_at=datetime.utcnow() - timedelta(hours=2))
+
+    analysis = await build_service(container, session).analyze(make_image(1))
+
+    assert analysis.source == "llm"
+    assert analysis.department == "컴퓨터공학과"
+    assert ocr_reader.calls == 1
+
+
+async def test_barcode_failure_cancels_ocr(container, session, ocr_reader):
+    container.barcode_reader.student_number = ""
+    container.barcode_reader.delay = 0.1
+    ocr_reader.delay = 5
+
+    with pytest.raises(BarcodeProcessingException):
+        await build_service(container, session).analyze(make_image(1))
+
+    assert ocr_reader.calls == 1
+    assert ocr_reader.cancelled == 1
+    assert container.admission.in_flight == 0
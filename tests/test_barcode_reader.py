@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+import pytest
+
+# pyzbar 는 시스템 libzbar 가 있어야 import 됨
+pytest.importorskip("pyzbar.pyzbar", exc_type=ImportError)
+
+from benchmarks.card_images import generate_cards, render_card
+from src.infrastructure.studentCard.external import barcode_reader
+from src.infrastructure.studentCard.external.barcode_reader import (
+    BarcodeReader,
+    scan_gray_image,
+    scan_image_bytes,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+def test_rendered_card_is_decoded_on_first_stage():
+    spec = generate_cards(1, 2048, 0.0, seed=1)[0]
+
+    result = scan_image_bytes(render_card(spec), 1024)
+
+    assert result.data == spec.student_number
+    assert result.strategy == "downscaled"
+    assert list(result.timings) == ["decode", "downscaled"]
+
+
+def test_undecodable_bytes_return_empty_result():
+    result = scan_image_bytes(b"not an image", 1024)
+
+    assert result.data == ""
+    assert list(result.timings) == ["decode"]
+
+
+def test_full_resolution_otsu_is_last_resort(monkeypatch):
+    gray = np.full((2000, 1000), 128, np.uint8)
+    seen = []
+
+    def fake_decode(image):
+        seen.append(image.shape)
+        # 원본 크기의 이진화 이미지에서만 인식되는 경우
+        if image.shape == gray.shape and set(np.unique(image)) <= {0, 255}:
+            return "20231234"
+        return ""
+
+    monkeypatch.setattr(barcode_reader, "_try_decode", fake_decode)
+    result = scan_gray_image(gray, 1024)
+
+    assert result.data == "20231234"
+    assert result.strategy == "full_resolution"
+    assert list(result.timings)[-1] == "full_resolution"
+    assert all(shape != gray.shape for shape in seen[:-1])
+
+
+def test_full_resolution_stage_skipped_when_not_downscaled(monkeypatch):
+    monkeypatch.setattr(barcode_reader, "_try_decode", lambda image: "")
+
+    result = scan_gray_image(np.full((600, 800), 128, np.uint8), 1024)
+
+    assert result.data == ""
+    assert "full_resolution" not in result.timings
+
+
+async def test_reader_scans_decoded_image_in_executor():
+    import cv2
+
+    spec = generate_cards(1, 1024, 0.0, seed=2)[0]
+    image = cv2.imdecode(np.frombuffer(render_card(spec), np.uint8), cv2.IMREAD_COLOR)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        reader = BarcodeReader(executor=executor)
+        assert await reader.extract_barcode_from_image(image) == spec.student_number
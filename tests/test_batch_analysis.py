@@ -0,0 +1,135 @@
+from cachetools import TTLCache
+from datetime import datetime, timedelta
+from src.domain.studentCard.dto.schemas import StudentCardAnalysis
+from src.domain.studentCard.entity.student import Student
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+    SQLAlchemyStudentRepository,
+)
+from src.domain.studentCard.service.analysis_cache_service import AnalysisCacheService
+from src.domain.studentCard.service.batch_analysis_service import (
+    BatchAnalysisService,
+    BatchItem,
+)
+from tests.fakes import make_image
+from tests.test_analysis_service import build_service
+import json
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def image_files(count: int):
+    return [
+        ("images", (f"card-{index}.png", make_image(index), "image/png"))
+        for index in range(count)
+    ]
+
+
+async def test_batch_upserts_duplicates_and_existing_students(client, session):
+    # 같은 학번의 기존 학생 (오래전에 갱신되어 다시 분석됨)
+    stale = Student.create("20231234", "기계공학과", 3)
+    stale.created_at = stale.updated_at = datetime.utcnow() - timedelta(days=30)
+    await SQLAlchemyStudentRepository(session).save(stale)
+
+    response = await client.post(
+        "/api/v1/student-card/analyze-batch", files=image_files(3)
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert response.status_code == 200
+    assert sorted(line["index"] for line in lines) == [0, 1, 2]
+    assert all(line["status"] == "success" for line in lines)
+    assert all(line["data"]["source"] == "llm" for line in lines)
+    saved = await SQLAlchemyStudentRepository(session).find_by_student_number(
+        "20231234"
+    )
+    assert saved.department == "컴퓨터공학과"
+    assert saved.year == 2
+
+
+async def test_non_image_upload_is_reported_per_item(client):
+    response = await client.post(
+        "/api/v1/student-card/analyze-batch",
+        files=image_files(1) + [("images", ("notes.txt", b"hello", "text/plain"))],
+    )
+
+    lines = {line["filename"]: line for line in map(json.loads, response.text.splitlines())}
+    assert lines["card-0.png"]["status"] == "success"
+    assert lines["notes.txt"]["status"] == "error"
+
+
+class FlakySaveService:
+    """``bad`` 학번이 포함된 저장만 실패하는 분석 서비스 (저장된 학번은 ``saved`` 에 기록)"""
+
+    def __init__(self, saved):
+        self.saved = saved
+
+    async def analyze(self, image_bytes, persist=True):
+        return StudentCardAnalysis(
+            student_number=image_bytes.decode(),
+            department="컴퓨터공학과",
+            year=1,
+            source="llm",
+        )
+
+    async def save_results(self, analyses):
+        if any(analysis.student_number == "bad" for analysis in analyses):
+            raise RuntimeError("constraint violation")
+        self.saved.extend(analysis.student_number for analysis in analyses)
+
+
+async def test_failed_chunk_is_retried_per_item(session_factory):
+    saved = []
+    numbers = ["20230001", "bad", "20230002"]
+    items = [
+        BatchItem(index=index, filename=f"{number}.png", load=_loader(number))
+        for index, number in enumerate(numbers)
+    ]
+    service = BatchAnalysisService(
+        lambda session: FlakySaveService(saved),
+        session_factory,
+        max_parallel=2, chunk_size=10, item_timeout=5
+    )
+
+    lines = [line async for line in service.analyze(items)]
+
+    persist_errors = [line for line in lines if line.get("stage") == "persist"]
+    assert [line["filename"] for line in persist_errors] == ["bad.png"]
+    assert sorted(saved) == ["20230001", "20230002"]
+
+
+class FailingCacheRepository(SQLAlchemyAnalysisCacheRepository):
+    async def upsert_many(self, entries):
+        raise RuntimeError("cache write failed")
+
+
+async def test_cache_write_failure_rolls_back_students(container, session_factory):
+    async with session_factory() as session:
+        service = build_service(container, session)
+        service._cache_service = AnalysisCacheService(
+            TTLCache(maxsize=16, ttl=3600), FailingCacheRepository(session), 3600
+        )
+        with pytest.raises(RuntimeError):
+            await service.save_results(
+                [
+                    StudentCardAnalysis(
+                        student_number="20230001",
+                        department="컴퓨터공학과",
+                        year=1,
+                        source="llm",
+                        image_digest="digest",
+                    )
+                ]
+            )
+
+    async with session_factory() as session:
+        repository = SQLAlchemyStudentRepository(session)
+        assert await repository.find_by_student_number("20230001") is None
+
+
+def _loader(number: str):
+    async def load():
+        return number.encode()
+
+    return load
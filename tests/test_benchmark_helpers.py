@@ -0,0 +1,54 @@
+from benchmarks import compare
+from benchmarks.card_images import code128_modules, generate_cards, render_card
+from benchmarks.results import percentile, save_results, summarize
+import cv2
+import json
+import math
+import numpy as np
+
+
+def test_percentile_interpolates_between_samples():
+    assert percentile([1, 2, 3, 4], 0.5) == 2.5
+    assert percentile([5], 0.99) == 5
+    assert math.isnan(percentile([], 0.5))
+
+
+def test_summarize_reports_milliseconds():
+    summary = summarize([0.001, 0.002, 0.003])
+
+    assert summary["count"] == 3
+    assert summary["p50_ms"] == 2.0
+    assert summary["max_ms"] == 3.0
+    assert summarize([]) == {"count": 0}
+
+
+def test_code128_symbols_have_eleven_modules():
+    modules = code128_modules("20231234")
+
+    # start + 4 (code set C) + checksum = 6 심볼, 정지 심볼은 13 모듈
+    assert sum(modules) == 6 * 11 + 13
+
+
+def test_generated_cards_are_reproducible():
+    first = generate_cards(2, 800, 5.0, seed=3)
+    second = generate_cards(2, 800, 5.0, seed=3)
+
+    assert [spec.student_number for spec in first] == [
+        spec.student_number for spec in second
+    ]
+    image = cv2.imdecode(np.frombuffer(render_card(first[0]), np.uint8), cv2.IMREAD_COLOR)
+    assert max(image.shape[:2]) == 800
+
+
+def test_compare_prints_percentile_change(tmp_path, capsys):
+    paths = []
+    for name, p50 in (("a", 10.0), ("b", 5.0)):
+        path = save_results(
+            str(tmp_path), name, {}, {"analyze": summarize([p50 / 1000])}
+        )
+        paths.append(path)
+    with open(paths[0], encoding="utf-8") as source:
+        assert json.load(source)["benchmark"] == "a"
+
+    assert compare.main(paths) == 0
+    assert "-50%" in capsys.readouterr().out
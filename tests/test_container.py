@@ -0,0 +1,37 @@
+from tests.fakes import make_image
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_requests_share_container_readers(client, container, ocr_reader):
+    first = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", make_image(1), "image/png")},
+    )
+    # 최근 저장된 학생이면 OCR 을 생략하므로 다른 학번으로 요청
+    container.barcode_reader.student_number = "20235678"
+    second = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", make_image(2), "image/png")},
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["data"]["source"] == "llm"
+    assert second.json()["data"]["source"] == "llm"
+    # 요청마다 리더를 새로 만들지 않고 컨테이너의 인스턴스를 재사용
+    assert ocr_reader.calls == 2
+    assert container.barcode_reader.calls == 2
+
+
+async def test_analyze_returns_503_until_ready(app, client):
+    app.state.startup.phase = "container"
+
+    response = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", make_image(1), "image/png")},
+    )
+
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
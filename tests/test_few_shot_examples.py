@@ -0,0 +1,90 @@
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.infrastructure.studentCard.external.few_shot_examples import (
+    FewShotExampleStore,
+)
+import json
+import pytest
+import uuid
+
+
+def info(department: str, year: int = 1) -> StudentCardInfo:
+    return StudentCardInfo(name="홍길동", department=department, year=year)
+
+
+def analysis_document(department: str, **metadata):
+    from langchain_core.documents import Document
+
+    return Document(
+        page_content=json.dumps(
+            {"analysis_result": info(department).model_dump()}, ensure_ascii=False
+        ),
+        metadata={"type": "student_card_analysis", "department": department, **metadata},
+    )
+
+
+@pytest.fixture
+def vectorstore():
+    from langchain_community.embeddings import FakeEmbeddings
+    from langchain_community.vectorstores import Chroma
+
+    return Chroma(
+        collection_name=f"test-{uuid.uuid4().hex}",
+        embedding_function=FakeEmbeddings(size=8),
+    )
+
+
+def test_keeps_latest_example_per_department():
+    store = FewShotExampleStore(max_examples=2)
+    store.add(info("컴퓨터공학과", 1))
+    store.add(info("기계공학과"))
+    store.add(info("컴퓨터공학과", 4))
+    store.add(info("경영학과"))
+
+    rendered = [json.loads(line)["analysis_result"] for line in store.render().splitlines()]
+    assert [(r["department"], r["year"]) for r in rendered] == [
+        ("경영학과", 1),
+        ("컴퓨터공학과", 4),
+    ]
+
+
+def test_incomplete_results_are_ignored():
+    store = FewShotExampleStore()
+    store.add(StudentCardInfo(name="", department="컴퓨터공학과", year=1))
+
+    assert len(store) == 0
+    assert store.render() == ""
+
+
+def test_seed_uses_most_recent_documents_by_timestamp(vectorstore):
+    vectorstore.add_documents(
+        [
+            analysis_document("경영학과", created_at=300.0),
+            analysis_document("간호학과"),  # 저장 시각이 없는 이전 문서
+            analysis_document("컴퓨터공학과", created_at=100.0),
+            analysis_document("기계공학과", created_at=200.0),
+        ]
+    )
+    vectorstore.add_documents(
+        [analysis_document("물리학과", created_at=400.0, type="other")]
+    )
+
+    store = FewShotExampleStore(max_examples=5)
+    store.load_from_vectorstore(vectorstore, limit=2)
+
+    departments = [
+        json.loads(line)["analysis_result"]["department"]
+        for line in store.render().splitlines()
+    ]
+    assert departments == ["경영학과", "기계공학과"]
+
+
+def test_seed_treats_documents_without_timestamp_as_oldest(vectorstore):
+    vectorstore.add_documents(
+        [analysis_document("간호학과"), analysis_document("경영학과", created_at=1.0)]
+    )
+
+    store = FewShotExampleStore(max_examples=5)
+    store.load_from_vectorstore(vectorstore, limit=1)
+
+    assert '"경영학과"' in store.render()
+    assert len(store) == 1
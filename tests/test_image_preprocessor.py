@@ -0,0 +1,74 @@
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import numpy as np
+import pytest
+from src.infrastructure.studentCard.external.image_preprocessor import (
+    ImagePreprocessor,
+    decode_image,
+    prepare_image,
+)
+from tests.fakes import make_image
+
+pytestmark = pytest.mark.anyio
+
+
+def test_prepare_downscales_and_reencodes():
+    image = np.zeros((1000, 2000, 3), np.uint8)
+
+    prepared = prepare_image(image, 1280, "webp", 80)
+
+    assert (prepared.width, prepared.height) == (1280, 640)
+    assert prepared.mime_type == "image/webp"
+    assert decode_image(prepared.data).shape == (640, 1280, 3)
+
+
+def test_prepare_rotates_to_requested_orientation():
+    image = np.zeros((400, 200, 3), np.uint8)
+
+    prepared = prepare_image(image, 1280, "jpeg", 85, orientation="landscape")
+
+    assert (prepared.width, prepared.height) == (400, 200)
+    assert prepared.mime_type == "image/jpeg"
+
+
+def test_undecodable_bytes_return_none():
+    assert decode_image(b"not an image") is None
+
+
+async def test_thread_mode_decodes_in_caller():
+    preprocessor = ImagePreprocessor(max_edge=32)
+
+    assert not preprocessor.decodes_in_worker
+    image = await preprocessor.decode(memoryview(make_image(1)))
+    prepared = await preprocessor.prepare(image, 0)
+    assert max(prepared.width, prepared.height) == 32
+
+
+async def test_process_mode_decodes_inside_worker():
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        preprocessor = ImagePreprocessor(executor=executor, max_edge=32)
+
+        assert preprocessor.decodes_in_worker
+        prepared = await preprocessor.prepare_encoded(memoryview(make_image(1)))
+        assert max(prepared.width, prepared.height) == 32
+        assert await preprocessor.prepare_encoded(b"not an image") is None
+
+
+async def test_pipeline_skips_parent_decode_in_process_mode(
+    container, session, ocr_reader, monkeypatch
+):
+    with ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        container.image_preprocessor = ImagePreprocessor(executor=executor)
+
+        async def fail_decode(image_bytes):
+            raise AssertionError("배열을 프로세스 밖으로 보내면 안 됨")
+
+        monkeypatch.setattr(container.image_preprocessor, "decode", fail_decode)
+        analysis = await container.analysis_service(session).analyze(make_image(1))
+
+    assert analysis.source == "llm"
+    assert ocr_reader.calls == 1
@@ -0,0 +1,93 @@
+from cachetools import TTLCache
+from src.domain.studentCard.dto.schemas import StudentCardInfo
+from src.domain.studentCard.repository.repositories import (
+    SQLAlchemyAnalysisCacheRepository,
+)
+from src.domain.studentCard.service.analysis_cache_service import AnalysisCacheService
+from src.infrastructure.common.metrics import MetricsRegistry, metrics
+from tests.fakes import make_image
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+def counter(name: str, registry: MetricsRegistry = metrics, **labels) -> float:
+    """렌더링된 지표에서 카운터 값 조회 (없으면 0)"""
+    label_text = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+    prefix = f"{name}{{{label_text}}} " if labels else f"{name} "
+    for line in registry.render().splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    return 0
+
+
+def lookups(tier: str, result: str) -> float:
+    return counter("student_card_cache_lookups_total", tier=tier, result=result)
+
+
+async def test_cache_lookups_count_memory_misses(session):
+    memory_cache = TTLCache(maxsize=16, ttl=3600)
+    service = AnalysisCacheService(
+        memory_cache, SQLAlchemyAnalysisCacheRepository(session), 3600
+    )
+    before = {
+        key: lookups(*key)
+        for key in (("memory", "hit"), ("memory", "miss"), ("db", "hit"), ("db", "miss"))
+    }
+    info = StudentCardInfo(
+        name="홍길동", department="컴퓨터공학과", year=2, student_number="20231234"
+    )
+
+    await service.get("a" * 64)  # memory miss, db miss
+    await service.put("b" * 64, info)
+    memory_cache.clear()
+    await service.get("b" * 64)  # memory miss, db hit
+    await service.get("b" * 64)  # memory hit
+
+    assert lookups("memory", "miss") - before[("memory", "miss")] == 2
+    assert lookups("memory", "hit") - before[("memory", "hit")] == 1
+    assert lookups("db", "hit") - before[("db", "hit")] == 1
+    assert lookups("db", "miss") - before[("db", "miss")] == 1
+
+
+def test_registry_renders_counters_and_histograms():
+    registry = MetricsRegistry()
+    registry.describe("jobs_total", "counter", "처리한 작업 수")
+    registry.increment("jobs_total", kind="a")
+    registry.increment("jobs_total", 2, kind="a")
+    registry.observe("latency_seconds", 0.2, buckets=(0.1, 1))
+
+    lines = registry.render().splitlines()
+
+    assert "# HELP jobs_total 처리한 작업 수" in lines
+    assert 'jobs_total{kind="a"} 3' in lines
+    assert 'latency_seconds_bucket{le="0.1"} 0' in lines
+    assert 'latency_seconds_bucket{le="1"} 1' in lines
+    assert "latency_seconds_count 1" in lines
+
+
+def test_disabled_registry_records_nothing():
+    registry = MetricsRegistry(enabled=False)
+    registry.increment("jobs_total")
+    with registry.stage("decode"):
+        pass
+
+    assert registry.render() == "\n"
+
+
+async def test_analyze_response_has_server_timing(client):
+    response = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", make_image(1), "image/png")},
+    )
+
+    stages = {part.split(";")[0] for part in response.headers["server-timing"].split(", ")}
+    assert {"upload_read", "decode", "barcode", "preprocess", "total"} <= stages
+
+
+async def test_metrics_endpoint_exposes_container_gauges(client):
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert "student_card_ready 1" in response.text
+    assert "student_card_llm_queue_depth 0" in response.text
@@ -0,0 +1,155 @@
+from src.domain.studentCard.exception.exceptions import (
+    OCRRetryableException,
+    UpstreamServiceException,
+)
+from src.infrastructure.common.deadline import request_deadline
+from src.infrastructure.common.retry import LatencyTracker, RetryBudget
+from src.infrastructure.studentCard.external.gpt_vision_reader import _to_ocr_exception
+from src.infrastructure.studentCard.external.resilient_card_reader import (
+    ResilientCardReader,
+)
+from tests.fakes import FakeOCRReader, make_image
+import asyncio
+import httpx
+import openai
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def status_error(error_class, status_code: int, headers=None):
+    response = httpx.Response(status_code, headers=headers, request=REQUEST)
+    return error_class("failed", response=response, body=None)
+
+
+def resilient(reader, budget=None, latency=None, max_attempts=3, **hedge):
+    return ResilientCardReader(
+        reader,
+        budget or RetryBudget(ratio=0.1, max_tokens=10),
+        latency or LatencyTracker(window=10, min_samples=1),
+        max_attempts=max_attempts,
+        base_delay=0.001,
+        max_delay=0.001,
+        **hedge,
+    )
+
+
+class SlowFirstReader(FakeOCRReader):
+    """첫 호출만 ``first_delay`` 만큼 걸리는 리더 (헤지 호출은 바로 응답)"""
+
+    def __init__(self, first_delay: float):
+        super().__init__()
+        self.first_delay = first_delay
+
+    async def extract_info(self, image_bytes, mime_type="image/jpeg"):
+        self.delay = self.first_delay if self.calls == 0 else 0.0
+        return await super().extract_info(image_bytes, mime_type)
+
+
+def test_retry_budget_caps_extra_calls():
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.try_withdraw()
+    assert budget.exhausted_total == 1
+
+
+async def test_retries_retryable_error_then_succeeds():
+    reader = FakeOCRReader(errors=[OCRRetryableException("timeout", "timeout")])
+
+    info = await resilient(reader).extract_info(make_image(1))
+
+    assert info.name == "홍길동"
+    assert reader.calls == 2
+
+
+async def test_does_not_retry_without_budget():
+    reader = FakeOCRReader(errors=[OCRRetryableException("timeout", "timeout")])
+
+    with pytest.raises(OCRRetryableException):
+        await resilient(reader, budget=RetryBudget(ratio=0, max_tokens=0)).extract_info(
+            make_image(1)
+        )
+    assert reader.calls == 1
+
+
+async def test_skips_retry_that_cannot_finish_before_deadline():
+    reader = FakeOCRReader(
+        errors=[OCRRetryableException("rate limited", "rate_limit", retry_after=5)]
+    )
+
+    with pytest.raises(OCRRetryableException):
+        async with request_deadline(1):
+            await resilient(reader).extract_info(make_image(1))
+    assert reader.calls == 1
+
+
+async def test_does_not_retry_upstream_error():
+    reader = FakeOCRReader(errors=[UpstreamServiceException("bad key", 401)])
+
+    with pytest.raises(UpstreamServiceException):
+        await resilient(reader).extract_info(make_image(1))
+    assert reader.calls == 1
+
+
+async def test_hedge_wins_and_cancels_slow_call():
+    latency = LatencyTracker(window=10, min_samples=1)
+    latency.record(0.01)
+    reader = SlowFirstReader(first_delay=5)
+
+    info = await resilient(reader, latency=latency, hedge_enabled=True).extract_info(
+        make_image(1)
+    )
+    await asyncio.sleep(0)
+
+    assert info.name == "홍길동"
+    assert reader.calls == 2
+    assert reader.cancelled == 1
+
+
+@pytest.mark.parametrize(
+    "error, reason",
+    [
+        (openai.APITimeoutError(request=REQUEST), "timeout"),
+        (openai.APIConnectionError(request=REQUEST), "connection"),
+        (status_error(openai.RateLimitError, 429, {"retry-after": "3"}), "rate_limit"),
+        (status_error(openai.InternalServerError, 500), "server_error"),
+    ],
+)
+def test_transient_api_errors_are_retryable(error, reason):
+    converted = _to_ocr_exception(error)
+
+    assert isinstance(converted, OCRRetryableException)
+    assert converted.reason == reason
+
+
+@pytest.mark.parametrize(
+    "error_class, status_code",
+    [
+        (openai.BadRequestError, 400),
+        (openai.AuthenticationError, 401),
+        (openai.PermissionDeniedError, 403),
+        (openai.NotFoundError, 404),
+    ],
+)
+def test_rejected_api_requests_are_upstream_errors(error_class, status_code):
+    converted = _to_ocr_exception(status_error(error_class, status_code))
+
+    assert isinstance(converted, UpstreamServiceException)
+    assert converted.status_code == status_code
+
+
+async def test_analyze_returns_502_when_llm_rejects_request(client, ocr_reader):
+    ocr_reader.errors.append(UpstreamServiceException("GPT API rejected the request", 401))
+
+    response = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", make_image(1), "image/png")},
+    )
+
+    assert response.status_code == 502
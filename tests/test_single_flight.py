@@ -0,0 +1,181 @@
+from sqlalchemy.ext.asyncio import create_async_engine
+from src.domain.studentCard.repository.repositories import SQLAlchemyStudentRepository
+from src.infrastructure.common.persistence.database import Base
+from src.infrastructure.common.single_flight import SingleFlight
+from src.infrastructure.studentCard.persistence.digest_lock import DatabaseDigestLock
+from tests.fakes import make_image
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    # 취소된 요청이 세션을 닫으면 연결이 폐기되므로 연결 하나를 공유하는 메모리 DB 대신 파일 DB 사용
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    results = await asyncio.gather(*(flight.run("key", work) for _ in range(3)))
+
+    assert [result for result, _ in results] == ["result"] * 3
+    assert [leader for _, leader in results] == [True, False, False]
+    assert len(calls) == 1
+    assert flight.in_flight == 0
+
+
+async def test_follower_gets_result_when_leader_is_cancelled():
+    flight = SingleFlight()
+    release = asyncio.Event()
+
+    async def work():
+        await release.wait()
+        return "result"
+
+    leader = asyncio.create_task(flight.run("key", work))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(flight.run("key", work))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    release.set()
+
+    assert await follower == ("result", False)
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_work_is_cancelled_when_every_waiter_times_out():
+    flight = SingleFlight()
+    cancelled = []
+
+    async def work():
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(1)
+            raise
+        return "result"
+
+    async def wait(timeout):
+        async with asyncio.timeout(timeout):
+            return await flight.run("key", work)
+
+    results = await asyncio.gather(wait(0.05), wait(0.1), return_exceptions=True)
+
+    assert all(isinstance(result, TimeoutError) for result in results)
+    assert cancelled == [1]
+    assert flight.in_flight == 0
+
+
+async def test_new_caller_after_abandon_starts_fresh_work():
+    flight = SingleFlight()
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.05 if len(calls) > 1 else 5)
+        return len(calls)
+
+    with pytest.raises(TimeoutError):
+        async with asyncio.timeout(0.01):
+            await flight.run("key", work)
+
+    assert await flight.run("key", work) == (2, True)
+
+
+async def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def work():
+        await asyncio.sleep(0.01)
+        raise ValueError("bad image")
+
+    results = await asyncio.gather(
+        flight.run("key", work), flight.run("key", work), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.in_flight == 0
+
+
+async def test_same_image_is_analyzed_once(container, session_factory, ocr_reader):
+    ocr_reader.delay = 0.1
+    image = make_image(1)
+
+    async def analyze():
+        async with session_factory() as session:
+            return await container.analysis_service(session).analyze(image)
+
+    first, second = await asyncio.gather(analyze(), analyze())
+
+    assert ocr_reader.calls == 1
+    assert first.student_number == second.student_number
+    assert {first.source, second.source} == {"llm"}
+
+
+async def test_shared_analysis_outlives_leader_request(
+    container, session_factory, ocr_reader
+):
+    ocr_reader.delay = 0.1
+    image = make_image(1)
+
+    async def analyze():
+        async with session_factory() as session:
+            return await container.analysis_service(session).analyze(image)
+
+    leader = asyncio.create_task(analyze())
+    await ocr_reader.started.wait()
+    follower = asyncio.create_task(analyze())
+    (flight,) = container.single_flight._flights.values()
+    while flight.waiters < 2:
+        await asyncio.sleep(0.001)
+    leader.cancel()
+
+    analysis = await follower
+    assert analysis.source == "llm"
+    assert ocr_reader.cancelled == 0
+    async with session_factory() as session:
+        saved = await SQLAlchemyStudentRepository(session).find_by_student_number(
+            analysis.student_number
+        )
+    assert saved.department == "컴퓨터공학과"
+
+
+async def test_digest_lock_waits_for_holder(session_factory):
+    holder = DatabaseDigestLock(session_factory, ttl=5, poll_interval=0.01)
+    other = DatabaseDigestLock(session_factory, ttl=5, poll_interval=0.01)
+
+    assert await holder.acquire("digest")
+    waiter = asyncio.create_task(other.acquire("digest"))
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+
+    await holder.release("digest")
+    assert await waiter is False
+    # 잠금이 풀렸으므로 다음 요청은 바로 얻음
+    assert await other.acquire("digest")
+
+
+async def test_expired_digest_lock_is_taken_over(session_factory):
+    crashed = DatabaseDigestLock(session_factory, ttl=0.05, poll_interval=0.01)
+    other = DatabaseDigestLock(session_factory, ttl=0.05, poll_interval=0.01)
+
+    assert await crashed.acquire("digest")
+    await asyncio.sleep(0.1)
+
+    assert await other.acquire("digest")
+
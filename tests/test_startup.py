@@ -0,0 +1,69 @@
+from src.config import settings
+from src.infrastructure.common.startup import StartupState
+import pytest
+import time
+
+pytestmark = pytest.mark.anyio
+
+
+def test_step_records_duration_and_errors():
+    startup = StartupState(started_at=time.perf_counter())
+
+    with startup.step("database"):
+        pass
+    with pytest.raises(RuntimeError):
+        with startup.step("workers"):
+            raise RuntimeError("pool broken")
+
+    assert "database" in startup.steps
+    assert "workers" not in startup.steps
+    assert startup.last_error == "workers: pool broken"
+    assert not startup.ready
+
+    startup.mark_ready()
+    assert startup.ready
+    assert startup.snapshot()["last_error"] is None
+
+
+async def test_ready_reports_503_until_warm_up_finishes(app, client):
+    app.state.startup.phase = "database"
+
+    starting = await client.get("/ready")
+    app.state.startup.mark_ready()
+    ready = await client.get("/ready")
+
+    assert starting.status_code == 503
+    assert starting.json()["phase"] == "database"
+    assert "Retry-After" in starting.headers
+    assert ready.status_code == 200
+    assert (await client.get("/health")).status_code == 200
+
+
+async def test_warm_up_retries_until_container_is_created(container, monkeypatch):
+    from fastapi import FastAPI
+    import src.main as main
+
+    attempts = []
+
+    def create():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("vector db unavailable")
+        return container
+
+    async def warm_up_connections(connections):
+        pass
+
+    monkeypatch.setattr(main.Container, "create", staticmethod(create))
+    monkeypatch.setattr(main, "warm_up_connections", warm_up_connections)
+    monkeypatch.setattr(settings, "warmup_retry_interval", 0.01)
+    app = FastAPI()
+    app.state.container = None
+    startup = StartupState(started_at=time.perf_counter())
+
+    await main.warm_up(app, startup)
+
+    assert startup.ready
+    assert startup.attempts == 2
+    assert app.state.container is container
+    assert set(startup.steps) == {"container", "database", "workers"}
@@ -0,0 +1,65 @@
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from src.domain.studentCard.entity.student import Student
+from src.domain.studentCard.entity.student_card import StudentCard
+from src.domain.studentCard.repository.repositories import SQLAlchemyStudentRepository
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def count_rows(session) -> int:
+    return (await session.execute(select(func.count()).select_from(StudentCard))).scalar()
+
+
+async def test_save_updates_existing_student(session):
+    repository = SQLAlchemyStudentRepository(session)
+    created = await repository.save(Student.create("20231234", "기계공학과", 1))
+
+    later = datetime.utcnow() + timedelta(seconds=1)
+    updated = Student.create("20231234", "컴퓨터공학과", 2)
+    updated.updated_at = later
+    saved = await repository.save(updated)
+
+    assert saved.id == created.id
+    assert (saved.department, saved.year) == ("컴퓨터공학과", 2)
+    assert saved.created_at == created.created_at
+    assert saved.updated_at == later
+    assert await count_rows(session) == 1
+
+
+async def test_blank_result_does_not_overwrite_stored_fields(session):
+    repository = SQLAlchemyStudentRepository(session)
+    await repository.save(Student.create("20231234", "기계공학과", 3))
+
+    saved = await repository.save(Student.create("20231234", "", 0))
+    await repository.save_many([Student.create("20231234", "", 0)])
+
+    stored = await repository.find_by_student_number("20231234")
+    assert (saved.department, saved.year) == ("기계공학과", 3)
+    assert (stored.department, stored.year) == ("기계공학과", 3)
+
+
+async def test_save_many_keeps_last_duplicate_and_upserts_existing(session):
+    repository = SQLAlchemyStudentRepository(session)
+    await repository.save(Student.create("20230001", "기계공학과", 1))
+
+    await repository.save_many(
+        [
+            Student.create("20230001", "경영학과", 3),
+            Student.create("20230002", "간호학과", 1),
+            Student.create("20230002", "간호학과", 2),
+        ]
+    )
+
+    first = await repository.find_by_student_number("20230001")
+    second = await repository.find_by_student_number("20230002")
+    assert (first.department, first.year) == ("경영학과", 3)
+    assert second.year == 2
+    assert await count_rows(session) == 2
+
+
+async def test_save_many_with_no_students_is_noop(session):
+    await SQLAlchemyStudentRepository(session).save_many([])
+
+    assert await count_rows(session) == 0
@@ -0,0 +1,130 @@
+from concurrent.futures import ThreadPoolExecutor
+from src.infrastructure.common.metrics import metrics
+from src.infrastructure.studentCard.external import local_ocr_reader
+from src.infrastructure.studentCard.external.local_ocr_reader import (
+    LocalOCRReader,
+    parse_card_fields,
+)
+from src.infrastructure.studentCard.external.tiered_card_reader import TieredCardReader
+from tests.fakes import FakeOCRReader
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+LABELED_CARD = [
+    ("한국대학교", 0.99),
+    ("성명 홍길동", 0.95),
+    ("컴퓨터공학과", 0.93),
+    ("2학년", 0.97),
+]
+
+
+class FakeEasyOCR:
+    """``readtext`` 결과를 고정한 easyocr 대체 (위에서 아래 순서의 줄)"""
+
+    def __init__(self, lines):
+        self.lines = lines
+
+    def readtext(self, image_bytes, detail=1):
+        return [
+            ([(0, row * 10), (100, row * 10), (100, row * 10 + 8), (0, row * 10 + 8)], text, confidence)
+            for row, (text, confidence) in enumerate(self.lines)
+        ]
+
+
+def local_reader(lines, min_confidence=0.6):
+    executor = ThreadPoolExecutor(
+        max_workers=1,
+        initializer=lambda: setattr(local_ocr_reader._worker, "reader", FakeEasyOCR(lines)),
+    )
+    return LocalOCRReader(executor, workers=1, min_confidence=min_confidence)
+
+
+def escalations(reason: str) -> float:
+    prefix = f'student_card_ocr_escalations_total{{reason="{reason}"}} '
+    for line in metrics.render().splitlines():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    return 0
+
+
+def test_parse_label_and_value_on_same_line():
+    result = parse_card_fields(LABELED_CARD)
+
+    assert result.fields == {"name": "홍길동", "department": "컴퓨터공학과", "year": "2"}
+    assert result.unlabeled == set()
+    assert result.confidence == 0.93
+
+
+def test_parse_value_on_line_after_label():
+    result = parse_card_fields(
+        [("이름:", 0.9), ("김철수", 0.9), ("학과", 0.9), ("기계공학과", 0.9), ("학년", 0.9), ("3", 0.9)]
+    )
+
+    assert result.fields == {"name": "김철수", "department": "기계공학과", "year": "3"}
+
+
+def test_parse_marks_unlabeled_name_and_skips_card_words():
+    result = parse_card_fields([("학생증", 0.9), ("이영희", 0.9), ("경영학과 4학년", 0.9)])
+
+    assert result.fields["name"] == "이영희"
+    assert result.unlabeled == {"name"}
+    assert result.fields["year"] == "4"
+
+
+@pytest.mark.parametrize(
+    "lines, reason",
+    [
+        (LABELED_CARD, "accepted"),
+        (LABELED_CARD[:3], "missing"),
+        ([("성명 홍길동", 0.3)] + LABELED_CARD[2:], "confidence"),
+        ([("홍길동", 0.95)] + LABELED_CARD[2:], "validation"),
+    ],
+)
+async def test_local_reader_reasons(lines, reason):
+    reader = local_reader(lines)
+    try:
+        info, result_reason = await reader.read(b"image")
+    finally:
+        reader.close()
+
+    assert result_reason == reason
+    assert (info is not None) == (reason == "accepted")
+    if info is not None:
+        assert info.tier == "ocr"
+
+
+async def test_tiered_reader_uses_local_result_when_accepted():
+    fallback = FakeOCRReader()
+    reader = TieredCardReader(local_reader(LABELED_CARD), fallback)
+    try:
+        info = await reader.extract_info(b"image")
+    finally:
+        await reader.aclose()
+
+    assert (info.name, info.tier) == ("홍길동", "ocr")
+    assert fallback.calls == 0
+
+
+async def test_tiered_reader_escalates_unlabeled_name_to_llm():
+    fallback = FakeOCRReader()
+    reader = TieredCardReader(local_reader([("홍길동", 0.95)] + LABELED_CARD[2:]), fallback)
+    before = escalations("validation")
+    try:
+        info = await reader.extract_info(b"image")
+    finally:
+        await reader.aclose()
+
+    assert info.tier == "llm"
+    assert fallback.calls == 1
+    assert escalations("validation") == before + 1
+
+
+async def test_tiered_reader_without_local_model_uses_llm():
+    fallback = FakeOCRReader()
+    before = escalations("unavailable")
+
+    info = await TieredCardReader(None, fallback).extract_info(b"image")
+
+    assert info.tier == "llm"
+    assert escalations("unavailable") == before + 1
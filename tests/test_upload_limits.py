@@ -0,0 +1,77 @@
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from io import BytesIO
+from starlette.datastructures import UploadFile
+from src.config import settings
+from src.domain.studentCard.exception.exceptions import ImageTooLargeException
+from src.interfaces.api.middleware import UploadSizeLimitMiddleware
+from src.interfaces.api.upload_reader import read_upload
+from tests.fakes import make_image
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+LIMIT = 16
+
+
+def upload_file(data: bytes, known_size: bool) -> UploadFile:
+    return UploadFile(BytesIO(data), size=len(data) if known_size else None)
+
+
+@pytest.mark.parametrize("known_size", [True, False])
+async def test_read_upload_accepts_exactly_the_limit(known_size):
+    contents = await read_upload(upload_file(b"x" * LIMIT, known_size), LIMIT, 4)
+
+    assert bytes(contents) == b"x" * LIMIT
+
+
+@pytest.mark.parametrize("known_size", [True, False])
+async def test_read_upload_rejects_one_byte_over(known_size):
+    with pytest.raises(ImageTooLargeException):
+        await read_upload(upload_file(b"x" * (LIMIT + 1), known_size), LIMIT, 4)
+
+
+async def test_analyze_returns_413_over_max_upload_bytes(client, monkeypatch, ocr_reader):
+    image = make_image(1)
+    monkeypatch.setattr(settings, "max_upload_bytes", len(image) - 1)
+
+    response = await client.post(
+        "/api/v1/student-card/analyze",
+        files={"image": ("card.png", image, "image/png")},
+    )
+
+    assert response.status_code == 413
+    assert ocr_reader.calls == 0
+
+
+@pytest.fixture
+async def limited_client():
+    app = FastAPI()
+
+    @app.post("/upload")
+    async def upload(request: Request):
+        return {"size": len(await request.body())}
+
+    app.add_middleware(UploadSizeLimitMiddleware, limits={"/upload": LIMIT})
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        yield client
+
+
+async def test_middleware_rejects_content_length_over_limit(limited_client):
+    at_limit = await limited_client.post("/upload", content=b"x" * LIMIT)
+    over_limit = await limited_client.post("/upload", content=b"x" * (LIMIT + 1))
+
+    assert at_limit.json() == {"size": LIMIT}
+    assert over_limit.status_code == 413
+
+
+async def test_middleware_stops_chunked_body_over_limit(limited_client):
+    async def chunks():
+        for _ in range(4):
+            yield b"x" * 8
+
+    response = await limited_client.post("/upload", content=chunks())
+
+    assert response.status_code == 413
@@ -0,0 +1,82 @@
+from langchain_core.documents import Document
+from src.infrastructure.studentCard.external.vectorstore_writer import (
+    DROP_NEWEST,
+    DROP_OLDEST,
+    VectorStoreWriter,
+)
+import asyncio
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+class RecordingVectorStore:
+    def __init__(self, fail: bool = False):
+        self.batches = []
+        self.persisted = 0
+        self.fail = fail
+
+    def add_documents(self, documents):
+        if self.fail:
+            raise RuntimeError("disk full")
+        self.batches.append([document.page_content for document in documents])
+
+    def persist(self):
+        self.persisted += 1
+
+
+def documents(count: int):
+    return [Document(page_content=str(index)) for index in range(count)]
+
+
+async def test_full_batches_are_written_together():
+    store = RecordingVectorStore()
+    writer = VectorStoreWriter(store, batch_size=2, flush_interval=60)
+
+    for document in documents(5):
+        assert writer.submit(document)
+    await writer.stop()
+
+    assert store.batches == [["0", "1"], ["2", "3"], ["4"]]
+    assert writer.written_total == 5
+    assert store.persisted == 3
+
+
+async def test_partial_batch_is_flushed_after_interval():
+    store = RecordingVectorStore()
+    writer = VectorStoreWriter(store, batch_size=10, flush_interval=0.05)
+
+    writer.submit(Document(page_content="a"))
+    await asyncio.sleep(0.2)
+
+    assert store.batches == [["a"]]
+    await writer.stop()
+
+
+@pytest.mark.parametrize(
+    "policy, kept", [(DROP_OLDEST, ["1", "2"]), (DROP_NEWEST, ["0", "1"])]
+)
+async def test_overflow_policy(policy, kept):
+    store = RecordingVectorStore()
+    writer = VectorStoreWriter(
+        store, max_queue=2, batch_size=10, flush_interval=60, overflow_policy=policy
+    )
+
+    # 백그라운드 작업이 큐를 비우기 전에 연달아 넣음
+    results = [writer.submit(document) for document in documents(3)]
+    await writer.stop()
+
+    assert results == [True, True, policy == DROP_OLDEST]
+    assert store.batches == [kept]
+    assert writer.dropped_total == 1
+
+
+async def test_write_failure_is_counted_and_submit_after_stop_is_dropped():
+    writer = VectorStoreWriter(RecordingVectorStore(fail=True), flush_interval=60)
+
+    writer.submit(Document(page_content="a"))
+    await writer.stop()
+
+    assert writer.failed_total == 1
+    assert writer.submit(Document(page_content="b")) is False
+    assert writer.dropped_total == 1